@@ -2,4 +2,6 @@
 
 Modules:
     console_controller
+    pacer
+    table_server
 """
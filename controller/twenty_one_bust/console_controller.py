@@ -4,6 +4,12 @@ Classes:
 
     ConsoleController
 
+Functions:
+
+    inflect_engine() -> inflect.engine
+
+    ordinal(number) -> str
+
 Typical usage examples:
 
     controller = ConsoleController()
@@ -11,26 +17,79 @@ Typical usage examples:
     controller.run()
 """
 
-from time import sleep
-
-import inflect
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Union
 
+from controller.twenty_one_bust.pacer import Pacer
+from model.card_game.card import Card
 from model.twenty_one_bust.action_selector import ActionSelector
 from model.twenty_one_bust.game import Game
 from model.twenty_one_bust.game_state import GameState
 from model.twenty_one_bust.player import Player
 from model.twenty_one_bust.player_state import PlayerState
-from view.text_view.text_view import clear_screen, get_option
+from view.text_view.screen import Screen
+from view.text_view.terminal import Terminal
+from view.text_view.text_view import get_option
+
+if TYPE_CHECKING:
+    from model.twenty_one_bust.session_store import SessionStore
+
+# ordinals up to the number of cards in a deck are looked up, not inflected
+MAX_ORDINAL = 52
+
+_ordinals: list[str] = []
+
+
+@lru_cache(maxsize=None)
+def inflect_engine() -> Any:
+    """Get an inflect engine, shared by every caller.
+
+    inflect is imported and the engine built on first use, as both are slow.
+
+    Returns:
+        An inflect.engine instance.
+    """
+    import inflect
+
+    return inflect.engine()
+
+
+def ordinal(number: int) -> str:
+    """Get the ordinal of a number, such as "3rd" for 3.
+
+    The ordinals of 0 to MAX_ORDINAL are built once on first use then looked
+    up in a list.
+
+    Args:
+        number: A non negative integer.
+
+    Returns:
+        A string with the number followed by its ordinal suffix.
+    """
+    if not _ordinals:
+        engine = inflect_engine()
+        _ordinals.extend(
+            engine.ordinal(index) for index in range(MAX_ORDINAL + 1)
+        )
+    if number <= MAX_ORDINAL:
+        return _ordinals[number]
+    return inflect_engine().ordinal(number)
 
 
 class ConsoleController:
     """Controller for model.twenty_one_bust.game.Game and console.
 
-    Coordinates model and text view (print, input, get_option & clear_screen)
-    to run a game of 21 Bust for the user.
+    Coordinates model and text view (Terminal & get_option) to run a game of
+    21 Bust for the user.  By default the view is a Screen with a summary of
+    each player above the text of the current step.
 
     Attributes:
         game: A Game instance of our 21 Bust game.
+        pacer: A Pacer used to pause between the steps of the game.
+        terminal: A Terminal to write to and clear.
+        store: A SessionStore to record the result of each round in, or
+            None.
+        session_id: An integer id of this run's session in store, or None.
     """
 
     NAMES = [
@@ -49,9 +108,65 @@ class ConsoleController:
     MEDIUM_PAUSE = 3
     LONG_PAUSE = 5
 
-    def __init__(self):
-        """Initializes instance."""
+    def __init__(
+        self,
+        pacer: Union[Pacer, None] = None,
+        terminal: Union[Terminal, None] = None,
+        store: Union["SessionStore", None] = None,
+    ):
+        """Initializes instance.
+
+        Args:
+            pacer: A Pacer used to pause between the steps of the game, such
+                as Pacer.fast() for scripted runs.  Default of None pauses
+                for the full length of SHORT_PAUSE, MEDIUM_PAUSE and
+                LONG_PAUSE.
+            terminal: A Terminal to write to and clear.  Default of None uses
+                a Screen with status_lines as its header.
+            store: A SessionStore to record the result of each round in,
+                so win counts outlive the run.  Default of None does not
+                record results.
+        """
         self.game = Game("21 Bust")
+        self.pacer = pacer if pacer is not None else Pacer()
+        if terminal is None:
+            terminal = Screen(header=self.status_lines)
+        self.terminal = terminal
+        self.store = store
+        self.session_id: Union[int, None] = None
+
+    def status_lines(self) -> list[str]:
+        """Get a summary of each player for the top of the screen.
+
+        Returns:
+            A list of strings, a line for each player then a divider, or an
+                empty list before any players are added.
+        """
+        if not self.game.players:
+            return []
+
+        lines = [
+            "%-10s %2d cards  %-15s %d wins"
+            % (
+                player.name[:10],
+                player.hand.card_count(),
+                player.state,
+                player.win_count,
+            )
+            for player in self.game.players
+        ]
+        lines.append("-" * 40)
+        return lines
+
+    def pause(self, seconds: float):
+        """Show everything written so far then pause.
+
+        Args:
+            seconds: A float equal to the length of the pause before pacer
+                scales it.
+        """
+        self.terminal.flush()
+        self.pacer.pause(seconds)
 
     def run(self):
         """Enters main loop for the game of 21 Bust.
@@ -60,33 +175,60 @@ class ConsoleController:
         Then depending on their response, resets the game and repeats or
         prints each player's win count.
         """
-        clear_screen()
-        print("Welcome to our game of 21 Bust.")
-        sleep(self.SHORT_PAUSE)
+        self.terminal.clear()
+        self.terminal.print("Welcome to our game of 21 Bust.")
+        self.pause(self.SHORT_PAUSE)
 
         self.setup()
+        if self.store is not None:
+            self.session_id = self.store.start_session(self.game.name)
 
         continue_playing = True
         while continue_playing:
             self.play_game()
 
             winners = self.resolve_game()
+            if self.store is not None and self.session_id is not None:
+                self.store.record_round(
+                    self.session_id, self.game.players, winners
+                )
 
-            play_again = get_option("Play again? (y or n): ", ["y", "n"])
+            play_again = get_option(
+                "Play again? (y or n): ", ["y", "n"], self.terminal
+            )
             continue_playing = play_again == "y"
             if continue_playing:
                 self.reset_game(winners)
             else:
-                clear_screen()
-                print("Thankyou for playing.")
-                sleep(self.SHORT_PAUSE)
+                self.terminal.clear()
+                self.terminal.print("Thankyou for playing.")
+                self.pause(self.SHORT_PAUSE)
                 sorted_players = sorted(
                     self.game.players,
                     reverse=True,
                     key=lambda player: player.win_count,
                 )
                 for player in sorted_players:
-                    print("%s won %d games." % (player.name, player.win_count))
+                    self.terminal.print(
+                        "%s won %d games." % (player.name, player.win_count)
+                    )
+                if self.store is not None:
+                    self.print_total_wins(self.store)
+                self.terminal.flush()
+
+    def print_total_wins(self, store: "SessionStore"):
+        """Display the games won by each player over every recorded session.
+
+        Args:
+            store: The SessionStore the results have been recorded in.
+        """
+        win_counts = store.win_counts()
+        self.terminal.print("Over every game played...")
+        for player in self.game.players:
+            self.terminal.print(
+                "%s has won %d games."
+                % (player.name, win_counts.get(player.name, 0))
+            )
 
     def setup(self):
         """Perform initial setup of game.
@@ -95,29 +237,34 @@ class ConsoleController:
         against.  Creates player instances for each of those and provides
         feedback.
         """
-        player_name = input("Enter your name: ")
+        player_name = self.terminal.input("Enter your name: ")
         app_player_count = int(
             get_option(
                 "Enter number of opponent players (0 to 7): ",
                 ["0", "1", "2", "3", "4", "5", "6", "7"],
+                self.terminal,
             )
         )
 
         user_player = Player(0, player_name)
         self.game.players.append(user_player)
         for i in range(0, app_player_count):
-            app_player = Player(i + 1, self.NAMES[i], ActionSelector())
+            app_player = Player(
+                i + 1, self.NAMES[i], ActionSelector(rng=self.game.rng)
+            )
             self.game.players.append(app_player)
 
-        print("Our players are...")
+        self.terminal.print("Our players are...")
         for player in self.game.players:
-            sleep(self.SHORT_PAUSE)
-            print(player.name)
+            self.pause(self.SHORT_PAUSE)
+            self.terminal.print(player.name)
 
         first_player = self.game.randomize_first_player()
-        print("%s has been selected to go first." % (first_player.name))
-        sleep(self.MEDIUM_PAUSE)
-        clear_screen()
+        self.terminal.print(
+            "%s has been selected to go first." % (first_player.name)
+        )
+        self.pause(self.MEDIUM_PAUSE)
+        self.terminal.clear()
 
     def play_game(self):
         """Plays the game.
@@ -125,10 +272,10 @@ class ConsoleController:
         Deals cards and loops through each player until each had completed
         their turn.
         """
-        print("Dealing.")
+        self.terminal.print("Dealing.")
         self.game.deal()
-        sleep(self.SHORT_PAUSE)
-        clear_screen()
+        self.pause(self.SHORT_PAUSE)
+        self.terminal.clear()
 
         while self.game.next_player() != GameState.RESOLVING_GAME:
             player = self.game.players[self.game.active_player_index]
@@ -143,7 +290,7 @@ class ConsoleController:
             player: The Player instance who's turn it is.
         """
         while self.game.state != GameState.GETTING_NEXT_PLAYER:
-            print("It is %s's turn." % (player.name))
+            self.terminal.print("It is %s's turn." % (player.name))
             self.game.start_turn(player)
 
             if player.user_controlled():
@@ -151,8 +298,8 @@ class ConsoleController:
             else:
                 self.app_player_action(player)
 
-            sleep(self.MEDIUM_PAUSE)
-            clear_screen()
+            self.pause(self.MEDIUM_PAUSE)
+            self.terminal.clear()
 
     def user_player_action(self, player: Player):
         """Process a user controlled player's action.
@@ -164,27 +311,31 @@ class ConsoleController:
             player: The Player instance who's turn it is.
         """
         # display player's hand
-        print(player.hand.description())
+        self.terminal.print(player.hand.description())
         for card in player.hand.cards:
-            print(card.description(True))
+            self.terminal.print(card.description(True))
 
         # get stick or twist option
-        option = get_option("Stick or Twist? (s or t): ", ["s", "t"])
+        option = get_option(
+            "Stick or Twist? (s or t): ", ["s", "t"], self.terminal
+        )
         sticking = option == "s"
 
         if sticking:
             # resolve stick action
-            print("%s sticks." % (player.name))
+            self.terminal.print("%s sticks." % (player.name))
             self.game.resolve_stick_action(player)
         else:
             # resolve twist action
-            print("%s twists." % (player.name))
+            self.terminal.print("%s twists." % (player.name))
             game_state, card = self.game.resolve_twist_action(player)
+            if isinstance(card, int):
+                card = Card.from_code(card)
 
             # feedback
-            print("And draws %s." % (card.description(True)))
+            self.terminal.print("And draws %s." % (card.description(True)))
             if player.state == PlayerState.BUST:
-                print("%s goes bust." % (player.name))
+                self.terminal.print("%s goes bust." % (player.name))
 
     def app_player_action(self, player: Player):
         """Process an app controlled player's action.
@@ -201,30 +352,27 @@ class ConsoleController:
             )
 
         # display count of cards in player's hand
-        print(player.hand.description())
+        self.terminal.print(player.hand.description())
 
         # get stick or twist option
         sticking = player.action_selector.should_stick(
-            player.best_total, self.game.game_stats
+            player.best_total, self.game.game_stats, player.soft
         )
 
         if sticking:
             # resolve stick action
-            print("%s sticks." % (player.name))
+            self.terminal.print("%s sticks." % (player.name))
             self.game.resolve_stick_action(player)
         else:
             # resolve twist action
-            print("%s twists." % (player.name))
+            self.terminal.print("%s twists." % (player.name))
             game_state, card = self.game.resolve_twist_action(player)
 
             # feedback
-            inflect_engine = inflect.engine()
-            nth_card_drawn = inflect_engine.ordinal(
-                str(len(player.hand.cards) - 2)
-            )
-            print("And draws %s card." % (nth_card_drawn))
+            nth_card_drawn = ordinal(player.hand.card_count() - 2)
+            self.terminal.print("And draws %s card." % (nth_card_drawn))
             if player.state == PlayerState.BUST:
-                print("%s goes bust." % (player.name))
+                self.terminal.print("%s goes bust." % (player.name))
 
     def resolve_game(self):
         """Provides feedback to user on the results of the game.
@@ -233,35 +381,35 @@ class ConsoleController:
         Displays the contents of each players hand and the total when
         sicking or if they went bust, then displays who won this game.
         """
-        print("Results.")
+        self.terminal.print("Results.")
 
         games_state, winners = self.game.resolve()
 
         for player in self.game.players:
-            print("%s reveals their cards..." % (player.name))
+            self.terminal.print("%s reveals their cards..." % (player.name))
             for card in player.hand.cards:
-                print(card.description(False))
+                self.terminal.print(card.description(False))
             if player.state == PlayerState.BUST:
-                print("Went bust.")
+                self.terminal.print("Went bust.")
             else:
-                print("Has a total of %d." % (player.best_total))
-            sleep(self.MEDIUM_PAUSE)
-            clear_screen()
+                self.terminal.print("Has a total of %d." % (player.best_total))
+            self.pause(self.MEDIUM_PAUSE)
+            self.terminal.clear()
 
         if len(winners) == 0:
-            print("No winners this round.")
+            self.terminal.print("No winners this round.")
         elif len(winners) == 1:
-            print("The winner of this round is...")
-            sleep(self.SHORT_PAUSE)
-            print(winners[0].name)
+            self.terminal.print("The winner of this round is...")
+            self.pause(self.SHORT_PAUSE)
+            self.terminal.print(winners[0].name)
         else:
-            print("The winners of this round are...")
+            self.terminal.print("The winners of this round are...")
             for player in winners:
-                sleep(self.SHORT_PAUSE)
-                print(player.name)
+                self.pause(self.SHORT_PAUSE)
+                self.terminal.print(player.name)
 
-        sleep(self.MEDIUM_PAUSE)
-        clear_screen()
+        self.pause(self.MEDIUM_PAUSE)
+        self.terminal.clear()
 
         return winners
 
@@ -274,12 +422,12 @@ class ConsoleController:
         Args:
             winners: A list of player instances who won the last game.
         """
-        print("Resetting game.")
+        self.terminal.print("Resetting game.")
         self.game.reset(winners)
-        print("Player order now is...")
+        self.terminal.print("Player order now is...")
         for player in self.game.players:
-            sleep(self.SHORT_PAUSE)
-            print(player.name)
+            self.pause(self.SHORT_PAUSE)
+            self.terminal.print(player.name)
 
-        sleep(self.LONG_PAUSE)
-        clear_screen()
+        self.pause(self.LONG_PAUSE)
+        self.terminal.clear()
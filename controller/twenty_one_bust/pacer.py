@@ -0,0 +1,94 @@
+"""Contains classes for pausing between the steps of a game of 21 Bust.
+
+Controllers pause so a user can follow what is happening.  Passing a Pacer
+lets the length of every pause be scaled, or removed altogether for
+scripted runs, without changing the controller.
+
+An AsyncPacer lets the pauses of many games overlap on one event loop, as
+in a TableServer.  ConsoleController plays one game for one user and
+blocks on input at every user turn, so it has no other work to overlap
+a pause with and uses the blocking pause of any Pacer.
+
+Classes:
+
+    Pacer
+
+    AsyncPacer
+
+Typical usage examples:
+
+    pacer = Pacer(scale=0.5)
+
+    pacer.pause(3)
+
+    controller = ConsoleController(Pacer.fast())
+
+    await AsyncPacer(scale=0.1).pause_async(3)
+"""
+
+import time
+
+
+class Pacer:
+    """Pauses by blocking the calling thread.
+
+    Attributes:
+        scale: A float each pause is multiplied by.  1.0 pauses for the time
+            asked for, 0.0 does not pause at all.
+    """
+
+    def __init__(self, scale: float = 1.0):
+        """Initializes instance.
+
+        Args:
+            scale: A float each pause is multiplied by.
+
+        Raises:
+            ValueError: If scale is negative.
+        """
+        if scale < 0:
+            raise ValueError("scale must not be negative")
+        self.scale = scale
+
+    @classmethod
+    def fast(cls) -> "Pacer":
+        """Create a Pacer that never pauses.
+
+        Returns:
+            A new Pacer with a scale of 0.0.
+        """
+        return cls(0.0)
+
+    def pause(self, seconds: float):
+        """Pause for a number of seconds multiplied by scale.
+
+        Returns at once when scale is 0.0.
+
+        Args:
+            seconds: A float equal to the length of the pause at a scale of
+                1.0.
+        """
+        if self.scale:
+            time.sleep(seconds * self.scale)
+
+
+class AsyncPacer(Pacer):
+    """Pauses by awaiting, so other tasks run during the pause.
+
+    pause still blocks, for use by synchronous controllers.
+    """
+
+    async def pause_async(self, seconds: float):
+        """Wait for a number of seconds multiplied by scale.
+
+        Always yields to the event loop once, even when scale is 0.0, so
+        other tasks are served between the steps of a game.
+
+        Args:
+            seconds: A float equal to the length of the pause at a scale of
+                1.0.
+        """
+        # imported here so synchronous controllers do not pay for asyncio
+        import asyncio
+
+        await asyncio.sleep(seconds * self.scale)
@@ -0,0 +1,720 @@
+"""MVC Controller classes serving many games of 21 Bust at once with asyncio.
+
+Each table is an asyncio task that steps a Game through its GameState
+machine.  App controlled players choose their action as soon as it is their
+turn, yielding to the event loop first so no table holds up the others.
+User controlled players connect over TCP and send one command per line,
+so thousands of tables and their players share one process.
+
+Commands sent by a client:
+
+    JOIN <table_id> <name>
+    STICK
+    TWIST
+    QUIT
+
+Messages sent to a client:
+
+    SEATED <table_id> <player_id>
+    DEAL
+    TURN <name>
+    HAND <best_total> <card_code> ...
+    STICK <name>
+    TWIST <name>
+    CARD <card_code>
+    BUST <name>
+    RESULT <name> <best_total or BUST>
+    WINNERS <name> ...
+    ERROR <message>
+
+Classes:
+
+    LatencyRecorder
+
+    Table
+
+    TableServer
+
+Functions:
+
+    benchmark(table_count, rounds, app_player_count, seed) -> dict
+
+Typical usage examples:
+
+    server = TableServer(table_count=1000, app_player_count=3)
+
+    asyncio.run(server.serve("127.0.0.1", 2121, metrics_path="21bust.prom"))
+
+    results = asyncio.run(benchmark(1000, 10))
+"""
+
+import asyncio
+import math
+import random
+from time import perf_counter
+from typing import Callable, Tuple, Union
+
+from controller.twenty_one_bust.pacer import AsyncPacer
+from model.card_game.array_deck import ArrayDeck
+from model.card_game.shoe import Shoe
+from model.card_game.suit import Suit
+from model.card_game.value import Value
+from model.twenty_one_bust.action_selector import ActionSelector
+from model.twenty_one_bust.game import Game
+from model.twenty_one_bust.game_state import GameState
+from model.twenty_one_bust.player import Player
+from model.twenty_one_bust.player_state import PlayerState
+from model.twenty_one_bust.session_store import SessionStore
+from model.twenty_one_bust.transition_metrics import (
+    TransitionMetrics,
+    write_prometheus,
+)
+
+Sender = Callable[[str], None]
+
+
+class LatencyRecorder:
+    """Records how long each player action took to resolve.
+
+    Keeps a uniform random sample of at most capacity actions, by
+    reservoir sampling, so memory stays bounded however long a server runs
+    and percentiles only ever sort capacity samples.  Percentiles are exact
+    until more than capacity actions are recorded.
+
+    Attributes:
+        capacity: An integer equal to the most samples kept.
+        count: An integer equal to the number of actions recorded.
+        samples: A list of floats, the seconds taken by a sample of the
+            actions.
+    """
+
+    def __init__(
+        self, capacity: int = 10000, rng: Union[random.Random, None] = None
+    ):
+        """Initializes instance.
+
+        Args:
+            capacity: An integer equal to the most samples kept.
+            rng: A random.Random used to choose which samples to keep.
+                Default of None creates one.
+        """
+        self.capacity = capacity
+        self.count = 0
+        self.samples: list[float] = []
+        self._rng = rng if rng is not None else random.Random()
+
+    def record(self, seconds: float):
+        """Add the time taken by one action.
+
+        Once capacity samples are kept, the new one replaces a random
+        sample with probability capacity / count.
+
+        Args:
+            seconds: A float equal to the seconds from the action being
+                ready until it was resolved.
+        """
+        self.count += 1
+        if len(self.samples) < self.capacity:
+            self.samples.append(seconds)
+        else:
+            index = self._rng.randrange(self.count)
+            if index < self.capacity:
+                self.samples[index] = seconds
+
+    def percentile(self, percent: float) -> float:
+        """Get the time taken by the given percentile of actions.
+
+        Args:
+            percent: A float from 0 to 100, such as 99 for the p99 latency.
+
+        Returns:
+            A float equal to the seconds within which percent of the actions
+                were resolved, 0.0 if there are no samples.
+        """
+        if not self.samples:
+            return 0.0
+        samples = sorted(self.samples)
+        index = max(math.ceil(percent / 100 * len(samples)) - 1, 0)
+        return samples[index]
+
+
+class Table:
+    """A table playing rounds of 21 Bust as an asyncio task.
+
+    Attributes:
+        table_id: An integer to uniquely identify this table.
+        game: The Game instance played at this table.
+        latency: A LatencyRecorder for the actions at this table.
+        action_timeout: A float equal to the seconds a user controlled player
+            has to choose an action before they stick.
+        pacer: An AsyncPacer used to pause before each app controlled
+            player's action.
+        max_players: An integer equal to the most players seated at once,
+            so a shuffled deck has CARDS_PER_PLAYER cards for each.
+        rounds_played: An integer equal to the number of rounds played.
+        senders: A dictionary mapping the id of each user controlled player
+            to a function sending them a message.
+        store: A SessionStore to record the result of each round in, or
+            None.
+        session_id: An integer id of this table's session in store, or None.
+    """
+
+    APP_PLAYER_PAUSE = 1
+
+    # cards kept in the shoe for each player at the start of a round
+    CARDS_PER_PLAYER = 8
+
+    def __init__(
+        self,
+        table_id: int,
+        game: Game,
+        latency: Union[LatencyRecorder, None] = None,
+        action_timeout: float = 30.0,
+        pacer: Union[AsyncPacer, None] = None,
+        store: Union[SessionStore, None] = None,
+    ):
+        """Initializes instance.
+
+        Args:
+            table_id: An integer to uniquely identify this table.
+            game: The Game to play, with its app controlled players added.
+            latency: A LatencyRecorder, which may be shared by many tables.
+                Default of None creates one for this table.
+            action_timeout: A float equal to the seconds a user controlled
+                player has to choose an action before they stick.
+            pacer: An AsyncPacer used to pause before each app controlled
+                player's action, letting other tables play meanwhile.
+                Default of None does not pause.
+            store: A SessionStore, which may be shared by many tables, to
+                record the result of each round in.  Default of None does
+                not record results.
+        """
+        self.table_id = table_id
+        self.game = game
+        self.latency = latency if latency is not None else LatencyRecorder()
+        self.action_timeout = action_timeout
+        self.pacer = pacer if pacer is not None else AsyncPacer(0.0)
+        deck = game.deck
+        card_count = (
+            len(deck.buffer)
+            if isinstance(deck, ArrayDeck)
+            else deck.card_count()
+        )
+        self.max_players = max(card_count // self.CARDS_PER_PLAYER, 1)
+        self.rounds_played = 0
+        self.senders: dict[int, Sender] = {}
+        self.store = store
+        self.session_id: Union[int, None] = None
+        if store is not None:
+            self.session_id = store.start_session(game.name)
+        self._actions: dict[int, asyncio.Queue[Tuple[bool, float]]] = {}
+        self._joining: list[Player] = []
+        self._leaving: list[Player] = []
+        self._seated = asyncio.Event()
+        self._next_id = max((p.id for p in game.players), default=-1) + 1
+
+    def seat_user(self, name: str, send: Sender) -> Player:
+        """Add a user controlled player, who plays from the next round.
+
+        Args:
+            name: A string for the player's name.
+            send: A function taking a string to send to the player.
+
+        Returns:
+            The new Player.
+
+        Raises:
+            ValueError: If max_players are already seated.
+        """
+        seated = len(self.game.players) + len(self._joining)
+        if seated - len(self._leaving) >= self.max_players:
+            raise ValueError("table is full")
+        player = Player(self._next_id, name)
+        self._next_id += 1
+        self.senders[player.id] = send
+        self._actions[player.id] = asyncio.Queue()
+        self._joining.append(player)
+        self._seated.set()
+        send("SEATED %d %d" % (self.table_id, player.id))
+        return player
+
+    def leave(self, player: Player):
+        """Remove a user controlled player at the end of this round.
+
+        If it is their turn they stick.
+
+        Args:
+            player: The Player leaving.
+        """
+        self.senders.pop(player.id, None)
+        if player in self._joining:
+            self._joining.remove(player)
+            del self._actions[player.id]
+        else:
+            self._leaving.append(player)
+            if self.is_waiting_for(player):
+                self._actions[player.id].put_nowait((False, perf_counter()))
+
+        if not self.senders:
+            self._seated.clear()
+
+    def is_waiting_for(self, player: Player) -> bool:
+        """Check if the game is waiting for a player to choose an action.
+
+        Args:
+            player: The Player to check.
+
+        Returns:
+            A boolean set to True if it is player's turn to stick or twist.
+        """
+        game = self.game
+        return (
+            game.state is GameState.WAITING_FOR_PLAYER
+            and game.players[game.active_player_index] is player
+        )
+
+    def request_action(self, player: Player, twist: bool):
+        """Pass on the action chosen by a user controlled player.
+
+        Args:
+            player: The Player choosing the action.
+            twist: A boolean set to True to twist and False to stick.
+        """
+        actions = self._actions.get(player.id)
+        if actions is None or not self.is_waiting_for(player):
+            self.send(player, "ERROR not your turn")
+        elif actions.empty():
+            actions.put_nowait((twist, perf_counter()))
+
+    def send(self, player: Player, message: str):
+        """Send a message to a user controlled player, if connected.
+
+        Args:
+            player: The Player to send to.
+            message: A string holding one line of the protocol.
+        """
+        send = self.senders.get(player.id)
+        if send is not None:
+            send(message)
+
+    def broadcast(self, message: str):
+        """Send a message to every connected user controlled player.
+
+        Args:
+            message: A string holding one line of the protocol.
+        """
+        for send in self.senders.values():
+            send(message)
+
+    async def run(
+        self, rounds: Union[int, None] = None, wait_for_users: bool = True
+    ):
+        """Play rounds of 21 Bust.
+
+        Args:
+            rounds: An integer equal to the number of rounds to play.
+                Default of None plays until the task is cancelled.
+            wait_for_users: A boolean set to True to only play while a user
+                controlled player is seated.
+        """
+        while rounds is None or self.rounds_played < rounds:
+            if wait_for_users:
+                await self._seated.wait()
+            await self.play_round()
+
+    async def play_round(self) -> list[Player]:
+        """Play one round of 21 Bust at this table.
+
+        Seats players who joined and removes players who left since the last
+        round, plays each player's turn, sends the results and resets the game.
+
+        Returns:
+            A list of the Player instances who won.
+        """
+        game = self.game
+        for player in self._leaving:
+            game.players.remove(player)
+            del self._actions[player.id]
+        self._leaving.clear()
+        game.players.extend(self._joining)
+        self._joining.clear()
+
+        deck = game.deck
+        if isinstance(deck, Shoe) and (
+            deck.card_count() < len(game.players) * self.CARDS_PER_PLAYER
+        ):
+            deck.reshuffle()
+        game.deal()
+        self.broadcast("DEAL")
+
+        while game.next_player() != GameState.RESOLVING_GAME:
+            player = game.players[game.active_player_index]
+            self.broadcast("TURN %s" % (player.name))
+            while game.state != GameState.GETTING_NEXT_PLAYER:
+                game.start_turn(player)
+                if player.user_controlled():
+                    await self.user_player_action(player)
+                else:
+                    await self.app_player_action(player)
+
+        game_state, winners = game.resolve()
+        if self.senders:
+            for player in game.players:
+                if player.state == PlayerState.BUST:
+                    self.broadcast("RESULT %s BUST" % (player.name))
+                else:
+                    self.broadcast(
+                        "RESULT %s %d" % (player.name, player.best_total)
+                    )
+            self.broadcast(
+                " ".join(["WINNERS"] + [player.name for player in winners])
+            )
+
+        if self.store is not None and self.session_id is not None:
+            self.store.record_round(self.session_id, game.players, winners)
+
+        game.reset(winners)
+        self.rounds_played += 1
+        return winners
+
+    async def user_player_action(self, player: Player):
+        """Wait for and resolve a user controlled player's action.
+
+        The player sticks if they have left or do not choose within
+        action_timeout.
+
+        Args:
+            player: The Player instance who's turn it is.
+        """
+        if player.id not in self.senders:
+            self.resolve_action(player, False)
+            return
+
+        codes = " ".join(str(code) for code in self.hand_codes(player))
+        self.send(player, "HAND %d %s" % (player.best_total, codes))
+
+        try:
+            twist, received = await asyncio.wait_for(
+                self._actions[player.id].get(), self.action_timeout
+            )
+        except asyncio.TimeoutError:
+            twist, received = False, perf_counter()
+
+        self.resolve_action(player, twist)
+        self.latency.record(perf_counter() - received)
+
+    async def app_player_action(self, player: Player):
+        """Resolve an app controlled player's action.
+
+        Waits on pacer first, which always yields to the event loop, so
+        other tables and connections are served between actions.
+
+        Args:
+            player: The Player instance who's turn it is.
+        """
+        ready = perf_counter()
+        await self.pacer.pause_async(self.APP_PLAYER_PAUSE)
+
+        sticking = player.action_selector.should_stick(  # type: ignore
+            player.best_total, self.game.game_stats, player.soft
+        )
+        self.resolve_action(player, not sticking)
+        self.latency.record(perf_counter() - ready)
+
+    def resolve_action(self, player: Player, twist: bool):
+        """Update the game with a player's action and send feedback.
+
+        A player who twists when the deck has run out of cards sticks
+        instead.
+
+        Args:
+            player: The Player instance who's turn it is.
+            twist: A boolean set to True to twist and False to stick.
+        """
+        if twist and self.game.deck.card_count() == 0:
+            self.send(player, "ERROR no cards left")
+            twist = False
+        if twist:
+            self.broadcast("TWIST %s" % (player.name))
+            game_state, card = self.game.resolve_twist_action(player)
+            code = card if isinstance(card, int) else card.code
+            self.send(player, "CARD %d" % (code))
+            if player.state == PlayerState.BUST:
+                self.broadcast("BUST %s" % (player.name))
+        else:
+            self.broadcast("STICK %s" % (player.name))
+            self.game.resolve_stick_action(player)
+
+    @staticmethod
+    def hand_codes(player: Player) -> list[int]:
+        """Get the integer card codes of the cards in a player's hand.
+
+        Args:
+            player: The Player whose hand to read.
+
+        Returns:
+            A list of integer card codes.
+        """
+        hand = player.hand
+        return hand.codes + [card.code for card in hand.cards]
+
+
+class TableServer:
+    """Hosts many tables of 21 Bust and the TCP connections of their users.
+
+    Every table starts with the same number of app controlled players and
+    plays while at least one user controlled player is seated.
+
+    Attributes:
+        tables: A list of Table instances, indexed by table_id.
+        latency: A LatencyRecorder shared by every table.
+        pacer: An AsyncPacer shared by every table, or None.
+        metrics: A TransitionMetrics timing the games of every table, or
+            None.
+        store: A SessionStore recording the rounds of every table, or None.
+        max_write_buffer: An integer equal to the most bytes waiting to be
+            sent to a connection before it is dropped as too slow.
+    """
+
+    def __init__(
+        self,
+        table_count: int = 1,
+        app_player_count: int = 3,
+        action_timeout: float = 30.0,
+        seed: Union[int, None] = None,
+        pacer: Union[AsyncPacer, None] = None,
+        metrics: Union[TransitionMetrics, None] = None,
+        store: Union[SessionStore, None] = None,
+        max_write_buffer: int = 65536,
+    ):
+        """Initializes instance.
+
+        Args:
+            table_count: An integer equal to the number of tables to host.
+            app_player_count: An integer equal to the number of app
+                controlled players at each table.
+            action_timeout: A float equal to the seconds a user controlled
+                player has to choose an action before they stick.
+            seed: An integer to seed each table's rng from, so games can be
+                repeated.  Default of None seeds from the operating system.
+            pacer: An AsyncPacer shared by every table to pause before each
+                app controlled player's action.  Default of None does not
+                pause.
+            metrics: A TransitionMetrics to time the state transitions of
+                every table's game.  Default of None does not time them.
+            store: A SessionStore to record the result of every round at
+                every table in, one session per table.  It should have
+                background set, so writing a batch does not pause every
+                table.  Default of None does not record results.
+            max_write_buffer: An integer equal to the most bytes waiting to
+                be sent to a connection before it is dropped, so a client
+                that stops reading can not use up memory.
+        """
+        self.latency = LatencyRecorder()
+        self.max_write_buffer = max_write_buffer
+        self.pacer = pacer
+        self.metrics = metrics
+        self.store = store
+        self.tables = [
+            self.create_table(table_id, app_player_count, action_timeout, seed)
+            for table_id in range(table_count)
+        ]
+
+    def create_table(
+        self,
+        table_id: int,
+        app_player_count: int,
+        action_timeout: float,
+        seed: Union[int, None],
+    ) -> Table:
+        """Create a table with its own Game, shoe and app players.
+
+        A Shoe of 6 decks is used as users can keep joining a table until
+        it has more players than one deck can deal to.
+
+        Args:
+            table_id: An integer to uniquely identify the table.
+            app_player_count: An integer equal to the number of app
+                controlled players.
+            action_timeout: A float equal to the seconds a user controlled
+                player has to choose an action.
+            seed: An integer to seed the table's rng from or None.
+
+        Returns:
+            A new Table.
+        """
+        if seed is None:
+            rng = random.Random()
+        else:
+            rng = random.Random("%d:%d" % (seed, table_id))
+        game = Game("Table %d" % (table_id), rng, Shoe("Shoe", Value, Suit))
+        for i in range(app_player_count):
+            game.players.append(
+                Player(i, "Bot%d" % (i + 1), ActionSelector(rng=rng))
+            )
+        if self.metrics is not None:
+            game.set_hook(self.metrics)
+        return Table(
+            table_id,
+            game,
+            self.latency,
+            action_timeout,
+            self.pacer,
+            self.store,
+        )
+
+    async def serve(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 2121,
+        metrics_path: Union[str, None] = None,
+        metrics_interval: float = 15.0,
+    ):
+        """Play every table and accept connections until cancelled.
+
+        Args:
+            host: A string with the address to listen on.
+            port: An integer with the TCP port to listen on.
+            metrics_path: A string for the path of a Prometheus text file
+                to write metrics to.  Default of None writes no file.
+            metrics_interval: A float equal to the seconds between writes of
+                the metrics file.
+        """
+        tasks = [asyncio.create_task(table.run()) for table in self.tables]
+        if metrics_path is not None:
+            tasks.append(
+                asyncio.create_task(
+                    self.export_metrics(metrics_path, metrics_interval)
+                )
+            )
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for task in tasks:
+                task.cancel()
+            if self.store is not None:
+                self.store.flush()
+
+    async def export_metrics(self, path: str, interval: float = 15.0):
+        """Write the transition metrics to a file every interval seconds.
+
+        Does nothing if this server has no metrics.
+
+        Args:
+            path: A string for the path of the Prometheus text file.
+            interval: A float equal to the seconds between writes.
+        """
+        if self.metrics is None:
+            return
+        while True:
+            write_prometheus(self.metrics, path)
+            await asyncio.sleep(interval)
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        """Read the commands of one connected user until they leave.
+
+        Tables send messages without waiting for them to be sent.  If more
+        than max_write_buffer bytes are waiting, the client is not keeping
+        up, so the connection is dropped and the user leaves their table.
+
+        Args:
+            reader: The StreamReader of the connection.
+            writer: The StreamWriter of the connection.
+        """
+
+        transport = writer.transport
+
+        def send(message: str):
+            if transport.is_closing():
+                return
+            writer.write(message.encode() + b"\n")
+            if transport.get_write_buffer_size() > self.max_write_buffer:
+                transport.abort()
+
+        table: Union[Table, None] = None
+        player: Union[Player, None] = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                command, _, argument = line.decode().strip().partition(" ")
+                command = command.upper()
+                if command == "QUIT":
+                    break
+                elif command == "JOIN" and player is None:
+                    table_id, _, name = argument.partition(" ")
+                    if not table_id.isdigit() or int(table_id) >= len(
+                        self.tables
+                    ):
+                        send("ERROR no such table")
+                        continue
+                    joining = self.tables[int(table_id)]
+                    try:
+                        player = joining.seat_user(name or "Player", send)
+                    except ValueError as error:
+                        send("ERROR %s" % (error))
+                        continue
+                    table = joining
+                elif command in ("STICK", "TWIST") and table and player:
+                    table.request_action(player, command == "TWIST")
+                else:
+                    send("ERROR unknown command")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            if table is not None and player is not None:
+                table.leave(player)
+            writer.close()
+
+
+async def benchmark(
+    table_count: int,
+    rounds: int,
+    app_player_count: int = 4,
+    seed: int = 0,
+    store: Union[SessionStore, None] = None,
+) -> dict[str, float]:
+    """Play rounds on many tables of app controlled players at once.
+
+    Every table runs in this process, so the results show how many tables
+    one core can serve and how long actions wait for the event loop.
+
+    Args:
+        table_count: An integer equal to the number of tables.
+        rounds: An integer equal to the number of rounds at each table.
+        app_player_count: An integer equal to the number of players at each
+            table.
+        seed: An integer to seed each table's rng from.
+        store: A SessionStore to record every round in, to include the cost
+            of recording results.  Default of None does not record them.
+
+    Returns:
+        A dictionary with the number of tables, rounds played, seconds
+            taken, rounds_per_second, actions and the p50 and p99 action
+            latency in seconds.
+    """
+    server = TableServer(table_count, app_player_count, seed=seed, store=store)
+    start = perf_counter()
+    await asyncio.gather(
+        *(table.run(rounds, wait_for_users=False) for table in server.tables)
+    )
+    if store is not None:
+        store.flush()
+    seconds = perf_counter() - start
+
+    return {
+        "tables": table_count,
+        "rounds": table_count * rounds,
+        "seconds": seconds,
+        "rounds_per_second": table_count * rounds / seconds,
+        "actions": server.latency.count,
+        "p50_latency": server.latency.percentile(50),
+        "p99_latency": server.latency.percentile(99),
+    }
@@ -1,10 +1,13 @@
 """Logic and data structures common to any card game.
 
 Modules:
+    array_deck
     card
     card_group
     deck
     player
+    rng
+    shoe
     suit
     value
 """
@@ -0,0 +1,187 @@
+"""Contains class for a deck of card codes held in a fixed array.
+
+Classes:
+
+    ArrayDeck
+
+Typical usage examples:
+
+    deck = ArrayDeck("Deck", Value, Suit)
+
+    deck.shuffle()
+
+    code = deck.draw()
+
+    deck.return_cards(players[0].hand)
+"""
+
+from array import array
+from random import shuffle
+from typing import Tuple, Type, Union
+
+from model.card_game.card_group import CardGroup
+from model.card_game.deck import Deck
+from model.card_game.player import Player
+from model.card_game.rng import RandomSource
+from model.card_game.suit import Suit
+from model.card_game.value import Value
+
+
+class ArrayDeck(Deck):
+    """Class to represent a deck of cards as integer card codes in an array.
+
+    Every card in the deck stays in buffer for the life of the deck.  The
+    cards from cursor to the end of buffer are still in the deck, draw
+    takes the card at cursor and moves cursor on.  Returned cards are written
+    back in front of cursor, so once every card is back a new round only
+    needs cursor rewound and the array shuffled in place, with no lists or
+    Card objects created.
+
+    Attributes:
+        name: A name describing this deck.
+        rng: A RandomSource used to shuffle the cards.  None to use the
+            random module.
+        compact: Always True, cards are dealt as integer card codes.
+        buffer: An array of unsigned bytes holding every card code.
+        cursor: An integer equal to the index in buffer of the next card to
+            be drawn.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        values: Type[Value],
+        suits: Type[Suit],
+        rng: Union[RandomSource, None] = None,
+    ):
+        """Initializes instance.
+
+        Adds one standard set of 52 cards to this deck.
+
+        Args:
+            name: A string for the deck's name.
+            values: Value enumeration of card values.
+            suits: Suit enumeration of card suits.
+            rng: A RandomSource used to shuffle the cards.  Default of None
+                uses the random module.
+        """
+        CardGroup.__init__(self, name, rng)
+        self.compact = True
+        self.buffer = array("B")
+        self.cursor = 0
+        self.add_deck(values, suits)
+
+    def add_deck(self, values: Type[Value], suits: Type[Suit]):
+        """Add deck of card codes.
+
+        Adds the card codes for one standard deck of cards to the end of this
+        deck.  Can be used multiple times for larger deck sizes.
+
+        Args:
+            values: An Enumeration of the card values in the deck.
+            suits: An Enumeration of the card suits in the deck.
+        """
+        suit_count = len(suits)
+        for value in values:
+            for suit in suits:
+                self.buffer.append(
+                    (value.value - 1) * suit_count + suit.value - 1
+                )
+
+    def card_count(self) -> int:
+        """Returns the number of cards left in this deck.
+
+        Returns:
+            An integer equal to the number of cards yet to be drawn.
+        """
+        return len(self.buffer) - self.cursor
+
+    def shuffle(self):
+        """Shuffles the cards left in this deck into a random order."""
+        random_shuffle = shuffle if self.rng is None else self.rng.shuffle
+        cursor = self.cursor
+        if cursor == 0:
+            random_shuffle(self.buffer)
+        else:
+            remaining = self.buffer[cursor:]
+            random_shuffle(remaining)
+            self.buffer[cursor:] = remaining
+
+    def draw(self) -> int:
+        """Take the next card code from this deck.
+
+        Returns:
+            An integer card code.
+
+        Raises:
+            IndexError: If there are no cards left in this deck.
+        """
+        code = self.buffer[self.cursor]
+        self.cursor += 1
+        return code
+
+    def snapshot(self) -> Tuple[bytes, int, int]:
+        """Record the order of the cards in this deck and its cursor.
+
+        Returns:
+            A tuple of buffer as bytes, cursor and 0 for the shuffle count,
+                which an ArrayDeck does not keep.
+        """
+        return bytes(self.buffer), self.cursor, 0
+
+    def restore(self, snapshot: Tuple[bytes, int, int]):
+        """Put buffer and cursor back as recorded by snapshot.
+
+        Args:
+            snapshot: A tuple returned by snapshot.
+        """
+        self.buffer = array("B", snapshot[0])
+        self.cursor = snapshot[1]
+
+    def deal(self, number_of_cards: int, players: list[Player]):
+        """Deal card codes from this Deck.
+
+        Draws cards one by one and adds them to the codes in each player's
+        hand until each hand has received number_of_cards.
+
+        Args:
+            number_of_cards: An integer equal to the number of cards each
+                Player's hand should receive.
+            players: A list of Players to receive the cards.
+        """
+        for card_count in range(0, number_of_cards):
+            for player in players:
+                player.hand.codes.append(self.draw())
+
+    def return_cards(self, card_group: CardGroup):
+        """Returns card codes to Deck.
+
+        Writes the codes in the CardGroup, and the codes of any Cards in it,
+        back in front of cursor then empties the CardGroup.
+
+        Args:
+            card_group: A CardGroup object to return the cards from.
+
+        Raises:
+            ValueError: If more cards are returned than have been drawn from
+                this deck, such as cards from another deck or a CardGroup
+                returned twice.  Nothing is changed.
+        """
+        codes = card_group.codes
+        count = len(codes) + len(card_group.cards)
+        if count > self.cursor:
+            raise ValueError(
+                "%d cards returned but only %d drawn" % (count, self.cursor)
+            )
+        if card_group.cards:
+            codes.extend(card.code for card in card_group.cards)
+            card_group.cards.clear()
+
+        if count == 0:
+            return
+
+        end = self.cursor
+        start = end - count
+        self.buffer[start:end] = array("B", codes)
+        self.cursor = start
+        codes.clear()
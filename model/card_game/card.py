@@ -1,19 +1,76 @@
-"""Contains class for a single card.
+"""Contains class for a single card and functions for compact card codes.
+
+A card can also be held as an integer code from 0 to 51, equal to
+(value - 1) * 4 + (suit - 1), which avoids creating a Card object.
 
 Classes:
 
     Card
 
+Functions:
+
+    card_code(value, suit) -> int
+
+    code_value(code) -> Value
+
+    code_suit(code) -> Suit
+
 Typical usage examples:
 
     card = Card(Value.ACE, Suit.SPADES, True)
 
     print(card)
+
+    code = card_code(Value.ACE, Suit.SPADES)
+
+    card = Card.from_code(code)
 """
 
 from model.card_game.suit import Suit
 from model.card_game.value import Value
 
+SUIT_COUNT = len(Suit)
+
+_CODE_VALUES = tuple(value for value in Value for suit in Suit)
+_CODE_SUITS = tuple(suit for value in Value for suit in Suit)
+
+
+def card_code(value: Value, suit: Suit) -> int:
+    """Get the integer code of a card.
+
+    Args:
+        value: A member from a Value enumeration.
+        suit: A member from a Suit enumeration.
+
+    Returns:
+        An integer from 0 to 51 for a standard deck.
+    """
+    return (value.value - 1) * SUIT_COUNT + suit.value - 1
+
+
+def code_value(code: int) -> Value:
+    """Get the Value of a card from its integer code.
+
+    Args:
+        code: An integer card code from card_code.
+
+    Returns:
+        A member from the Value enumeration.
+    """
+    return _CODE_VALUES[code]
+
+
+def code_suit(code: int) -> Suit:
+    """Get the Suit of a card from its integer code.
+
+    Args:
+        code: An integer card code from card_code.
+
+    Returns:
+        A member from the Suit enumeration.
+    """
+    return _CODE_SUITS[code]
+
 
 class Card:
     """Class to represent a playing card from a standard deck of cards.
@@ -24,6 +81,8 @@ class Card:
         face_up: A boolean set to True if the card is face up.
     """
 
+    __slots__ = ("value", "suit", "face_up")
+
     def __init__(self, value: Value, suit: Suit, face_up: bool = False):
         """Initializes instance.
 
@@ -37,6 +96,24 @@ class Card:
         self.suit = suit
         self.face_up = face_up
 
+    @classmethod
+    def from_code(cls, code: int, face_up: bool = False) -> "Card":
+        """Create a Card from its integer code.
+
+        Args:
+            code: An integer card code from card_code.
+            face_up: A boolean set to True when the card is face up.
+
+        Returns:
+            A new Card instance.
+        """
+        return cls(_CODE_VALUES[code], _CODE_SUITS[code], face_up)
+
+    @property
+    def code(self) -> int:
+        """The integer code of this Card."""
+        return card_code(self.value, self.suit)
+
     def __str__(self) -> str:
         """Return description of the Card, value & suit or face down card."""
         return self.description(False)
@@ -18,8 +18,10 @@ Typical usage examples:
 """
 
 from random import shuffle
+from typing import Union
 
 from model.card_game.card import Card
+from model.card_game.rng import RandomSource
 
 
 class CardGroup:
@@ -28,19 +30,29 @@ class CardGroup:
     The is a generic structure that could be the main deck that cards are
     dealt from, a player's hand or the discard pile.
 
+    Cards can be held as Card instances in cards or, when no Card objects are
+    needed, as integer card codes in codes.
+
     Attributes:
         name: A string describing this card group.
         cards: A list of Card instances.
+        codes: A list of integer card codes.
+        rng: A RandomSource used to shuffle the cards.  None to use the
+            random module.
     """
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, rng: Union[RandomSource, None] = None):
         """Initializes instance.
 
         Args:
             name: A string to set the name of card group.
+            rng: A RandomSource used to shuffle the cards.  Default of None
+                uses the random module.
         """
         self.name = name
         self.cards: list[Card] = []
+        self.codes: list[int] = []
+        self.rng = rng
 
     def description(self) -> str:
         """Returns a text description of the CardGroup.
@@ -48,8 +60,20 @@ class CardGroup:
         Returns:
             A string describing the CardGroup.
         """
-        return "%s contains %d cards" % (self.name, len(self.cards))
+        return "%s contains %d cards" % (self.name, self.card_count())
+
+    def card_count(self) -> int:
+        """Returns the number of cards in this CardGroup.
+
+        Returns:
+            An integer equal to the number of Cards and card codes.
+        """
+        return len(self.cards) + len(self.codes)
 
     def shuffle(self):
         """Shuffles the Cards in this object into a random order."""
-        shuffle(self.cards)
+        random_shuffle = shuffle if self.rng is None else self.rng.shuffle
+        if self.cards:
+            random_shuffle(self.cards)
+        if self.codes:
+            random_shuffle(self.codes)
@@ -12,14 +12,17 @@ Typical usage examples:
 
     deck.deal(5, players)
 
-    deck.return_cards(players[0].cards)
+    deck.return_cards(players[0].hand)
+
+    compact_deck = Deck("Compact Deck", Value, Suit, compact=True)
 """
 
-from typing import Type
+from typing import Tuple, Type, Union
 
-from model.card_game.card import Card
+from model.card_game.card import Card, card_code
 from model.card_game.card_group import CardGroup
 from model.card_game.player import Player
+from model.card_game.rng import RandomSource
 from model.card_game.suit import Suit
 from model.card_game.value import Value
 
@@ -29,12 +32,26 @@ class Deck(CardGroup):
 
     A deck of cards with no jokers.
 
+    A compact deck holds integer card codes in codes instead of Card
+    instances in cards, and deals them to the codes of each player's hand.
+
     Attributes:
         cards: A list of Card instances.
+        codes: A list of integer card codes, used when compact.
         name: A name describing this deck.
+        rng: A RandomSource used to shuffle the cards.  None to use the
+            random module.
+        compact: A boolean set to True when this deck holds card codes.
     """
 
-    def __init__(self, name: str, values: Type[Value], suits: Type[Suit]):
+    def __init__(
+        self,
+        name: str,
+        values: Type[Value],
+        suits: Type[Suit],
+        rng: Union[RandomSource, None] = None,
+        compact: bool = False,
+    ):
         """Initializes instance.
 
         Adds one standard set of 52 cards to this deck.
@@ -43,24 +60,75 @@ class Deck(CardGroup):
             name: A string for the player's name.
             values: Value enumeration of card values.
             suits: Suit enumeration of card suits.
+            rng: A RandomSource used to shuffle the cards.  Default of None
+                uses the random module.
+            compact: A boolean set to True to hold integer card codes rather
+                than Card instances.  False by default.
         """
-        CardGroup.__init__(self, name)
+        CardGroup.__init__(self, name, rng)
+        self.compact = compact
         self.add_deck(values, suits)
 
     def add_deck(self, values: Type[Value], suits: Type[Suit]):
         """Add deck of Cards.
 
-        Creates all the Card objects for one standard deck of cards and adds
-        it to this deck.  Can be used multiple times for larger deck sizes.
+        Creates all the Card objects, or card codes when compact, for one
+        standard deck of cards and adds it to this deck.  Can be used
+        multiple times for larger deck sizes.
 
         Args:
             values: An Enumeration of the card values in the deck.
             suits: An Enumeration of the card suits in the deck.
         """
+        if self.compact:
+            for value in values:
+                for suit in suits:
+                    self.codes.append(card_code(value, suit))
+            return
+
         for value in values:
             for suit in suits:
                 self.cards.append(Card(value, suit))
 
+    def draw(self) -> Union[Card, int]:
+        """Take the top card from this Deck.
+
+        Returns:
+            A Card instance, or an integer card code when compact.
+
+        Raises:
+            IndexError: If there are no cards left in this Deck.
+        """
+        if self.compact:
+            return self.codes.pop()
+        return self.cards.pop()
+
+    def snapshot(self) -> Tuple[bytes, int, int]:
+        """Record the order of the cards left in this Deck.
+
+        Returns:
+            A tuple of the card codes, bottom card first, as bytes, then 0
+                for the cursor and 0 for the shuffle count, which a Deck
+                does not have.
+        """
+        if self.compact:
+            return bytes(self.codes), 0, 0
+        return bytes([card.code for card in self.cards]), 0, 0
+
+    def restore(self, snapshot: Tuple[bytes, int, int]):
+        """Put back the cards recorded by snapshot, in the same order.
+
+        Cards in play are not taken back, so the hands must be restored too.
+
+        Args:
+            snapshot: A tuple returned by snapshot.
+        """
+        codes = snapshot[0]
+        if self.compact:
+            self.codes = list(codes)
+        else:
+            self.cards = [Card.from_code(code) for code in codes]
+
     def deal(self, number_of_cards: int, players: list[Player]):
         """Deal Cards from this Deck.
 
@@ -73,6 +141,12 @@ class Deck(CardGroup):
                 Player's hand should receive.
             players: A list of Players to receive the cards.
         """
+        if self.compact:
+            for card_count in range(0, number_of_cards):
+                for player in players:
+                    player.hand.codes.append(self.codes.pop())
+            return
+
         for card_count in range(0, number_of_cards):
             for player in players:
                 player.hand.cards.append(self.cards.pop())
@@ -80,8 +154,8 @@ class Deck(CardGroup):
     def return_cards(self, card_group: CardGroup):
         """Returns Cards to Deck.
 
-        Adds all the Cards in the CardGroup face down.
-        Then removes the Cards from the CardGroup.
+        Adds all the Cards in the CardGroup face down, along with any card
+        codes.  Then removes the Cards from the CardGroup.
 
         Args:
             card_group: A CardGroup object to return the cards from.
@@ -90,3 +164,6 @@ class Deck(CardGroup):
             card.face_up = False
             self.cards.append(card)
         card_group.cards = []
+        if card_group.codes:
+            self.codes.extend(card_group.codes)
+            card_group.codes = []
@@ -0,0 +1,102 @@
+"""Contains classes for the random number generators used by card games.
+
+Any object with shuffle, randint and choice methods that behave like those
+of random.Random can be used.  NumpyRandom wraps a NumPy Generator, which
+shuffles far faster than random.Random when playing many games.
+
+Classes:
+
+    RandomSource
+
+    NumpyRandom
+
+Typical usage examples:
+
+    deck = Deck("Deck", Value, Suit, random.Random(42))
+
+    game = Game("My Game", NumpyRandom(42))
+"""
+
+from typing import Any, MutableSequence, Protocol, Sequence, TypeVar, Union
+
+T = TypeVar("T")
+
+
+class RandomSource(Protocol):
+    """Interface for random number generators used by card games.
+
+    Matched by random.Random and NumpyRandom.
+    """
+
+    def shuffle(self, x: MutableSequence[Any]) -> None:
+        """Shuffle a sequence in place."""
+        ...
+
+    def randint(self, a: int, b: int) -> int:
+        """Return a random integer from a to b inclusive."""
+        ...
+
+    def choice(self, seq: Sequence[T]) -> T:
+        """Return a random item from a non-empty sequence."""
+        ...
+
+
+class NumpyRandom:
+    """Random number generator backed by a NumPy Generator.
+
+    NumPy is only imported when an instance is created, so it is not needed
+    unless this class is used.
+
+    Attributes:
+        generator: The numpy.random.Generator producing the random numbers.
+    """
+
+    def __init__(
+        self,
+        seed: Union[int, Sequence[int], None] = None,
+        bit_generator: str = "PCG64",
+    ):
+        """Initializes instance.
+
+        Args:
+            seed: An integer or sequence of integers to seed the generator
+                with.  Default of None seeds from the operating system.
+            bit_generator: A string with the name of the numpy.random bit
+                generator class to use, such as "PCG64" or the counter based
+                "Philox".
+        """
+        import numpy
+
+        bit_generator_class = getattr(numpy.random, bit_generator)
+        self.generator = numpy.random.Generator(bit_generator_class(seed))
+
+    def shuffle(self, x: MutableSequence[Any]) -> None:
+        """Shuffle a sequence in place.
+
+        Args:
+            x: A list or other mutable sequence to shuffle.
+        """
+        self.generator.shuffle(x)
+
+    def randint(self, a: int, b: int) -> int:
+        """Get a random integer from a to b inclusive.
+
+        Args:
+            a: An integer equal to the lowest possible result.
+            b: An integer equal to the highest possible result.
+
+        Returns:
+            A random integer.
+        """
+        return int(self.generator.integers(a, b + 1))
+
+    def choice(self, seq: Sequence[T]) -> T:
+        """Get a random item from a sequence.
+
+        Args:
+            seq: A non-empty sequence to choose from.
+
+        Returns:
+            A random item from seq.
+        """
+        return seq[int(self.generator.integers(len(seq)))]
@@ -0,0 +1,159 @@
+"""Contains class for a shoe of several decks of card codes with a cut card.
+
+Classes:
+
+    Shoe
+
+Typical usage examples:
+
+    shoe = Shoe("Shoe", Value, Suit, deck_count=6, penetration=0.75)
+
+    shoe.shuffle()
+
+    code = shoe.draw()
+
+    shoe.return_cards(players[0].hand)
+"""
+
+from typing import Tuple, Type, Union
+
+from model.card_game.array_deck import ArrayDeck
+from model.card_game.card_group import CardGroup
+from model.card_game.rng import RandomSource
+from model.card_game.suit import Suit
+from model.card_game.value import Value
+
+
+class Shoe(ArrayDeck):
+    """Class to represent several decks of card codes dealt from a shoe.
+
+    Cards are drawn from cursor as in an ArrayDeck, but cards returned after
+    a round go to the discards rather than back into play.  A cut card is
+    placed penetration of the way through the shoe.  shuffle does nothing
+    until the cut card has been reached, then shuffles every card, discards
+    included, back into the shoe.  So a round only moves the cursor on,
+    rather than shuffling every card.
+
+    Attributes:
+        name: A name describing this shoe.
+        rng: A RandomSource used to shuffle the cards.  None to use the
+            random module.
+        compact: Always True, cards are dealt as integer card codes.
+        buffer: An array of unsigned bytes holding every card code.
+        cursor: An integer equal to the index in buffer of the next card to
+            be drawn.  Cards before cursor are in play or discarded.
+        deck_count: An integer equal to the number of decks in this shoe.
+        cut: An integer equal to the index in buffer of the cut card.
+        shuffle_count: An integer equal to the number of times this shoe has
+            been shuffled.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        values: Type[Value],
+        suits: Type[Suit],
+        deck_count: int = 6,
+        penetration: float = 0.75,
+        rng: Union[RandomSource, None] = None,
+    ):
+        """Initializes instance.
+
+        Args:
+            name: A string for the shoe's name.
+            values: Value enumeration of card values.
+            suits: Suit enumeration of card suits.
+            deck_count: An integer equal to the number of standard decks of
+                52 cards in this shoe.
+            penetration: A float above 0 and up to 1, the fraction of the
+                cards dealt before the shoe is shuffled.
+            rng: A RandomSource used to shuffle the cards.  Default of None
+                uses the random module.
+
+        Raises:
+            ValueError: If deck_count is less than 1 or penetration is not
+                above 0 and up to 1.
+        """
+        if deck_count < 1:
+            raise ValueError("deck_count must be at least 1")
+        if not 0 < penetration <= 1:
+            raise ValueError("penetration must be above 0 and up to 1")
+
+        ArrayDeck.__init__(self, name, values, suits, rng)
+        for i in range(deck_count - 1):
+            self.add_deck(values, suits)
+        self.deck_count = deck_count
+        self.cut = max(int(len(self.buffer) * penetration), 1)
+        self.shuffle_count = 0
+
+    def needs_shuffle(self) -> bool:
+        """Check if the cut card has been reached or the shoe is unshuffled.
+
+        Returns:
+            A boolean set to True if the next call to shuffle will shuffle.
+        """
+        return self.shuffle_count == 0 or self.cursor >= self.cut
+
+    def shuffle(self):
+        """Shuffle every card back into the shoe, if the cut card is reached.
+
+        Should be called between rounds, when no cards are in play.  Does
+        nothing before the cut card is reached.
+        """
+        if self.needs_shuffle():
+            self.reshuffle()
+
+    def reshuffle(self):
+        """Shuffle every card, discards included, back into the shoe now."""
+        self.cursor = 0
+        ArrayDeck.shuffle(self)
+        self.shuffle_count += 1
+
+    def draw(self) -> int:
+        """Take the next card code from this shoe.
+
+        Returns:
+            An integer card code.
+
+        Raises:
+            IndexError: If every card in the shoe is in play or discarded.
+                Use more decks or a lower penetration for more players.
+        """
+        try:
+            code = self.buffer[self.cursor]
+        except IndexError:
+            raise IndexError("shoe has run out of cards") from None
+        self.cursor += 1
+        return code
+
+    def snapshot(self) -> Tuple[bytes, int, int]:
+        """Record the order of the cards, the cursor and shuffle count.
+
+        The shuffle count is kept so a shoe restored before its first
+        shuffle is shuffled again before dealing.
+
+        Returns:
+            A tuple of buffer as bytes, cursor and shuffle_count.
+        """
+        return bytes(self.buffer), self.cursor, self.shuffle_count
+
+    def restore(self, snapshot: Tuple[bytes, int, int]):
+        """Put buffer, cursor and shuffle_count back as recorded.
+
+        Args:
+            snapshot: A tuple returned by snapshot.
+        """
+        ArrayDeck.restore(self, snapshot)
+        self.shuffle_count = snapshot[2]
+
+    def return_cards(self, card_group: CardGroup):
+        """Discard the cards in a CardGroup.
+
+        Their codes are already before cursor, so are only removed from the
+        CardGroup.  They come back into play when the shoe is shuffled.
+
+        Args:
+            card_group: A CardGroup object to return the cards from.
+        """
+        card_group.codes.clear()
+        card_group.cards.clear()
@@ -2,13 +2,27 @@
 
 Modules:
     action_selector
+    batch_engine
+    event_log
     game
+    game_event
+    game_snapshot
     game_state
     game_state_error
     game_stats
+    odds
     player
+    player_order
     player_order_error
     player_state
     player_state_error
+    policy_action_selector
+    policy_table
+    round_analytics
+    session_store
+    simulator
+    target_optimizer
+    tournament
+    transition_metrics
     value
 """
@@ -20,6 +20,7 @@ Typical usage examples:
 from random import randint
 from typing import Union
 
+from model.card_game.rng import RandomSource
 from model.twenty_one_bust.game_stats import GameStats
 
 
@@ -28,9 +29,11 @@ class ActionSelector:
 
     Has a single method that tells a player to stick if...
         1: All other players have gone bust.
-        2: Most players have stuck or are yet to go and a high target total
+        2: The leading total of the players who have stuck has been reached,
+        and...
+        3: Most players have stuck or are yet to go and a high target total
         has been reached.
-        3: Most players have gone bust and a low target total has been
+        4: Most players have gone bust and a low target total has been
         reached.
 
     Attributes:
@@ -48,6 +51,7 @@ class ActionSelector:
         self,
         low_target: Union[int, None] = None,
         high_target: Union[int, None] = None,
+        rng: Union[RandomSource, None] = None,
     ):
         """Initializes instance.
 
@@ -57,8 +61,13 @@ class ActionSelector:
             high_target: An integer representing the high target hand total.
                 Default of None sets it to random value from low_target+1 to
                 20.
+            rng: A RandomSource used to pick targets that are None, usually
+                the rng of the Game this player is in.  Default of None uses
+                the random module.
 
         """
+        random_int = randint if rng is None else rng.randint
+
         if low_target is not None and (low_target < 1 or low_target > 21):
             raise ValueError("low_target must be in range 1 to 21")
         if high_target is not None and (high_target < 1 or high_target > 21):
@@ -67,21 +76,26 @@ class ActionSelector:
         if low_target is not None:
             self.low_target = low_target
         else:
-            self.low_target = randint(12, 18)
+            self.low_target = random_int(12, 18)
 
         if high_target is not None:
             self.high_target = high_target
         else:
-            self.high_target = randint(self.low_target + 1, 20)
+            self.high_target = random_int(self.low_target + 1, 20)
 
-    def should_stick(self, best_total: int, game_stats: GameStats) -> bool:
+    def should_stick(
+        self, best_total: int, game_stats: GameStats, soft: bool = False
+    ) -> bool:
         """Decides if a player should stick.
 
         Args:
             best_total: An integer representing current best total in the
                 player's hand.
             game_stats: A GameStats instance show how many players are
-                sticking, have gone bust or are yet to complete their turn.
+                sticking, have gone bust or are yet to complete their turn
+                and the leading total of those sticking.
+            soft: A boolean set to True when best_total counts an ace as 11.
+                Not used by this class.
 
         Returns:
             A boolean set True is the player should stick and False when they
@@ -97,6 +111,9 @@ class ActionSelector:
 
         if all_players_bust:
             return True
+        elif best_total < game_stats.best_stuck_total:
+            # sticking would lose to a player who has already stuck
+            return False
         elif most_players_not_bust:
             return best_total >= self.high_target
         else:
@@ -0,0 +1,270 @@
+"""Contains classes for playing many tables of 21 Bust at once with NumPy.
+
+Classes:
+
+    BatchResult
+
+    BatchEngine
+
+Typical usage examples:
+
+    engine = BatchEngine([(12, 16), (15, 18), (17, 20)], NumpyRandom(42))
+
+    batch = engine.play(10000)
+
+    print(batch.winners.sum(axis=0))
+
+    result = engine.run(1000000)
+"""
+
+from typing import Tuple, Union
+
+import numpy
+
+from model.card_game.rng import NumpyRandom
+from model.twenty_one_bust.player_state import PlayerState
+from model.twenty_one_bust.simulator import SimulationResult
+from model.twenty_one_bust.value import ace_array, card_value_array
+
+STICK = PlayerState.STICK.value
+BUST = PlayerState.BUST.value
+
+
+class BatchResult:
+    """The results of one game of 21 Bust on each of many tables.
+
+    Each attribute is an array with a row for each table and a column for
+    each player, in the order the players took their turns.
+
+    Attributes:
+        best_totals: An array of integers with the best total of each
+            player's hand.
+        states: An array of integers with the PlayerState value each player
+            ended in, STICK or BUST.
+        cards_drawn: An array of integers with the number of cards in each
+            player's hand.
+        winners: An array of booleans set to True for each player who won.
+    """
+
+    def __init__(
+        self,
+        best_totals: numpy.ndarray,
+        states: numpy.ndarray,
+        cards_drawn: numpy.ndarray,
+        winners: numpy.ndarray,
+    ):
+        """Initializes instance.
+
+        Args:
+            best_totals: An array of the best total of each player's hand.
+            states: An array of the PlayerState value of each player.
+            cards_drawn: An array of the number of cards in each hand.
+            winners: An array set to True for each player who won.
+        """
+        self.best_totals = best_totals
+        self.states = states
+        self.cards_drawn = cards_drawn
+        self.winners = winners
+
+
+class BatchEngine:
+    """Plays a game of 21 Bust on many tables at once.
+
+    Every table has the same app controlled players, taking their turns in
+    the same order.  Each player twists or sticks using the same rule as
+    ActionSelector.should_stick, and the rules of play match those of Game,
+    but each step is taken on every table at once using NumPy arrays rather
+    than a loop in Python.
+
+    Attributes:
+        low_targets: An array with the low_target of each player.
+        high_targets: An array with the high_target of each player.
+        rng: A NumpyRandom used to shuffle the decks.
+    """
+
+    def __init__(
+        self,
+        targets: list[Tuple[int, int]],
+        rng: Union[NumpyRandom, None] = None,
+    ):
+        """Initializes instance.
+
+        Args:
+            targets: A list of (low_target, high_target) tuples, one for each
+                player in turn order.  Player ids are their index in the list.
+            rng: A NumpyRandom used to shuffle the decks.  Default of None
+                creates one seeded from the operating system.
+        """
+        self.low_targets = numpy.array([target[0] for target in targets])
+        self.high_targets = numpy.array([target[1] for target in targets])
+        self.rng = rng if rng is not None else NumpyRandom()
+
+    def shuffled_decks(
+        self, tables: int, deck_size: int = 52
+    ) -> numpy.ndarray:
+        """Get a shuffled deck of card codes for each table.
+
+        Args:
+            tables: An integer equal to the number of tables.
+            deck_size: An integer equal to the number of cards in each deck,
+                a multiple of 52 for several decks.
+
+        Returns:
+            An array of card codes with a row for each table.  Cards are
+                drawn from the start of each row.
+        """
+        decks = numpy.tile(
+            numpy.arange(deck_size, dtype=numpy.uint8) % 52, (tables, 1)
+        )
+        return self.rng.generator.permuted(decks, axis=1)
+
+    def play(self, tables: int) -> BatchResult:
+        """Play a game of 21 Bust on a number of tables.
+
+        Args:
+            tables: An integer equal to the number of tables.
+
+        Returns:
+            A BatchResult for the games.
+        """
+        return self.play_decks(self.shuffled_decks(tables))
+
+    def play_decks(self, decks: numpy.ndarray) -> BatchResult:
+        """Play a game of 21 Bust on each table using the given decks.
+
+        Args:
+            decks: An array of card codes with a row for each table, dealt
+                from the start of each row like an ArrayDeck.
+
+        Returns:
+            A BatchResult for the games.
+
+        Raises:
+            IndexError: If a deck runs out of cards.
+        """
+        tables, deck_size = decks.shape
+        player_count = len(self.low_targets)
+        table_index = numpy.arange(tables)
+
+        # card values, aces are worth 1 here and 11 when counting best total
+        values = card_value_array()[decks]
+        aces = ace_array()[decks]
+
+        # deal 2 cards to each player, one at a time
+        dealt = player_count * 2
+        hard_totals = values[:, :player_count] + values[:, player_count:dealt]
+        soft = aces[:, :player_count] | aces[:, player_count:dealt]
+        cursors = numpy.full(tables, dealt)
+        cards_drawn = numpy.full((tables, player_count), 2)
+        states = numpy.zeros((tables, player_count), dtype=numpy.int8)
+
+        unfinished_counts = numpy.full(tables, player_count)
+        best_stuck_totals = numpy.zeros(tables, dtype=numpy.int64)
+        sticking_counts = numpy.zeros(tables, dtype=numpy.int64)
+        bust_counts = numpy.zeros(tables, dtype=numpy.int64)
+
+        # should_stick counts from the point of view of the active player
+        other_count = player_count - 1
+        for player in range(player_count):
+            hard_total = hard_totals[:, player].copy()
+            has_ace = soft[:, player].copy()
+            drawn = cards_drawn[:, player].copy()
+            active = numpy.ones(tables, dtype=bool)
+
+            while active.any():
+                best_total = numpy.where(
+                    has_ace & (hard_total <= 11), hard_total + 10, hard_total
+                )
+
+                all_bust = bust_counts == other_count
+                not_bust = sticking_counts + unfinished_counts - 1
+                target = numpy.where(
+                    not_bust > other_count / 2,
+                    self.high_targets[player],
+                    self.low_targets[player],
+                )
+                reached = (best_total >= target) & (
+                    best_total >= best_stuck_totals
+                )
+                sticking = active & (all_bust | reached)
+                twisting = active & ~sticking
+
+                states[sticking, player] = STICK
+                sticking_counts += sticking
+                unfinished_counts -= sticking
+                best_stuck_totals = numpy.where(
+                    sticking,
+                    numpy.maximum(best_stuck_totals, best_total),
+                    best_stuck_totals,
+                )
+
+                if twisting.any():
+                    if cursors[twisting].max() >= deck_size:
+                        raise IndexError("deck has run out of cards")
+                    card_index = numpy.where(twisting, cursors, 0)
+                    drawn_values = values[table_index, card_index]
+                    drawn_aces = aces[table_index, card_index]
+                    hard_total += numpy.where(twisting, drawn_values, 0)
+                    has_ace |= twisting & drawn_aces
+                    cursors += twisting
+                    drawn += twisting
+
+                    busting = twisting & (hard_total > 21)
+                    states[busting, player] = BUST
+                    bust_counts += busting
+                    unfinished_counts -= busting
+                    active = twisting & ~busting
+                else:
+                    active = twisting
+
+            hard_totals[:, player] = hard_total
+            soft[:, player] = has_ace
+            cards_drawn[:, player] = drawn
+
+        best_totals = numpy.where(
+            soft & (hard_totals <= 11), hard_totals + 10, hard_totals
+        )
+        stuck = states == STICK
+        stuck_totals = numpy.where(stuck, best_totals, 0)
+        best_stuck = stuck_totals.max(axis=1, keepdims=True)
+        winners = stuck & (stuck_totals == best_stuck)
+
+        return BatchResult(best_totals, states, cards_drawn, winners)
+
+    def run(self, rounds: int, batch_size: int = 10000) -> SimulationResult:
+        """Play a number of games of 21 Bust in batches.
+
+        Args:
+            rounds: An integer equal to the number of games to play.
+            batch_size: An integer equal to the largest number of tables
+                played at once.
+
+        Returns:
+            A SimulationResult for the games played.
+        """
+        player_ids = list(range(len(self.low_targets)))
+        result = SimulationResult(player_ids)
+        game_stats = result.game_stats
+
+        for start in range(0, rounds, batch_size):
+            tables = min(batch_size, rounds - start)
+            batch = self.play(tables)
+
+            wins = batch.winners.sum(axis=0)
+            sticks = (batch.states == STICK).sum(axis=0)
+            for player_id in player_ids:
+                result.win_counts[player_id] += int(wins[player_id])
+                result.stick_counts[player_id] += int(sticks[player_id])
+                result.bust_counts[player_id] += tables - int(
+                    sticks[player_id]
+                )
+            result.no_winner_count += int((~batch.winners.any(axis=1)).sum())
+
+            game_stats.player_count += tables * len(player_ids)
+            game_stats.sticking_count += int(sticks.sum())
+            game_stats.bust_count += tables * len(player_ids) - int(
+                sticks.sum()
+            )
+
+        result.rounds += rounds
+        return result
@@ -0,0 +1,357 @@
+"""Contains classes and functions to log, read and replay game events.
+
+A log is a binary file starting with a 5 byte header, followed by one 5 byte
+record for each GameEvent: the type as an unsigned byte, the player_id as a
+little endian unsigned short, then value and extra as unsigned bytes.  Logs
+are only ever appended to, so several sessions can share one file.  Each
+session starts with a SESSION event, so a replay knows to start a new Game.
+
+Classes:
+
+    EventLogWriter
+
+    ReplayDeck
+
+Functions:
+
+    read_events(path: str, chunk_size: int) -> Iterator[GameEvent]
+
+    replay(events: Iterable[GameEvent]) -> Iterator[Tuple[Game, list[Player]]]
+
+Constants:
+
+    MAGIC
+
+    RECORD
+
+Typical usage examples:
+
+    with EventLogWriter("games.log") as writer:
+        game.event_sink = writer
+        ...
+
+    for game, winners in replay(read_events("games.log")):
+        print([player.id for player in winners])
+"""
+
+import struct
+from array import array
+from typing import Iterable, Iterator, Tuple
+
+from model.card_game.array_deck import ArrayDeck
+from model.card_game.card_group import CardGroup
+from model.twenty_one_bust.game import Game
+from model.twenty_one_bust.game_event import NO_PLAYER, EventType, GameEvent
+from model.twenty_one_bust.game_state import GameState
+from model.twenty_one_bust.player import Player
+from model.twenty_one_bust.player_state import PlayerState
+
+# file signature followed by the format version
+MAGIC = b"21BL\x01"
+
+# type, player_id, value and extra of one GameEvent
+RECORD = struct.Struct("<BHBB")
+
+_EVENT_TYPES = {event_type.value: event_type for event_type in EventType}
+
+
+class EventLogWriter:
+    """EventSink appending events to a binary log file.
+
+    Records are packed into a buffer and written when it fills, so a
+    GameEvent costs no system call.  Call flush or close, or use as a
+    context manager, to write the rest.
+
+    Opening a writer starts a session.  Call start_session before logging
+    another Game with the same writer.
+
+    Attributes:
+        path: The path of the log file.
+        buffer_size: An integer equal to the number of bytes buffered before
+            they are written.
+    """
+
+    def __init__(self, path: str, buffer_size: int = 65536):
+        """Initializes instance.
+
+        Opens the file to append to, writing the header if it is empty,
+        then starts a session.
+
+        Args:
+            path: A string for the path of the log file.
+            buffer_size: An integer equal to the number of bytes buffered
+                before they are written.
+        """
+        self.path = path
+        self.buffer_size = buffer_size
+        self._file = open(path, "ab")
+        self._buffer = bytearray()
+        if self._file.tell() == 0:
+            self._buffer += MAGIC
+        self.start_session()
+
+    def start_session(self):
+        """Mark the start of the events of another Game."""
+        self.write(GameEvent(EventType.SESSION, NO_PLAYER))
+
+    def write(self, event: GameEvent):
+        """Add an event to the log.
+
+        Args:
+            event: The GameEvent to log.
+
+        Raises:
+            struct.error: If a field of event is out of range.
+        """
+        self._buffer += RECORD.pack(
+            event.type.value, event.player_id, event.value, event.extra
+        )
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered events to the file."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self):
+        """Write the buffered events and close the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> "EventLogWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_events(path: str, chunk_size: int = 65536) -> Iterator[GameEvent]:
+    """Read the events in a log file one by one.
+
+    The file is read in chunks, so logs larger than memory can be read.
+
+    Args:
+        path: A string for the path of the log file.
+        chunk_size: An integer, about the number of bytes read at once.
+
+    Yields:
+        Each GameEvent in the log, in the order they were written.
+
+    Raises:
+        ValueError: If the file is not an event log or ends part way
+            through a record.
+    """
+    size = RECORD.size
+    chunk_size = max(chunk_size // size, 1) * size
+    types = _EVENT_TYPES
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError("%s is not an event log" % (path))
+
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            if len(chunk) % size:
+                raise ValueError("%s ends part way through an event" % (path))
+            for type_value, player_id, value, extra in RECORD.iter_unpack(
+                chunk
+            ):
+                try:
+                    event_type = types[type_value]
+                except KeyError:
+                    raise ValueError(
+                        "%s holds unknown event type %d" % (path, type_value)
+                    ) from None
+                yield GameEvent(event_type, player_id, value, extra)
+
+
+class ReplayDeck(ArrayDeck):
+    """Deck dealing the card codes it is loaded with, in order.
+
+    Used to replay a game from its events.  Shuffling does nothing and
+    returned cards are discarded.
+    """
+
+    def __init__(self):
+        """Initializes instance with no cards."""
+        CardGroup.__init__(self, "Replay Deck")
+        self.compact = True
+        self.buffer = array("B")
+        self.cursor = 0
+
+    def load(self, codes: Iterable[int]):
+        """Replace the cards in this deck.
+
+        Args:
+            codes: The integer card codes to draw, in order.
+        """
+        self.buffer = array("B", codes)
+        self.cursor = 0
+
+    def push(self, code: int):
+        """Add a card code to be drawn after the rest.
+
+        Args:
+            code: An integer card code.
+        """
+        self.buffer.append(code)
+
+    def shuffle(self):
+        """Do nothing, the cards are drawn in the order they were loaded."""
+
+    def return_cards(self, card_group: CardGroup):
+        """Discard the cards in a CardGroup.
+
+        Args:
+            card_group: A CardGroup object to return the cards from.
+        """
+        card_group.codes.clear()
+        card_group.cards.clear()
+
+
+def replay(
+    events: Iterable[GameEvent],
+) -> Iterator[Tuple[Game, list[Player]]]:
+    """Play the games described by events again.
+
+    A new Game is created at the start and at each SESSION event, with a
+    player for each DEAL event of its first round, and dealt the cards in
+    the log.  Each player then twists and
+    sticks as logged.  Busts and results are checked against the logged
+    events, so a replay will stop if the rules have changed since the log
+    was written.
+
+    Args:
+        events: GameEvent instances from one or more sessions, such as
+            those from read_events.  Player ids must be unique within a
+            session.
+
+    Yields:
+        The Game, after resolving each round, and a list of the Player
+            instances who won that round.
+
+    Raises:
+        ValueError: If the events do not match the replayed game.
+    """
+    deck = ReplayDeck()
+    game = Game("Replay", deck=deck)
+    players: dict[int, Player] = {}
+    dealt: list[GameEvent] = []
+
+    for event in events:
+        event_type = event.type
+        if event_type is EventType.SESSION:
+            deck = ReplayDeck()
+            game = Game("Replay", deck=deck)
+            players = {}
+            dealt = []
+            continue
+        if event_type is EventType.DEAL:
+            dealt.append(event)
+            continue
+        if dealt:
+            _deal(game, deck, dealt, players)
+            dealt = []
+
+        if event_type is EventType.TWIST:
+            player = _start_turn(game, event.player_id)
+            deck.push(event.value)
+            game.resolve_twist_action(player)
+            if player.best_total != event.extra:
+                raise ValueError(
+                    "player %d has %d, not %d"
+                    % (player.id, player.best_total, event.extra)
+                )
+        elif event_type is EventType.STICK:
+            player = _start_turn(game, event.player_id)
+            game.resolve_stick_action(player)
+        elif event_type is EventType.BUST:
+            player = players[event.player_id]
+            if player.state is not PlayerState.BUST:
+                raise ValueError("player %d is not bust" % (player.id))
+        elif event_type is EventType.RESOLVE:
+            while game.state is GameState.GETTING_NEXT_PLAYER:
+                game.next_player()
+            state, winners = game.resolve()
+            total = winners[0].best_total if winners else 0
+            if len(winners) != event.player_id or total != event.value:
+                raise ValueError(
+                    "%d players won with %d, not %d with %d"
+                    % (len(winners), total, event.player_id, event.value)
+                )
+            yield game, winners
+        elif event_type is EventType.RESET:
+            if event.player_id == NO_PLAYER:
+                game.reset([])
+            else:
+                game.reset([players[event.player_id]])
+
+
+def _deal(
+    game: Game,
+    deck: ReplayDeck,
+    dealt: list[GameEvent],
+    players: dict[int, Player],
+):
+    """Deal the cards of a round's DEAL events.
+
+    Adds the players to game on the first round.
+
+    Args:
+        game: The Game being replayed.
+        deck: The ReplayDeck of game.
+        dealt: The DEAL events of the round, in turn order.
+        players: A dictionary of the Player instances in game by id.
+
+    Raises:
+        ValueError: If the players are not in the order they were dealt to.
+    """
+    if not players:
+        for event in dealt:
+            player = Player(event.player_id, "Player %d" % (event.player_id))
+            players[player.id] = player
+            game.players.append(player)
+
+    if [player.id for player in game.players] != [
+        event.player_id for event in dealt
+    ]:
+        raise ValueError("players were not dealt to in turn order")
+
+    deck.load([event.value for event in dealt])
+    for event in dealt:
+        deck.push(event.extra)
+    game.deal()
+
+
+def _start_turn(game: Game, player_id: int) -> Player:
+    """Move game on to the turn of a player, if it is not already theirs.
+
+    Args:
+        game: The Game being replayed.
+        player_id: The id of the player whose turn it should be.
+
+    Returns:
+        The Player instance whose turn it is.
+
+    Raises:
+        ValueError: If it is not the turn of the player with player_id.
+    """
+    if game.state is GameState.GETTING_NEXT_PLAYER:
+        game.next_player()
+    if game.state is GameState.RESOLVING_GAME:
+        raise ValueError("player %d played after every turn" % (player_id))
+
+    player = game.players[game.active_player_index]
+    if player.id != player_id:
+        raise ValueError(
+            "player %d played in the turn of player %d"
+            % (player_id, player.id)
+        )
+    if game.state is GameState.STARTING_PLAYER_TURN:
+        game.start_turn(player)
+    return player
@@ -30,18 +30,32 @@ Typical usage examples:
 """
 
 import random
-from typing import Tuple
+import time
+from typing import Callable, Tuple, Union
 
 from model.card_game.card import Card
 from model.card_game.deck import Deck
+from model.card_game.rng import RandomSource
 from model.card_game.suit import Suit
 from model.card_game.value import Value
+from model.twenty_one_bust.game_event import (
+    NO_PLAYER,
+    EventSink,
+    EventType,
+    GameEvent,
+)
+from model.twenty_one_bust.game_snapshot import GameSnapshot, PlayerSnapshot
 from model.twenty_one_bust.game_state import GameState
 from model.twenty_one_bust.game_state_error import GameStateError
 from model.twenty_one_bust.game_stats import GameStats
 from model.twenty_one_bust.player import Player
+from model.twenty_one_bust.player_order import PlayerOrder
 from model.twenty_one_bust.player_order_error import PlayerOrderError
 from model.twenty_one_bust.player_state import PlayerState
+from model.twenty_one_bust.transition_metrics import (
+    TRANSITIONS,
+    TransitionHook,
+)
 
 
 class Game:
@@ -49,7 +63,8 @@ class Game:
 
     Contains a set of methods to be called in order to progress through a
         simplified game of 21 Bust with the following rules:
-        - There is a single deck of 52 standard playing cards.
+        - There is a single deck of 52 standard playing cards, or a Shoe of
+          several decks for larger tables.
         - Aces can be worth 1 or 11
         - Picture cards (Jacks, Queens & Kings) are worth 10
         - All other cards are worth their face value.
@@ -68,29 +83,95 @@ class Game:
         name: A string describing this game's name.
         deck: A Deck instance representing the cards to be dealt to players in
             this game.
-        players: A list of Player instances representing the players in this
-            game, what cards are in their hands and their state'.  The order
-            of the players in this this is used to control the order which the
-            players take their turn each time the game is played.
+        players: A PlayerOrder of Player instances representing the players
+            in this game, what cards are in their hands and their state'.  The
+            order of the players in this this is used to control the order
+            which the players take their turn each time the game is played.
+            Changing who goes first is O(1), however many players there are.
         state: A GameState for the current state of this game.
         active_player_index: An integer holding the index of the Player
             instance in players who's turn it currently is.
         game_stats: A GameStats instance hold details of how many players
             have yet to complete their turn, have gone bust and so on.
+        rng: A RandomSource used to shuffle the deck and choose the first
+            player.  Pass it to the ActionSelector of each app controlled
+            player so a whole game can be repeated from one seed.
+        event_sink: An EventSink sent a GameEvent for each deal, twist,
+            stick, bust, resolve and reset, or None to send no events.
+        hook: A TransitionHook called with the duration and states of each
+            transition, or None.  Set with set_hook.
     """
 
-    def __init__(self, name: str):
+    def __init__(
+        self,
+        name: str,
+        rng: Union[RandomSource, None] = None,
+        deck: Union[Deck, None] = None,
+    ):
         """Initializes instance.
 
         Args:
             name: A string describing this game's name.
+            rng: A RandomSource such as random.Random or NumpyRandom.
+                Default of None creates a new random.Random for this game.
+            deck: A Deck, such as an ArrayDeck or a Shoe of several decks
+                for more than about 10 players, to deal from.  Given rng if
+                it does not have one.  Default of None creates a standard
+                Deck of 52 Card instances.
         """
         self.name = name
-        self.deck = Deck("Deck", Value, Suit)
-        self.players: list[Player] = []
+        self.rng: RandomSource = rng if rng is not None else random.Random()
+        if deck is None:
+            deck = Deck("Deck", Value, Suit, self.rng)
+        elif deck.rng is None:
+            deck.rng = self.rng
+        self.deck = deck
+        self.players = PlayerOrder()
         self.state = GameState.DEALING
         self.active_player_index = -1
         self.game_stats: GameStats = GameStats(0)
+        self.event_sink: Union[EventSink, None] = None
+        self.hook: Union[TransitionHook, None] = None
+
+    def set_hook(self, hook: Union[TransitionHook, None]):
+        """Time every state transition of this game.
+
+        The methods named in TRANSITIONS are replaced on this instance with
+        timed versions calling hook after they return.  Without a hook the
+        methods are the plain methods of the class, so cost nothing extra.
+
+        Args:
+            hook: A TransitionHook such as a TransitionMetrics, or None to
+                stop timing transitions.
+        """
+        for name in TRANSITIONS:
+            self.__dict__.pop(name, None)
+            if hook is not None:
+                setattr(self, name, _timed(self, name, hook))
+        self.hook = hook
+
+    def __getstate__(self) -> dict:
+        """Get the attributes to copy or pickle, without the timed methods.
+
+        The timed methods set by set_hook call the methods of this instance,
+        so they are left out and a copy wraps its own methods instead.
+
+        Returns:
+            A dictionary of attributes by name.
+        """
+        state = dict(self.__dict__)
+        for name in TRANSITIONS:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: dict):
+        """Set the attributes of a copy, timing its transitions with hook.
+
+        Args:
+            state: A dictionary returned by __getstate__.
+        """
+        self.__dict__.update(state)
+        self.set_hook(self.hook)
 
     def deal(self) -> GameState:
         """Deal cards to players.
@@ -99,6 +180,8 @@ class Game:
 
         Gets the game started by shuffling the deck, and dealing 2 cards
         each player.  Initializes active_player_index and active_player_index.
+        A Shoe is only shuffled once its cut card is reached, otherwise
+        dealing carries on from where the last round stopped.
 
         Returns:
             The GameState after this method has been executed.
@@ -111,14 +194,24 @@ class Game:
             raise GameStateError(self.state, [GameState.DEALING])
 
         self.deck.shuffle()
+        draw = self.deck.draw
         for i in range(2):
             for player in self.players:
-                player.add_card(self.deck.cards.pop())
+                player.add_card(draw())
 
         self.active_player_index = -1
 
         self.game_stats = GameStats(len(self.players))
 
+        sink = self.event_sink
+        if sink is not None:
+            for player in self.players:
+                hand = player.hand
+                codes = hand.codes or [card.code for card in hand.cards]
+                sink.write(
+                    GameEvent(EventType.DEAL, player.id, codes[0], codes[1])
+                )
+
         self.state = GameState.GETTING_NEXT_PLAYER
         return self.state
 
@@ -128,8 +221,8 @@ class Game:
         returns:
             The Player selected to go first.
         """
-        random_player_index = random.randint(0, len(self.players) - 1)
-        self.players = self.get_player_order(random_player_index)
+        random_player_index = self.rng.randint(0, len(self.players) - 1)
+        self.players.rotate(random_player_index)
         return self.players[0]
 
     def next_player(self) -> GameState:
@@ -221,7 +314,11 @@ class Game:
             raise PlayerOrderError(player, active_player)
 
         player.stick()
-        self.game_stats.update(PlayerState.STICK)
+        self.game_stats.update(PlayerState.STICK, player.best_total, player)
+        if self.event_sink is not None:
+            self.event_sink.write(
+                GameEvent(EventType.STICK, player.id, player.best_total)
+            )
 
         self.state = GameState.GETTING_NEXT_PLAYER
         return self.state
@@ -229,7 +326,7 @@ class Game:
     def resolve_twist_action(
         self,
         player: Player,
-    ) -> Tuple[GameState, Card]:
+    ) -> Tuple[GameState, Union[Card, int]]:
         """Resolve a player's twist action.
 
         Use after start_turn methods is called.
@@ -247,7 +344,8 @@ class Game:
                 this player went bust.
                 GameState.STARTING_PLAYER_TURN for this player to continue if
                 this player did not bust.
-                The Card instance the player drew.
+                The Card instance the player drew, or its integer card code
+                if the deck is compact.
 
         Raises:
             GameStateError: If state is not WAITING_FOR_PLAYER.
@@ -260,12 +358,24 @@ class Game:
         if player is not active_player:
             raise PlayerOrderError(player, active_player)
 
-        card = self.deck.cards.pop()
-        if player.twist(card) == PlayerState.BUST:
+        card = self.deck.draw()
+        bust = player.twist(card) == PlayerState.BUST
+        if bust:
             self.state = GameState.GETTING_NEXT_PLAYER
             self.game_stats.update(PlayerState.BUST)
         else:
             self.state = GameState.STARTING_PLAYER_TURN
+
+        sink = self.event_sink
+        if sink is not None:
+            code = card if isinstance(card, int) else card.code
+            sink.write(
+                GameEvent(EventType.TWIST, player.id, code, player.best_total)
+            )
+            if bust:
+                sink.write(
+                    GameEvent(EventType.BUST, player.id, player.best_total)
+                )
         return self.state, card
 
     def resolve(self) -> Tuple[GameState, list[Player]]:
@@ -274,7 +384,8 @@ class Game:
         Use after next_player method is called and all players have chosen to
         stick or gone bust.
 
-        Finds the winning players and updates their win_count.
+        Reveals every player's hand, finds the winning players and updates
+        their win_count.
 
         Returns:
             A Tuple containing...
@@ -288,11 +399,21 @@ class Game:
         if self.state is not GameState.RESOLVING_GAME:
             raise GameStateError(self.state, [GameState.RESOLVING_GAME])
 
+        for player in self.players:
+            player.reveal_hand()
+
         winners = self.get_winners()
 
         for player in winners:
             player.win_count += 1
 
+        if self.event_sink is not None:
+            # player_id holds the number of winners
+            total = winners[0].best_total if winners else 0
+            self.event_sink.write(
+                GameEvent(EventType.RESOLVE, len(winners), total)
+            )
+
         self.state = GameState.RESETTING_GAME
         return self.state, winners
 
@@ -301,27 +422,13 @@ class Game:
 
         Use after next_player method is called and all players have been.
 
-        Search for winners by looking for the players who have stuck and have
-        highest best_total.
+        The winners are the players who have stuck with the highest
+        best_total, kept up to date in game_stats as each player sticks.
 
         Returns:
             A list Player instances who won this game.
         """
-        winners = []
-        best_total = 0
-
-        for player in self.players:
-            player.reveal_hand()
-            if player.state == PlayerState.STICK:
-                if player.best_total > best_total:
-                    # if better then current best_total start new list
-                    best_total = player.best_total
-                    winners = [player]
-                elif player.best_total == best_total:
-                    # if same as current best_total add to list
-                    winners.append(player)
-
-        return winners
+        return list(self.game_stats.leaders)
 
     def reset(self, winners: list[Player]) -> GameState:
         """Gets finds results of game after all players have been.
@@ -345,18 +452,109 @@ class Game:
         if self.state is not GameState.RESETTING_GAME:
             raise GameStateError(self.state, [GameState.RESETTING_GAME])
 
-        if winners is not None:
-            winner = random.choice(winners)
-            player_index = self.players.index(winner)
-            self.players = self.get_player_order(player_index)
+        if winners:
+            winner = self.rng.choice(winners)
+            self.players.rotate(self.players.index(winner))
+            first_player_id = winner.id
+        else:
+            first_player_id = NO_PLAYER
 
         for player in self.players:
             self.deck.return_cards(player.hand)
             player.reset()
 
+        if self.event_sink is not None:
+            self.event_sink.write(GameEvent(EventType.RESET, first_player_id))
+
         self.state = GameState.DEALING
         return self.state
 
+    def snapshot(self) -> GameSnapshot:
+        """Record the state of this game, to restore later.
+
+        Can be used in any state.  The rng is not recorded, so a restored
+        game does not repeat the same shuffles.
+
+        Returns:
+            A GameSnapshot of the deck order, players and game_stats.
+        """
+        players = []
+        for player in self.players:
+            hand = player.hand
+            players.append(
+                PlayerSnapshot(
+                    player,
+                    player.state,
+                    bytes(hand.codes or [card.code for card in hand.cards]),
+                    player.hard_total,
+                    player.ace_count,
+                    player.win_count,
+                )
+            )
+        stats = self.game_stats
+        return GameSnapshot(
+            self.state,
+            self.active_player_index,
+            tuple(players),
+            self.deck.snapshot(),
+            (
+                stats.player_count,
+                stats.unfinished_count,
+                stats.sticking_count,
+                stats.bust_count,
+                stats.best_stuck_total,
+            ),
+            tuple(stats.leaders),
+        )
+
+    def restore(self, snapshot: GameSnapshot):
+        """Put this game back to the state recorded by snapshot.
+
+        The snapshot must have been taken from this game, as it refers to
+        its Player instances.  Hands dealt from a compact deck are restored
+        as card codes, otherwise as new Card instances, face up once the
+        game has been resolved.
+
+        Args:
+            snapshot: A GameSnapshot returned by snapshot.
+        """
+        self.state = snapshot.state
+        self.active_player_index = snapshot.active_player_index
+        self.deck.restore(snapshot.deck)
+
+        compact = self.deck.compact
+        face_up = snapshot.state is GameState.RESETTING_GAME
+        order = []
+        for saved in snapshot.players:
+            player = saved.player
+            order.append(player)
+            player.state = saved.state
+            player.hard_total = saved.hard_total
+            player.ace_count = saved.ace_count
+            player.win_count = saved.win_count
+            hand = player.hand
+            if compact:
+                hand.codes = list(saved.hand)
+                hand.cards = []
+            else:
+                hand.codes = []
+                hand.cards = [
+                    Card.from_code(code, face_up) for code in saved.hand
+                ]
+        if self.players != order:
+            self.players = PlayerOrder(order)
+
+        stats = GameStats(0)
+        (
+            stats.player_count,
+            stats.unfinished_count,
+            stats.sticking_count,
+            stats.bust_count,
+            stats.best_stuck_total,
+        ) = snapshot.stats
+        stats.leaders = list(snapshot.leaders)
+        self.game_stats = stats
+
     def get_player_order(self, first_player_index) -> list[Player]:
         """Get an updated player order with player at first_player_index first.
 
@@ -378,3 +576,29 @@ class Game:
             players.append(self.players[index])
 
         return players
+
+
+def _timed(game: Game, name: str, hook: TransitionHook) -> Callable:
+    """Wrap a transition method of a game to time it.
+
+    Args:
+        game: The Game instance.
+        name: A string, the name of the method in TRANSITIONS.
+        hook: The TransitionHook to call after the method returns.
+
+    Returns:
+        A function calling the method of game with the same arguments.
+    """
+    method = getattr(Game, name)
+    clock = time.perf_counter_ns
+
+    def timed(*args, **kwargs):
+        before = game.state
+        start = clock()
+        result = method(game, *args, **kwargs)
+        hook(name, clock() - start, before, game.state)
+        return result
+
+    timed.__name__ = name
+    timed.__doc__ = method.__doc__
+    return timed
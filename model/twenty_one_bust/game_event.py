@@ -0,0 +1,113 @@
+"""Contains classes for the events a game of 21 Bust emits as it is played.
+
+Classes:
+
+    EventType
+
+    GameEvent
+
+    EventSink
+
+    ListSink
+
+Constants:
+
+    NO_PLAYER
+
+Typical usage examples:
+
+    sink = ListSink()
+
+    game.event_sink = sink
+
+    for event in sink.events:
+        print(event.type, event.player_id)
+"""
+
+from enum import Enum
+from typing import NamedTuple, Protocol
+
+# player_id of RESET events when there are no winners
+NO_PLAYER = 0xFFFF
+
+
+class EventType(Enum):
+    """Type of a GameEvent.
+
+    What the player_id, value and extra of each type of event hold...
+        DEAL: A player in turn order and the codes of the 2 cards dealt to
+        them.
+        TWIST: The player, the code of the card drawn and their best total.
+        STICK: The player and their best total.
+        BUST: The player and their best total, over 21.
+        RESOLVE: The number of winners in place of a player id, and the
+        winning total.
+        RESET: The player going first next game, or NO_PLAYER if the order
+        is unchanged.
+        SESSION: NO_PLAYER, marking the start of the events of another Game
+        in a log shared by several.  Written by an EventLogWriter rather
+        than the Game.
+
+    Attributes:
+        name: A string for the type of event.
+        value: An integer unique to each member in this enumeration.
+    """
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __int__(self) -> int:
+        return self.value
+
+    DEAL = 1
+    TWIST = 2
+    STICK = 3
+    BUST = 4
+    RESOLVE = 5
+    RESET = 6
+    SESSION = 7
+
+
+class GameEvent(NamedTuple):
+    """Something that happened in a game of 21 Bust.
+
+    Attributes:
+        type: The EventType of this event.
+        player_id: An integer id of the player this event is about, from 0
+            to 65534, or NO_PLAYER.
+        value: An integer from 0 to 255, see EventType.
+        extra: An integer from 0 to 255, see EventType.
+    """
+
+    type: EventType
+    player_id: int
+    value: int = 0
+    extra: int = 0
+
+
+class EventSink(Protocol):
+    """Interface for where a Game sends its events."""
+
+    def write(self, event: GameEvent) -> None:
+        """Receive one event."""
+        ...
+
+
+class ListSink:
+    """EventSink keeping every event in a list, for tests and short games.
+
+    Attributes:
+        events: A list of the GameEvent instances received, in order.
+    """
+
+    def __init__(self):
+        """Initializes instance."""
+        self.events: list[GameEvent] = []
+
+    def write(self, event: GameEvent):
+        """Add an event to events.
+
+        Args:
+            event: The GameEvent to keep.
+        """
+        self.events.append(event)
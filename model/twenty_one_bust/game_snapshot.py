@@ -0,0 +1,72 @@
+"""Contains classes recording the state of a game of 21 Bust at one moment.
+
+Classes:
+
+    PlayerSnapshot
+
+    GameSnapshot
+
+Typical usage examples:
+
+    snapshot = game.snapshot()
+
+    game.resolve_twist_action(player)
+
+    game.restore(snapshot)
+"""
+
+from typing import NamedTuple, Tuple
+
+from model.twenty_one_bust.game_state import GameState
+from model.twenty_one_bust.player import Player
+from model.twenty_one_bust.player_state import PlayerState
+
+
+class PlayerSnapshot(NamedTuple):
+    """The state of one player in a GameSnapshot.
+
+    A player's totals, best_total and soft are worked out from hard_total
+    and ace_count, so are restored with them.
+
+    Attributes:
+        player: The Player instance this snapshot is of.
+        state: The PlayerState of the player.
+        hand: The codes of the cards in the player's hand, as bytes.
+        hard_total: An integer equal to the player's hard_total.
+        ace_count: An integer equal to the player's ace_count.
+        win_count: An integer equal to the player's win_count.
+    """
+
+    player: Player
+    state: PlayerState
+    hand: bytes
+    hard_total: int
+    ace_count: int
+    win_count: int
+
+
+class GameSnapshot(NamedTuple):
+    """The state of a Game, from Game.snapshot.
+
+    Immutable and made of bytes, integers, enumeration members and
+    references to the game's Player instances, so taking one copies no
+    Card instances and one snapshot can be restored any number of times.
+
+    Attributes:
+        state: The GameState of the game.
+        active_player_index: An integer equal to the game's
+            active_player_index.
+        players: A tuple of PlayerSnapshot instances in turn order.
+        deck: A tuple of the card codes in the deck as bytes, its cursor
+            and its shuffle count, from the deck's snapshot method.
+        stats: A tuple of the game_stats player_count, unfinished_count,
+            sticking_count, bust_count and best_stuck_total.
+        leaders: A tuple of the Player instances in game_stats leaders.
+    """
+
+    state: GameState
+    active_player_index: int
+    players: Tuple[PlayerSnapshot, ...]
+    deck: Tuple[bytes, int, int]
+    stats: Tuple[int, int, int, int, int]
+    leaders: Tuple[Player, ...]
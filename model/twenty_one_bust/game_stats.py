@@ -8,11 +8,20 @@ Typical usage examples:
 
     stats = GameStats(number_of_players)
 
-    stats.update(player)
+    stats.update(PlayerState.STICK, player.best_total, player)
+
+    winners = stats.leaders
+
+    totals.merge(stats)
 """
 
+from typing import TYPE_CHECKING, Union
+
 from model.twenty_one_bust.player_state import PlayerState
 
+if TYPE_CHECKING:
+    from model.twenty_one_bust.player import Player
+
 
 class GameStats:
     """Stats for all the stats of all player states in the game.
@@ -28,6 +37,10 @@ class GameStats:
             chosen to stick.
         bust_count: An integer equal to the number of players who have gone
             bust.
+        best_stuck_total: An integer equal to the highest best total of the
+            players who have chosen to stick, 0 if none have.
+        leaders: A list of the Player instances who have stuck with
+            best_stuck_total, in the order they stuck.
     """
 
     def __init__(self, player_count: int):
@@ -40,17 +53,29 @@ class GameStats:
         self.unfinished_count = self.player_count
         self.sticking_count = 0
         self.bust_count = 0
-
-    def update(self, player_state: PlayerState):
+        self.best_stuck_total = 0
+        self.leaders: list["Player"] = []
+
+    def update(
+        self,
+        player_state: PlayerState,
+        best_total: int = 0,
+        player: Union["Player", None] = None,
+    ):
         """Updates the stats when a players' state changes.
 
         Should be called when a player sticks or goes bust to increase
         sticking_count or sticking_count by 1, and reduce unfinished_count
-        by 1.
+        by 1.  Keeps best_stuck_total and leaders up to date as each player
+        sticks, so the winners are known without checking every player.
 
         Args:
             player_state: PlayerState enum member of the player who chose to
                 stick or went bust.
+            best_total: An integer equal to the best total of the player,
+                used to update best_stuck_total when they stick.
+            player: The Player instance who stuck, added to leaders if their
+                best_total equals best_stuck_total.
         """
         if self.unfinished_count == 0:
             return
@@ -58,6 +83,24 @@ class GameStats:
         if player_state is PlayerState.STICK:
             self.sticking_count += 1
             self.unfinished_count -= 1
+            if best_total > self.best_stuck_total:
+                self.best_stuck_total = best_total
+                self.leaders = [player] if player is not None else []
+            elif best_total == self.best_stuck_total and player is not None:
+                self.leaders.append(player)
         elif player_state is PlayerState.BUST:
             self.bust_count += 1
             self.unfinished_count -= 1
+
+    def merge(self, other: "GameStats"):
+        """Adds the counts from another GameStats to this one.
+
+        Used to total up stats over many games.
+
+        Args:
+            other: A GameStats instance whose counts are to be added.
+        """
+        self.player_count += other.player_count
+        self.unfinished_count += other.unfinished_count
+        self.sticking_count += other.sticking_count
+        self.bust_count += other.bust_count
@@ -0,0 +1,153 @@
+"""Contains functions for the exact odds of a hand in a game of 21 Bust.
+
+A deck is described by how many cards of each game value it holds, so
+every deck with the same count of each value shares the same odds.  Odds
+are worked out by dynamic programming over these counts and memoized, so
+the same (deck counts, total, soft flag) is only ever solved once.
+
+Functions:
+
+    deck_counts(cards) -> tuple
+
+    final_total_distribution(hard_total, has_ace, counts, threshold) -> dict
+
+    bust_probability(hard_total, has_ace, counts, threshold) -> Fraction
+
+    clear_cache()
+
+Constants:
+
+    BUST
+
+Typical usage examples:
+
+    counts = deck_counts(game.deck.cards)
+
+    distribution = final_total_distribution(
+        player.hard_total, player.ace_count > 0, counts, 17
+    )
+
+    print(distribution[BUST])
+"""
+
+from fractions import Fraction
+from functools import lru_cache
+from typing import Iterable, Tuple, Union
+
+from model.card_game.card import Card
+from model.twenty_one_bust.value import card_value
+
+# key of the final total for any hand worth over 21
+BUST = 22
+
+# number of different game values, aces (1) to tens and picture cards (10)
+VALUE_COUNT = 10
+
+
+def deck_counts(cards: Iterable[Union[Card, int]]) -> Tuple[int, ...]:
+    """Count how many cards of each game value there are.
+
+    Args:
+        cards: Card instances or integer card codes, such as the cards left
+            in a deck.
+
+    Returns:
+        A tuple of 10 integers, the count of cards with game values 1 (aces)
+            to 10.
+    """
+    counts = [0] * VALUE_COUNT
+    for card in cards:
+        counts[card_value(card) - 1] += 1
+    return tuple(counts)
+
+
+def final_total_distribution(
+    hard_total: int,
+    has_ace: bool,
+    counts: Tuple[int, ...],
+    threshold: int,
+) -> dict[int, Fraction]:
+    """Exact odds of each final total for a player drawing to a threshold.
+
+    The player twists until their best total reaches threshold, they go bust
+    or the deck runs out, then sticks.
+
+    Args:
+        hard_total: An integer equal to the total of the player's hand with
+            every ace worth 1.
+        has_ace: A boolean set to True if the player's hand holds an ace.
+        counts: A tuple of counts of each game value left in the deck, from
+            deck_counts.
+        threshold: An integer best total at or above which the player sticks.
+
+    Returns:
+        A dictionary mapping each possible final best total to its
+            probability.  All totals over 21 are combined under BUST.
+    """
+    return dict(_distribution(tuple(counts), hard_total, has_ace, threshold))
+
+
+def bust_probability(
+    hard_total: int,
+    has_ace: bool,
+    counts: Tuple[int, ...],
+    threshold: int,
+) -> Fraction:
+    """Exact odds of a player drawing to a threshold going bust.
+
+    Args:
+        hard_total: An integer equal to the total of the player's hand with
+            every ace worth 1.
+        has_ace: A boolean set to True if the player's hand holds an ace.
+        counts: A tuple of counts of each game value left in the deck, from
+            deck_counts.
+        threshold: An integer best total at or above which the player sticks.
+
+    Returns:
+        A Fraction from 0 to 1.
+    """
+    distribution = final_total_distribution(
+        hard_total, has_ace, counts, threshold
+    )
+    return distribution.get(BUST, Fraction(0))
+
+
+def clear_cache():
+    """Empty the memoized odds, freeing the memory they use."""
+    _distribution.cache_clear()
+
+
+@lru_cache(maxsize=1 << 20)
+def _distribution(
+    counts: Tuple[int, ...], hard_total: int, has_ace: bool, threshold: int
+) -> Tuple[Tuple[int, Fraction], ...]:
+    """Memoized final_total_distribution, returning a tuple of pairs."""
+    if hard_total > 21:
+        return ((BUST, Fraction(1)),)
+
+    if has_ace and hard_total <= 11:
+        best_total = hard_total + 10
+    else:
+        best_total = hard_total
+
+    card_count = sum(counts)
+    if best_total >= threshold or card_count == 0:
+        return ((best_total, Fraction(1)),)
+
+    distribution: dict[int, Fraction] = {}
+    for index, count in enumerate(counts):
+        if count == 0:
+            continue
+
+        value = index + 1
+        next_counts = counts[:index] + (count - 1,) + counts[value:]
+        draw_probability = Fraction(count, card_count)
+        for total, probability in _distribution(
+            next_counts, hard_total + value, has_ace or value == 1, threshold
+        ):
+            distribution[total] = (
+                distribution.get(total, Fraction(0))
+                + draw_probability * probability
+            )
+
+    return tuple(sorted(distribution.items()))
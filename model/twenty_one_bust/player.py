@@ -18,7 +18,14 @@ from model.card_game.card import Card
 from model.twenty_one_bust.action_selector import ActionSelector
 from model.twenty_one_bust.player_state import PlayerState
 from model.twenty_one_bust.player_state_error import PlayerStateError
-from model.twenty_one_bust.value import alt_card_value, card_value
+from model.twenty_one_bust.value import (
+    CODE_CARD_VALUES,
+    CODE_IS_ACE,
+    VALUE_CARD_VALUES,
+    VALUE_IS_ACE,
+    alt_card_value,
+    card_value,
+)
 
 
 class Player(player.Player):
@@ -27,13 +34,25 @@ class Player(player.Player):
     Subclass of model.card_game.player.player with the functionality to for
     21 Bust.
 
+    The value of the cards in the player's hand is tracked as a hard total,
+    counting every ace as 1, and a count of aces.  These are updated in
+    constant time as each card is added.  At most one ace can ever be worth
+    11 without going bust, so the best total is the hard total plus 10 when
+    there is an ace and that does not take it over 21.
+
     Attributes:
         state: A PlayerState set to the current state of the player in the
             game.
+        hard_total: An integer equal to the total of the cards in the
+            player's hand with every ace worth 1.
+        ace_count: An integer equal to the number of aces in the player's
+            hand.
         totals: A set of integers containing all the totals that the cards in
-            the player's hand could add up to.
+            the player's hand could add up to.  Computed when read.
         best_total: An integer equal to the best total of the cards in the
-            player's hand.
+            player's hand.  Computed when read.
+        soft: A boolean set to True when best_total counts an ace as 11.
+            Computed when read.
         action_selector: An ActionSelector instance to choose if this player
             should stick or twist.  Set for computer controlled players.
     """
@@ -53,10 +72,31 @@ class Player(player.Player):
         player.Player.__init__(self, id, name)
         self.action_selector = action_selector
         self.state = PlayerState.WAITING_TO_PLAY
-        self.totals = {0}
-        self.best_total = 0
+        self.hard_total = 0
+        self.ace_count = 0
         self.win_count = 0
 
+    @property
+    def totals(self) -> Set[int]:
+        """All the totals the cards in the player's hand could add up to."""
+        return {
+            self.hard_total + 10 * aces_as_eleven
+            for aces_as_eleven in range(self.ace_count + 1)
+        }
+
+    @property
+    def best_total(self) -> int:
+        """The highest total of the player's hand, under 22 if possible."""
+        hard_total = self.hard_total
+        if self.ace_count and hard_total <= 11:
+            return hard_total + 10
+        return hard_total
+
+    @property
+    def soft(self) -> bool:
+        """True when best_total counts an ace as 11."""
+        return self.ace_count > 0 and self.hard_total <= 11
+
     def user_controlled(self) -> bool:
         """Return True if player is user controlled."""
         return self.action_selector is None
@@ -109,7 +149,7 @@ class Player(player.Player):
 
         return self.state
 
-    def twist(self, card: Card) -> PlayerState:
+    def twist(self, card: Union[Card, int]) -> PlayerState:
         """Twist action - player receives a card.
 
         Can only be taken when player state is SELECTING_ACTION.
@@ -117,7 +157,8 @@ class Player(player.Player):
         The plyer will either be able to continue playing or go bust.
 
         Args:
-            card: A Card instance to add to the player's hand.
+            card: A Card instance or integer card code to add to the
+                player's hand.
 
         Returns:
             The new PlayerState after taking this action, either
@@ -131,31 +172,41 @@ class Player(player.Player):
 
         self.add_card(card)
 
-        if self.best_total > 21:
+        if self.hard_total > 21:
             self.state = PlayerState.BUST
         else:
             self.state = PlayerState.DECIDING_ACTION
 
         return self.state
 
-    def add_card(self, card: Card):
+    def add_card(self, card: Union[Card, int]):
         """Add card to player's hand.
 
-        Updates totals and best total to reflect the changes made by adding
-        the card.
+        Updates hard_total and ace_count to reflect the changes made by
+        adding the card.
 
         Args:
-            card: A Card instance to add to the player's hand.
+            card: A Card instance to add to the player's hand, or an integer
+                card code to add to the codes in the player's hand.
         """
-        self.hand.cards.append(card)
-        self.totals = self.get_totals(self.totals, card)
-        self.best_total = self.get_best_total(self.totals)
+        if isinstance(card, int):
+            self.hand.codes.append(card)
+            self.hard_total += CODE_CARD_VALUES[card]
+            if CODE_IS_ACE[card]:
+                self.ace_count += 1
+        else:
+            self.hand.cards.append(card)
+            value = card.value
+            self.hard_total += VALUE_CARD_VALUES[value]
+            if VALUE_IS_ACE[value]:
+                self.ace_count += 1
 
     def reset(self):
         """Reset player ready to start a new game of 21 Bust."""
         self.hand.cards = []
-        self.totals = {0}
-        self.best_total = 0
+        self.hand.codes = []
+        self.hard_total = 0
+        self.ace_count = 0
         self.state = PlayerState.WAITING_TO_PLAY
 
     def reveal_hand(self):
@@ -163,16 +214,18 @@ class Player(player.Player):
         for card in self.hand.cards:
             card.face_up = True
 
-    def get_totals(self, totals: Set[int], card: Card) -> Set[int]:
+    def get_totals(self, totals: Set[int], card: Union[Card, int]) -> Set[int]:
         """Calculate possible totals when card is added to player's hand.
 
         Because aces are worth either 1 or 11, a player's hand can have
-        multiple totals.
+        multiple totals.  The player's own totals are tracked without this,
+        it is kept for working with sets of totals directly.
 
         Args:
             totals: A set of integers with the current totals in the player's
                 hand.
-            card: A Card instance whose value is to be added to the totals.
+            card: A Card instance or integer card code whose value is to be
+                added to the totals.
 
         Returns:
             A set of integers with the new totals in the player's hand.
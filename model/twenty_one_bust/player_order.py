@@ -0,0 +1,171 @@
+"""Contains class for the order players take their turns in a game of 21 Bust.
+
+Classes:
+
+    PlayerOrder
+
+Typical usage examples:
+
+    players = PlayerOrder()
+
+    players.append(Player(0, "John"))
+
+    players.rotate(players.index(winner))
+
+    first_player = players[0]
+"""
+
+from itertools import chain, islice
+from typing import Iterable, Iterator, Union
+
+from model.twenty_one_bust.player import Player
+
+
+class PlayerOrder:
+    """Players in the order they take their turns, as a ring buffer.
+
+    Players are held in a list that is never reordered.  An offset into the
+    list marks the first player, so moving a different player to the front
+    only changes the offset.  Each player's position in the list is kept in
+    a dictionary, so finding a player does not search the list.  Players are
+    looked up by the Player instance, as ids are not always unique.
+
+    Reads behave like a list in turn order: indexing, len, iteration and
+    index.  Adding or removing players puts the list back in turn order
+    first, so is O(n), but is only done between games.
+    """
+
+    def __init__(self, players: Union[Iterable[Player], None] = None):
+        """Initializes instance.
+
+        Args:
+            players: Player instances in turn order.  Default of None
+                starts with no players.
+        """
+        self._players: list[Player] = []
+        self._positions: dict[Player, int] = {}
+        self._offset = 0
+        if players is not None:
+            self.extend(players)
+
+    def __len__(self) -> int:
+        """Number of players."""
+        return len(self._players)
+
+    def __getitem__(self, index: int) -> Player:
+        """Get the player at index in turn order.
+
+        Args:
+            index: An integer from 0 for the first player.  Negative indexes
+                count back from the last player.
+
+        Raises:
+            IndexError: If index is out of range.
+        """
+        players = self._players
+        count = len(players)
+        if index < 0:
+            index += count
+        if index < 0 or index >= count:
+            raise IndexError("player index out of range")
+        # a negative list index wraps round to the start of the list
+        return players[self._offset + index - count]
+
+    def __iter__(self) -> Iterator[Player]:
+        """Iterate over the players in turn order."""
+        players = self._players
+        offset = self._offset
+        if offset == 0:
+            return iter(players)
+        return chain(islice(players, offset, None), islice(players, offset))
+
+    def __contains__(self, player: object) -> bool:
+        """Check if a player is in this order."""
+        return player in self._positions
+
+    def __eq__(self, other: object) -> bool:
+        """Compare players in turn order with another PlayerOrder or list."""
+        if isinstance(other, (PlayerOrder, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Players in turn order."""
+        return "PlayerOrder(%r)" % (list(self))
+
+    def index(self, player: Player) -> int:
+        """Get the index of a player in turn order.
+
+        Args:
+            player: A Player instance in this order.
+
+        Returns:
+            An integer from 0 for the first player.
+
+        Raises:
+            ValueError: If player is not in this order.
+        """
+        position = self._positions.get(player)
+        if position is None:
+            raise ValueError("player is not in this order")
+        return (position - self._offset) % len(self._players)
+
+    def rotate(self, first_index: int):
+        """Move the player at first_index to the front of the order.
+
+        Other players keep the same positions relative to each other.
+
+        Args:
+            first_index: An integer equal to the index in turn order of the
+                player who should go first.
+        """
+        if self._players:
+            self._offset = (self._offset + first_index) % len(self._players)
+
+    def append(self, player: Player):
+        """Add a player to the end of the order.
+
+        Args:
+            player: The Player instance to add.
+        """
+        self._unrotate()
+        self._positions[player] = len(self._players)
+        self._players.append(player)
+
+    def extend(self, players: Iterable[Player]):
+        """Add players to the end of the order.
+
+        Args:
+            players: Player instances to add, in turn order.
+        """
+        for player in players:
+            self.append(player)
+
+    def remove(self, player: Player):
+        """Remove a player from the order.
+
+        Args:
+            player: The Player instance to remove.
+
+        Raises:
+            ValueError: If player is not in this order.
+        """
+        if player not in self._positions:
+            raise ValueError("player is not in this order")
+        self._unrotate()
+        self._players.remove(player)
+        self._positions = {
+            player: position for position, player in enumerate(self._players)
+        }
+
+    def _unrotate(self):
+        """Reorder the list to turn order and reset the offset to 0."""
+        offset = self._offset
+        if offset:
+            players = self._players
+            self._players = players[offset:] + players[:offset]
+            self._positions = {
+                player: position
+                for position, player in enumerate(self._players)
+            }
+            self._offset = 0
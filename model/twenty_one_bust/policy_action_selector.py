@@ -0,0 +1,85 @@
+"""Contains class for a player's table driven action selector in 21 Bust.
+
+Classes:
+
+    PolicyActionSelector
+
+Typical usage examples:
+
+    player = Player(1, "John", PolicyActionSelector())
+
+    stick = player.action_selector.should_stick(
+
+        player.best_total,
+
+        game.game_stats,
+
+        player.soft
+
+    )
+"""
+
+from typing import Union
+
+from model.twenty_one_bust.action_selector import ActionSelector
+from model.twenty_one_bust.game_stats import GameStats
+from model.twenty_one_bust.policy_table import PolicyTable, load_default
+
+
+class PolicyActionSelector(ActionSelector):
+    """Decision making Class for app controlled 21 Bust players using a table.
+
+    Looks up whether to stick in a PolicyTable generated by value iteration,
+    using the player's best total, whether it is soft, and how many players
+    have yet to finish, have gone bust and the best total of those who stuck.
+
+    Attributes:
+        low_target: Not used, set to 21.
+        high_target: Not used, set to 21.
+        decisions: The nested tuples of decisions from the PolicyTable.
+        max_players: An integer equal to the most players in a game covered
+            by the PolicyTable.
+    """
+
+    def __init__(self, policy_table: Union[PolicyTable, None] = None):
+        """Initializes instance.
+
+        Args:
+            policy_table: A PolicyTable to take decisions from.  Default of
+                None uses the table shipped with the package, loaded once and
+                shared by every instance.
+        """
+        ActionSelector.__init__(self, 21, 21)
+        if policy_table is None:
+            policy_table = load_default()
+        self.decisions = policy_table.decisions
+        self.max_players = policy_table.max_players
+
+    def should_stick(
+        self, best_total: int, game_stats: GameStats, soft: bool = False
+    ) -> bool:
+        """Decides if a player should stick.
+
+        Args:
+            best_total: An integer representing current best total in the
+                player's hand.
+            game_stats: A GameStats instance show how many players are
+                sticking, have gone bust or are yet to complete their turn and
+                the best total of those sticking.
+            soft: A boolean set to True when best_total counts an ace as 11.
+
+        Returns:
+            A boolean set True is the player should stick and False when they
+                should twist.
+        """
+        try:
+            return self.decisions[best_total][soft][
+                game_stats.unfinished_count
+            ][game_stats.bust_count][game_stats.best_stuck_total]
+        except IndexError:
+            # more players than the table covers, treat as the largest game
+            return self.decisions[best_total][soft][
+                min(game_stats.unfinished_count, self.max_players)
+            ][min(game_stats.bust_count, self.max_players - 1)][
+                game_stats.best_stuck_total
+            ]
@@ -0,0 +1,377 @@
+"""Contains class for a table of stick or twist decisions in 21 Bust.
+
+The table is generated offline by value iteration, saved to a compact binary
+file and loaded at startup.  Run this module to regenerate the default
+table:
+
+    python -m model.twenty_one_bust.policy_table
+
+Classes:
+
+    PolicyTable
+
+Functions:
+
+    load_default() -> PolicyTable
+
+Constants:
+
+    DEFAULT_PATH
+
+Typical usage examples:
+
+    table = PolicyTable.generate()
+
+    table.save("policy_table.bin")
+
+    table = PolicyTable.load("policy_table.bin")
+
+    stick = table.decisions[best_total][soft][unfinished][bust][stuck_total]
+"""
+
+import os
+import struct
+from fractions import Fraction
+from functools import lru_cache
+from typing import Any, Tuple, Union
+
+from model.twenty_one_bust.odds import BUST, final_total_distribution
+
+# default table shipped with the package
+DEFAULT_PATH = os.path.join(os.path.dirname(__file__), "policy_table.bin")
+
+# magic bytes, version, then the size of each of the 5 dimensions
+_HEADER = struct.Struct("<4sB5B")
+_MAGIC = b"21BP"
+_VERSION = 1
+
+# best totals and best stuck totals are indexed 0 to 21
+_TOTALS = 22
+
+# counts of each game value, aces (1) to tens and picture cards (10)
+_FULL_DECK: Tuple[int, ...] = (4, 4, 4, 4, 4, 4, 4, 4, 4, 16)
+
+Decisions = Tuple[Tuple[Tuple[Tuple[Tuple[bool, ...], ...], ...], ...], ...]
+
+
+class PolicyTable:
+    """A table of whether to stick for every state of a 21 Bust turn.
+
+    Decisions are indexed, in order, by the player's best total (0 to 21),
+    whether the best total is soft (0 or 1), the unfinished_count of the
+    GameStats (players yet to finish, including this player), the
+    bust_count of the GameStats and the best total of the players who have
+    stuck (0 to 21).  The nested tuples are indexed directly so a decision is
+    found without any arithmetic.
+
+    Attributes:
+        max_players: An integer equal to the most players in a game covered
+            by the table.
+        decisions: Nested tuples of booleans set to True to stick.
+    """
+
+    def __init__(self, max_players: int, decisions: Decisions):
+        """Initializes instance.
+
+        Args:
+            max_players: An integer equal to the most players in a game
+                covered by decisions.
+            decisions: Nested tuples of booleans set to True to stick.
+        """
+        self.max_players = max_players
+        self.decisions = decisions
+
+    @classmethod
+    def generate(
+        cls, max_players: int = 8, opponent_threshold: int = 17
+    ) -> "PolicyTable":
+        """Generate a table by value iteration over the rules of 21 Bust.
+
+        Each state is valued by the chance of this player winning.  Sticking
+        wins if this player's total is at least the best stuck total and no
+        player yet to play beats it.  Players yet to play are modelled as
+        drawing from a full deck until they reach opponent_threshold.  Cards
+        this player draws are taken from a full deck.  Twisting is valued by
+        the expected value of the state it leads to, iterated until the
+        values stop changing.  The bust_count does not change these odds, so
+        decisions are the same for every bust_count.
+
+        Args:
+            max_players: An integer equal to the most players in a game to
+                cover.
+            opponent_threshold: An integer best total at which the modelled
+                players yet to play stick.
+
+        Returns:
+            A new PolicyTable.
+        """
+        beaten = _opponent_not_above(opponent_threshold)
+        card_odds = [count / sum(_FULL_DECK) for count in _FULL_DECK]
+
+        # by_state[best_total][soft][unfinished][stuck_total]
+        by_state = [
+            [
+                [[False] * _TOTALS for unfinished in range(max_players + 1)]
+                for soft in range(2)
+            ]
+            for best_total in range(_TOTALS)
+        ]
+        for unfinished in range(1, max_players + 1):
+            for stuck_total in range(_TOTALS):
+                sticks = _solve_turn(
+                    beaten, card_odds, unfinished - 1, stuck_total
+                )
+                for (best_total, soft), stick in sticks.items():
+                    by_state[best_total][soft][unfinished][stuck_total] = stick
+
+        decisions = tuple(
+            tuple(
+                tuple(
+                    tuple(
+                        tuple(by_state[best_total][soft][unfinished])
+                        for bust in range(max_players)
+                    )
+                    for unfinished in range(max_players + 1)
+                )
+                for soft in range(2)
+            )
+            for best_total in range(_TOTALS)
+        )
+        return cls(max_players, decisions)
+
+    def save(self, path: str):
+        """Write this table to a compact binary file.
+
+        The file holds a header then one bit per decision.
+
+        Args:
+            path: A string with the path of the file to write.
+        """
+        shape = (
+            _TOTALS,
+            2,
+            self.max_players + 1,
+            self.max_players,
+            _TOTALS,
+        )
+        bits = bytearray((_count(shape) + 7) // 8)
+        for index, stick in enumerate(_flatten(self.decisions)):
+            if stick:
+                bits[index >> 3] |= 1 << (index & 7)
+
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, _VERSION, *shape))
+            file.write(bits)
+
+    @classmethod
+    def load(cls, path: str) -> "PolicyTable":
+        """Read a table from a file written by save.
+
+        Args:
+            path: A string with the path of the file to read.
+
+        Returns:
+            A new PolicyTable.
+
+        Raises:
+            ValueError: If the file is not a policy table.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+
+        magic, version, *shape = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("%s is not a policy table file" % (path))
+        header_size = _HEADER.size
+        bits = data[header_size:]
+        if len(bits) != (_count(shape) + 7) // 8:
+            raise ValueError("%s is not a policy table file" % (path))
+
+        flat = [
+            bool(bits[index >> 3] & (1 << (index & 7)))
+            for index in range(_count(shape))
+        ]
+        return cls(shape[3], _nest(flat, shape))
+
+
+@lru_cache(maxsize=None)
+def load_default() -> PolicyTable:
+    """Load the PolicyTable shipped with the package once and share it.
+
+    Returns:
+        The default PolicyTable.
+    """
+    return PolicyTable.load(DEFAULT_PATH)
+
+
+def _opponent_not_above(threshold: int) -> list[float]:
+    """Chance of one player yet to play not beating each total.
+
+    Args:
+        threshold: An integer best total at which the player sticks.
+
+    Returns:
+        A list indexed by total of the chance the player goes bust or
+            finishes with that total or less.
+    """
+    final_totals: dict[int, Fraction] = {}
+    card_count = sum(_FULL_DECK)
+    for first in range(10):
+        for second in range(10):
+            counts: list[int] = list(_FULL_DECK)
+            odds = Fraction(counts[first], card_count)
+            counts[first] -= 1
+            odds *= Fraction(counts[second], card_count - 1)
+            counts[second] -= 1
+            if odds == 0:
+                continue
+
+            distribution = final_total_distribution(
+                first + second + 2,
+                first == 0 or second == 0,
+                tuple(counts),
+                threshold,
+            )
+            for total, probability in distribution.items():
+                final_totals[total] = (
+                    final_totals.get(total, Fraction(0)) + odds * probability
+                )
+
+    not_above = []
+    for total in range(_TOTALS):
+        probability = final_totals.get(BUST, Fraction(0))
+        probability += sum(
+            final_totals.get(lower, Fraction(0)) for lower in range(total + 1)
+        )
+        not_above.append(float(probability))
+    return not_above
+
+
+def _solve_turn(
+    beaten: list[float],
+    card_odds: list[float],
+    waiting: int,
+    stuck_total: int,
+) -> dict[Tuple[int, int], bool]:
+    """Value iteration for one player's turn.
+
+    Args:
+        beaten: A list indexed by total of the chance a player yet to play
+            does not beat it.
+        card_odds: A list of the chance of drawing each game value 1 to 10.
+        waiting: An integer equal to the number of players yet to play.
+        stuck_total: An integer equal to the best total of players who have
+            stuck.
+
+    Returns:
+        A dictionary mapping each (best_total, soft) to True to stick.
+    """
+    states = [
+        (best_total, soft)
+        for best_total in range(_TOTALS)
+        for soft in range(2)
+        if not soft or best_total >= 11
+    ]
+
+    stick_values = {}
+    for best_total, soft in states:
+        if best_total >= stuck_total:
+            stick_values[(best_total, soft)] = beaten[best_total] ** waiting
+        else:
+            stick_values[(best_total, soft)] = 0.0
+
+    values = dict(stick_values)
+    changed = True
+    while changed:
+        changed = False
+        for state in states:
+            value = max(
+                stick_values[state], _twist_value(values, card_odds, state)
+            )
+            if value != values[state]:
+                values[state] = value
+                changed = True
+
+    return {
+        state: stick_values[state] >= _twist_value(values, card_odds, state)
+        for state in states
+    }
+
+
+def _twist_value(
+    values: dict[Tuple[int, int], float],
+    card_odds: list[float],
+    state: Tuple[int, int],
+) -> float:
+    """Expected value of twisting from a state.
+
+    Args:
+        values: A dictionary mapping each (best_total, soft) to its value.
+        card_odds: A list of the chance of drawing each game value 1 to 10.
+        state: The (best_total, soft) tuple to twist from.
+
+    Returns:
+        A float, the chance of winning after twisting.
+    """
+    twist_value = 0.0
+    for index, odds in enumerate(card_odds):
+        next_state = _draw(state[0], state[1], index + 1)
+        if next_state is not None:
+            twist_value += odds * values[next_state]
+    return twist_value
+
+
+def _draw(
+    best_total: int, soft: int, value: int
+) -> Union[Tuple[int, int], None]:
+    """Get the (best_total, soft) state after drawing a card.
+
+    Args:
+        best_total: An integer equal to the current best total.
+        soft: 1 when best_total counts an ace as 11, else 0.
+        value: An integer game value of the card drawn, 1 for an ace.
+
+    Returns:
+        The next (best_total, soft) tuple, or None when bust.
+    """
+    hard_total = best_total - 10 if soft else best_total
+    has_ace = soft or value == 1
+    hard_total += value
+    if hard_total > 21:
+        return None
+    if has_ace and hard_total <= 11:
+        return (hard_total + 10, 1)
+    return (hard_total, 0)
+
+
+def _count(shape) -> int:
+    """Number of decisions in a table of this shape."""
+    count = 1
+    for size in shape:
+        count *= size
+    return count
+
+
+def _flatten(nested):
+    """Yield the booleans of nested tuples in index order."""
+    if isinstance(nested, bool):
+        yield nested
+    else:
+        for item in nested:
+            yield from _flatten(item)
+
+
+def _nest(flat: list[bool], shape) -> Any:
+    """Build nested tuples of the given shape from a flat list."""
+    if len(shape) == 1:
+        return tuple(flat)
+    size = len(flat) // shape[0]
+    nested = []
+    for start in range(0, len(flat), size):
+        end = start + size
+        nested.append(_nest(flat[start:end], shape[1:]))
+    return tuple(nested)
+
+
+if __name__ == "__main__":
+    PolicyTable.generate().save(DEFAULT_PATH)
@@ -0,0 +1,468 @@
+"""Contains classes and functions to analyse recorded rounds with NumPy.
+
+Results are held in columns, one array for each field with an element for
+each player in each round, so rates and distributions are counted with
+NumPy rather than a loop in Python over every round.
+
+Classes:
+
+    RoundColumns
+
+    ConfigSummary
+
+    RoundAggregator
+
+    ParquetRoundWriter
+
+Functions:
+
+    read_rounds(path, session_id, chunk_rows) -> Iterator[RoundColumns]
+
+    save_npz(columns: RoundColumns, path: str)
+
+    load_npz(path: str) -> RoundColumns
+
+    save_parquet(columns: RoundColumns, path: str)
+
+Constants:
+
+    NO_TARGET
+
+    TOTAL_COUNT
+
+Typical usage examples:
+
+    aggregator = RoundAggregator()
+
+    for columns in read_rounds("21bust.db"):
+        aggregator.add(columns)
+
+    for summary in aggregator.summaries():
+        print(summary.low_target, summary.high_target, summary.win_rate)
+
+    save_npz(RoundColumns.from_batch(engine.play(10000), targets), "b.npz")
+"""
+
+import pathlib
+import sqlite3
+from typing import Any, Iterable, Iterator, NamedTuple, Tuple, Union
+
+import numpy
+import numpy.typing
+
+from model.twenty_one_bust.batch_engine import BatchResult
+from model.twenty_one_bust.player_state import PlayerState
+
+# low_target and high_target of players without an ActionSelector
+NO_TARGET = -1
+
+# best totals are counted from 0 up to 31, the highest a hand can reach
+TOTAL_COUNT = 32
+
+# targets are counted from NO_TARGET up to TOTAL_COUNT - 1
+_TARGET_COUNT = TOTAL_COUNT + 1
+
+_STATE_CASE = "CASE results.state %s ELSE 0 END" % (
+    " ".join(
+        "WHEN '%s' THEN %d" % (state.name, state.value)
+        for state in PlayerState
+    )
+)
+
+_SELECT_RESULTS = (
+    "SELECT results.session_id, results.round, results.player_id,"
+    " results.best_total, %s, results.card_count, results.won,"
+    " COALESCE(players.low_target, %d), COALESCE(players.high_target, %d)"
+    " FROM results JOIN players USING (session_id, player_id)"
+    % (_STATE_CASE, NO_TARGET, NO_TARGET)
+)
+
+# the order of the primary key of results, so no sort is needed
+_ORDER = " ORDER BY results.session_id, results.round, results.player_id"
+
+
+class RoundColumns:
+    """The result of each player in a number of rounds, as columns.
+
+    Each attribute is a one dimensional array with an element for each
+    player in each round, ordered by session, round then player.
+
+    Attributes:
+        session_id: An array of the id of the session of each round.
+        round: An array of the number of each round in its session.
+        player_id: An array of the id of each player.
+        best_total: An array of the best total of each player's hand.
+        state: An array of the PlayerState value each player ended in.
+        cards_drawn: An array of the number of cards in each player's hand.
+        winner: An array of booleans set to True for each player who won.
+        low_target: An array of the low_target of each player's
+            ActionSelector, or NO_TARGET.
+        high_target: An array of the high_target of each player's
+            ActionSelector, or NO_TARGET.
+    """
+
+    FIELDS = (
+        ("session_id", numpy.int32),
+        ("round", numpy.int32),
+        ("player_id", numpy.int32),
+        ("best_total", numpy.int8),
+        ("state", numpy.int8),
+        ("cards_drawn", numpy.int8),
+        ("winner", numpy.bool_),
+        ("low_target", numpy.int8),
+        ("high_target", numpy.int8),
+    )
+
+    session_id: numpy.ndarray
+    round: numpy.ndarray
+    player_id: numpy.ndarray
+    best_total: numpy.ndarray
+    state: numpy.ndarray
+    cards_drawn: numpy.ndarray
+    winner: numpy.ndarray
+    low_target: numpy.ndarray
+    high_target: numpy.ndarray
+
+    def __init__(self, **columns: numpy.typing.ArrayLike):
+        """Initializes instance.
+
+        Args:
+            columns: An array, or anything numpy.asarray accepts, for each
+                of the names in FIELDS, all the same length.  Converted to
+                the type in FIELDS.
+
+        Raises:
+            ValueError: If a column is missing or the lengths differ.
+        """
+        length = None
+        for name, dtype in self.FIELDS:
+            if name not in columns:
+                raise ValueError("missing column %s" % (name))
+            column = numpy.asarray(columns[name], dtype=dtype)
+            if length is None:
+                length = len(column)
+            elif len(column) != length:
+                raise ValueError("columns must all be the same length")
+            setattr(self, name, column)
+
+    def __len__(self) -> int:
+        """Number of player results."""
+        return len(self.player_id)
+
+    def columns(self) -> dict[str, numpy.ndarray]:
+        """Get every column by name.
+
+        Returns:
+            A dictionary of arrays keyed by the names in FIELDS.
+        """
+        return {name: getattr(self, name) for name, dtype in self.FIELDS}
+
+    @classmethod
+    def concatenate(cls, parts: Iterable["RoundColumns"]) -> "RoundColumns":
+        """Join RoundColumns end to end.
+
+        Args:
+            parts: RoundColumns instances, such as those from read_rounds.
+
+        Returns:
+            A RoundColumns with the results of every part.
+        """
+        parts = list(parts)
+        return cls(
+            **{
+                name: numpy.concatenate(
+                    [getattr(part, name) for part in parts]
+                    or [numpy.zeros(0, dtype)]
+                )
+                for name, dtype in cls.FIELDS
+            }
+        )
+
+    @classmethod
+    def from_batch(
+        cls,
+        batch: BatchResult,
+        targets: list[Tuple[int, int]],
+        session_id: int = 0,
+        first_round: int = 1,
+    ) -> "RoundColumns":
+        """Get the columns of the games played by a BatchEngine.
+
+        Each table is one round.
+
+        Args:
+            batch: A BatchResult from BatchEngine.play.
+            targets: The list of (low_target, high_target) tuples the
+                BatchEngine was created with.
+            session_id: An integer to put in the session_id column.
+            first_round: An integer equal to the round number of the first
+                table.
+
+        Returns:
+            A RoundColumns with a result for each player at each table.
+        """
+        tables, player_count = batch.best_totals.shape
+        low_targets = numpy.array([target[0] for target in targets])
+        high_targets = numpy.array([target[1] for target in targets])
+        return cls(
+            session_id=numpy.full(tables * player_count, session_id),
+            round=numpy.repeat(
+                numpy.arange(first_round, first_round + tables), player_count
+            ),
+            player_id=numpy.tile(numpy.arange(player_count), tables),
+            best_total=batch.best_totals.ravel(),
+            state=batch.states.ravel(),
+            cards_drawn=batch.cards_drawn.ravel(),
+            winner=batch.winners.ravel(),
+            low_target=numpy.tile(low_targets, tables),
+            high_target=numpy.tile(high_targets, tables),
+        )
+
+
+def read_rounds(
+    path: str,
+    session_id: Union[int, None] = None,
+    chunk_rows: int = 65536,
+) -> Iterator[RoundColumns]:
+    """Read the results recorded by a SessionStore in chunks.
+
+    The database is opened read only, so can be read while a SessionStore
+    is still writing to it.
+
+    Args:
+        path: A string for the path of the SessionStore database.
+        session_id: An integer id of the session to read.  Default of None
+            reads every session.
+        chunk_rows: An integer equal to the most player results in each
+            RoundColumns.
+
+    Yields:
+        A RoundColumns for each chunk of results, in order of session, round
+            then player.
+    """
+    uri = pathlib.Path(path).resolve().as_uri() + "?mode=ro"
+    connection = sqlite3.connect(uri, uri=True)
+    try:
+        if session_id is None:
+            cursor = connection.execute(_SELECT_RESULTS + _ORDER)
+        else:
+            cursor = connection.execute(
+                _SELECT_RESULTS + " WHERE session_id = ?" + _ORDER,
+                (session_id,),
+            )
+
+        while True:
+            rows = cursor.fetchmany(chunk_rows)
+            if not rows:
+                return
+            table = numpy.array(rows, dtype=numpy.int64)
+            yield RoundColumns(
+                **{
+                    name: table[:, index]
+                    for index, (name, dtype) in enumerate(RoundColumns.FIELDS)
+                }
+            )
+    finally:
+        connection.close()
+
+
+class ConfigSummary(NamedTuple):
+    """The results of the players using one ActionSelector configuration.
+
+    Attributes:
+        low_target: An integer, the low_target of the ActionSelector or
+            NO_TARGET.
+        high_target: An integer, the high_target of the ActionSelector or
+            NO_TARGET.
+        results: An integer equal to the number of player results.
+        wins: An integer equal to the number of results that won.
+        busts: An integer equal to the number of results that went bust.
+        total_counts: An array of TOTAL_COUNT integers, the number of
+            results with each best total.
+    """
+
+    low_target: int
+    high_target: int
+    results: int
+    wins: int
+    busts: int
+    total_counts: numpy.ndarray
+
+    @property
+    def win_rate(self) -> float:
+        """The fraction of results that won."""
+        return self.wins / self.results if self.results else 0.0
+
+    @property
+    def bust_rate(self) -> float:
+        """The fraction of results that went bust."""
+        return self.busts / self.results if self.results else 0.0
+
+
+class RoundAggregator:
+    """Counts results by ActionSelector configuration, a chunk at a time.
+
+    Counts are kept in arrays indexed by low_target and high_target, so
+    each chunk is added with a few calls to numpy.bincount.  Results of any
+    number of chunks can be added without keeping the chunks.  Targets
+    must be below TOTAL_COUNT, as those of an ActionSelector are.
+
+    Attributes:
+        results: An array of the number of results of each configuration.
+        wins: An array of the number of wins of each configuration.
+        busts: An array of the number of busts of each configuration.
+        total_counts: An array of the number of results with each best
+            total for each configuration.
+    """
+
+    def __init__(self):
+        """Initializes instance with no results."""
+        shape = (_TARGET_COUNT, _TARGET_COUNT)
+        self.results = numpy.zeros(shape, dtype=numpy.int64)
+        self.wins = numpy.zeros(shape, dtype=numpy.int64)
+        self.busts = numpy.zeros(shape, dtype=numpy.int64)
+        self.total_counts = numpy.zeros(
+            shape + (TOTAL_COUNT,), dtype=numpy.int64
+        )
+
+    def add(self, columns: RoundColumns):
+        """Count the results in a RoundColumns.
+
+        Args:
+            columns: The RoundColumns to add.
+        """
+        size = _TARGET_COUNT * _TARGET_COUNT
+        low = columns.low_target.astype(numpy.int64) - NO_TARGET
+        high = columns.high_target.astype(numpy.int64) - NO_TARGET
+        configs = low * _TARGET_COUNT + high
+        shape = self.results.shape
+        self.results += numpy.bincount(configs, minlength=size).reshape(shape)
+        self.wins += numpy.bincount(
+            configs[columns.winner], minlength=size
+        ).reshape(shape)
+        self.busts += numpy.bincount(
+            configs[columns.state == PlayerState.BUST.value], minlength=size
+        ).reshape(shape)
+
+        totals = numpy.clip(columns.best_total, 0, TOTAL_COUNT - 1)
+        self.total_counts += numpy.bincount(
+            configs * TOTAL_COUNT + totals, minlength=size * TOTAL_COUNT
+        ).reshape(self.total_counts.shape)
+
+    def summaries(self) -> list[ConfigSummary]:
+        """Get the results of each configuration with any results.
+
+        Returns:
+            A list of ConfigSummary instances, ordered by low_target then
+                high_target.
+        """
+        summaries = []
+        for low_index, high_index in zip(*numpy.nonzero(self.results)):
+            summaries.append(
+                ConfigSummary(
+                    int(low_index) + NO_TARGET,
+                    int(high_index) + NO_TARGET,
+                    int(self.results[low_index, high_index]),
+                    int(self.wins[low_index, high_index]),
+                    int(self.busts[low_index, high_index]),
+                    self.total_counts[low_index, high_index].copy(),
+                )
+            )
+        return summaries
+
+
+def save_npz(columns: RoundColumns, path: str):
+    """Save RoundColumns to a compressed NumPy .npz file.
+
+    Args:
+        columns: The RoundColumns to save.
+        path: A string for the path of the file.
+    """
+    arrays: dict[str, Any] = columns.columns()
+    numpy.savez_compressed(path, **arrays)
+
+
+def load_npz(path: str) -> RoundColumns:
+    """Load RoundColumns saved by save_npz.
+
+    Args:
+        path: A string for the path of the file.
+
+    Returns:
+        The RoundColumns saved in the file.
+    """
+    with numpy.load(path) as data:
+        return RoundColumns(
+            **{name: data[name] for name, dtype in RoundColumns.FIELDS}
+        )
+
+
+class ParquetRoundWriter:
+    """Writes RoundColumns to a Parquet file a chunk at a time.
+
+    Each chunk is written as it is given, so results of any number of
+    chunks can be saved without holding them all in memory.  pyarrow is
+    only imported when an instance is created, so it is not needed to
+    save .npz files.
+
+    Attributes:
+        path: A string for the path of the file.
+    """
+
+    def __init__(self, path: str):
+        """Initializes instance, creating the file.
+
+        Args:
+            path: A string for the path of the file.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        import pyarrow
+        import pyarrow.parquet
+
+        self.path = path
+        self._pyarrow = pyarrow
+        self._schema = pyarrow.schema(
+            [
+                (name, pyarrow.from_numpy_dtype(numpy.dtype(dtype)))
+                for name, dtype in RoundColumns.FIELDS
+            ]
+        )
+        self._writer = pyarrow.parquet.ParquetWriter(
+            path, self._schema, compression="zstd"
+        )
+
+    def write(self, columns: RoundColumns):
+        """Write the results in a RoundColumns.
+
+        Args:
+            columns: The RoundColumns to write.
+        """
+        self._writer.write_table(
+            self._pyarrow.table(columns.columns(), schema=self._schema)
+        )
+
+    def close(self):
+        """Finish the file."""
+        self._writer.close()
+
+    def __enter__(self) -> "ParquetRoundWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def save_parquet(columns: RoundColumns, path: str):
+    """Save RoundColumns to a Parquet file.
+
+    Args:
+        columns: The RoundColumns to save.
+        path: A string for the path of the file.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    with ParquetRoundWriter(path) as writer:
+        writer.write(columns)
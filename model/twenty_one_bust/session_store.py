@@ -0,0 +1,352 @@
+"""Contains class to keep the results of games of 21 Bust in SQLite.
+
+Classes:
+
+    SessionStore
+
+Typical usage examples:
+
+    store = SessionStore("21bust.db")
+
+    session_id = store.start_session(game.name)
+
+    store.record_round(session_id, game.players, winners)
+
+    print(store.win_counts())
+
+    store.close()
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+from typing import Iterable, Tuple, Union
+
+from model.twenty_one_bust.player import Player
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    started REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS players (
+    session_id INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    low_target INTEGER,
+    high_target INTEGER,
+    PRIMARY KEY (session_id, player_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS rounds (
+    session_id INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    winner_count INTEGER NOT NULL,
+    winning_total INTEGER NOT NULL,
+    PRIMARY KEY (session_id, round)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS results (
+    session_id INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    best_total INTEGER NOT NULL,
+    card_count INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    PRIMARY KEY (session_id, round, player_id)
+) WITHOUT ROWID;
+"""
+
+_INSERT_PLAYER = "INSERT OR REPLACE INTO players VALUES (?, ?, ?, ?, ?)"
+_INSERT_ROUND = "INSERT INTO rounds VALUES (?, ?, ?, ?)"
+_INSERT_RESULT = "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+# the player, round and result rows written in one transaction
+_Batch = Tuple[
+    list[Tuple[int, int, str, Union[int, None], Union[int, None]]],
+    list[Tuple[int, int, int, int]],
+    list[Tuple[int, int, int, str, int, int, int]],
+]
+
+
+class SessionStore:
+    """Results of rounds of 21 Bust kept in an SQLite database.
+
+    A session is one run of a Game, such as one ConsoleController run or
+    one table of a TableServer.  Each round records the outcome and a row
+    for each player, with their state, best total, number of cards and if
+    they won.  The low_target and high_target of each player's
+    ActionSelector are kept with their name, or NULL for user controlled
+    players.
+
+    Recording a round only adds rows to lists in memory.  Every
+    batch_rounds rounds they are written with executemany in a single
+    transaction, so each insert statement is prepared once per batch rather
+    than once per row.  The database uses write ahead logging, so readers do
+    not block the writer, with synchronous NORMAL so a commit does not wait
+    for the disk.
+
+    With background set, batches are handed to a writer thread instead, so
+    recording a round never waits for the database.  This suits an asyncio
+    event loop, where a write would pause every task.  Queries and close
+    wait for the batches handed over so far to be written.
+
+    Attributes:
+        path: The path of the database file, or ":memory:".
+        batch_rounds: An integer equal to the number of rounds recorded
+            before they are written.
+        background: A boolean set to True if batches are written by a
+            writer thread.
+        connection: The sqlite3.Connection to the database.
+    """
+
+    def __init__(
+        self, path: str, batch_rounds: int = 100, background: bool = False
+    ):
+        """Initializes instance.
+
+        Opens the database, creating its tables if they do not exist.
+
+        Args:
+            path: A string for the path of the database file, or ":memory:"
+                for a database that is not saved.
+            batch_rounds: An integer equal to the number of rounds recorded
+                before they are written.
+            background: A boolean set to True to write batches in a writer
+                thread rather than the thread recording rounds.
+        """
+        self.path = path
+        self.batch_rounds = batch_rounds
+        self.background = background
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+        self._round_counts: dict[int, int] = {}
+        self._player_ids: dict[int, set[int]] = {}
+        self._players: list[
+            Tuple[int, int, str, Union[int, None], Union[int, None]]
+        ] = []
+        self._rounds: list[Tuple[int, int, int, int]] = []
+        self._results: list[Tuple[int, int, int, str, int, int, int]] = []
+        self._lock = threading.Lock()
+        self._batches: queue.Queue[Union[_Batch, None]] = queue.Queue()
+        self._error: Union[Exception, None] = None
+        self._writer: Union[threading.Thread, None] = None
+        if background:
+            self._writer = threading.Thread(
+                target=self._write_batches, name="SessionStore", daemon=True
+            )
+            self._writer.start()
+
+    def start_session(self, name: str) -> int:
+        """Start recording a new session.
+
+        Args:
+            name: A string describing the session, such as the game's name.
+
+        Returns:
+            An integer id for the session, passed to record_round.
+        """
+        with self._lock, self.connection:
+            session_id = self.connection.execute(
+                "SELECT COALESCE(MAX(session_id), 0) + 1 FROM sessions"
+            ).fetchone()[0]
+            self.connection.execute(
+                "INSERT INTO sessions VALUES (?, ?, ?)",
+                (session_id, name, time.time()),
+            )
+        self._round_counts[session_id] = 0
+        self._player_ids[session_id] = set()
+        return session_id
+
+    def record_round(
+        self,
+        session_id: int,
+        players: Iterable[Player],
+        winners: list[Player],
+    ):
+        """Record the result of a round.
+
+        Should be called after the game is resolved and before it is reset.
+        Writes every recorded round once batch_rounds have been recorded.
+
+        Args:
+            session_id: An integer id from start_session.
+            players: The Player instances who played the round.
+            winners: A list of the Player instances who won the round.
+        """
+        round_number = self._round_counts[session_id] + 1
+        self._round_counts[session_id] = round_number
+        player_ids = self._player_ids[session_id]
+        results = self._results
+        for player in players:
+            if player.id not in player_ids:
+                player_ids.add(player.id)
+                selector = player.action_selector
+                self._players.append(
+                    (
+                        session_id,
+                        player.id,
+                        player.name,
+                        getattr(selector, "low_target", None),
+                        getattr(selector, "high_target", None),
+                    )
+                )
+            results.append(
+                (
+                    session_id,
+                    round_number,
+                    player.id,
+                    str(player.state),
+                    player.best_total,
+                    player.hand.card_count(),
+                    player in winners,
+                )
+            )
+        self._rounds.append(
+            (
+                session_id,
+                round_number,
+                len(winners),
+                winners[0].best_total if winners else 0,
+            )
+        )
+        if len(self._rounds) >= self.batch_rounds:
+            self.flush()
+
+    def flush(self):
+        """Write every round recorded so far in a single transaction.
+
+        With background set the rounds are handed to the writer thread,
+        which writes them later.
+
+        Raises:
+            sqlite3.Error: If the writer thread failed to write a batch.
+        """
+        self._raise_error()
+        if not self._rounds and not self._players:
+            return
+        batch = (self._players, self._rounds, self._results)
+        self._players = []
+        self._rounds = []
+        self._results = []
+        if self._writer is None:
+            self._write(batch)
+        else:
+            self._batches.put(batch)
+
+    def _write(self, batch: _Batch):
+        """Write a batch of rows in a single transaction.
+
+        Args:
+            batch: A tuple of the player, round and result rows to insert.
+        """
+        players, rounds, results = batch
+        with self._lock, self.connection:
+            self.connection.executemany(_INSERT_PLAYER, players)
+            self.connection.executemany(_INSERT_ROUND, rounds)
+            self.connection.executemany(_INSERT_RESULT, results)
+
+    def _write_batches(self):
+        """Write the batches handed to the writer thread until given None."""
+        while True:
+            batch = self._batches.get()
+            try:
+                if batch is None:
+                    return
+                self._write(batch)
+            except Exception as error:
+                self._error = error
+            finally:
+                self._batches.task_done()
+
+    def _raise_error(self):
+        """Raise the error the writer thread failed with, if any."""
+        error = self._error
+        if error is not None:
+            self._error = None
+            raise error
+
+    def _wait(self):
+        """Write the rounds recorded so far and wait until they are."""
+        self.flush()
+        self._batches.join()
+        self._raise_error()
+
+    def win_counts(
+        self, session_id: Union[int, None] = None
+    ) -> dict[str, int]:
+        """Count the rounds won by each player.
+
+        Writes the rounds recorded so far first.
+
+        Args:
+            session_id: An integer id from start_session to count the wins
+                of one session.  Default of None counts every session,
+                adding up players with the same name.
+
+        Returns:
+            A dictionary of the number of rounds won, keyed by player name.
+        """
+        self._wait()
+        query = (
+            "SELECT players.name, SUM(results.won) FROM results"
+            " JOIN players USING (session_id, player_id)"
+        )
+        with self._lock:
+            if session_id is None:
+                rows = self.connection.execute(
+                    query + " GROUP BY players.name"
+                )
+            else:
+                rows = self.connection.execute(
+                    query + " WHERE session_id = ? GROUP BY players.name",
+                    (session_id,),
+                )
+            return {name: wins for name, wins in rows}
+
+    def round_count(self, session_id: Union[int, None] = None) -> int:
+        """Count the rounds recorded.
+
+        Writes the rounds recorded so far first.
+
+        Args:
+            session_id: An integer id from start_session to count the rounds
+                of one session.  Default of None counts every session.
+
+        Returns:
+            An integer equal to the number of rounds recorded.
+        """
+        self._wait()
+        with self._lock:
+            if session_id is None:
+                row = self.connection.execute("SELECT COUNT(*) FROM rounds")
+            else:
+                row = self.connection.execute(
+                    "SELECT COUNT(*) FROM rounds WHERE session_id = ?",
+                    (session_id,),
+                )
+            return row.fetchone()[0]
+
+    def close(self):
+        """Write the rounds recorded so far and close the database.
+
+        Raises:
+            sqlite3.Error: If the writer thread failed to write a batch.
+        """
+        try:
+            self._wait()
+        finally:
+            if self._writer is not None:
+                self._batches.put(None)
+                self._writer.join()
+                self._writer = None
+            self.connection.close()
+
+    def __enter__(self) -> "SessionStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,262 @@
+"""Contains classes for searching for the best ActionSelector targets.
+
+Classes:
+
+    CandidateResult
+
+    TargetOptimizer
+
+Typical usage examples:
+
+    optimizer = TargetOptimizer([(12, 16), (15, 18), (17, 20)])
+
+    rungs = optimizer.run(seed=42, workers=4)
+
+    best = rungs[-1][0]
+
+    print(best.low_target, best.high_target, best.win_rate)
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from copy import copy
+from typing import Iterable, Tuple, Union
+
+from model.twenty_one_bust.simulator import SimulationResult
+from model.twenty_one_bust.tournament import Tournament, play_block
+
+
+class CandidateResult:
+    """The games played so far by one candidate pair of targets.
+
+    Attributes:
+        low_target: An integer, the candidate ActionSelector's low_target.
+        high_target: An integer, the candidate ActionSelector's high_target.
+        rounds: An integer equal to the number of games played.
+        wins: An integer equal to the number of games won.
+        bust_count: An integer equal to the number of games gone bust in.
+    """
+
+    def __init__(self, low_target: int, high_target: int):
+        """Initializes instance with no games played.
+
+        Args:
+            low_target: An integer, the candidate's low_target.
+            high_target: An integer, the candidate's high_target.
+        """
+        self.low_target = low_target
+        self.high_target = high_target
+        self.rounds = 0
+        self.wins = 0
+        self.bust_count = 0
+
+    @property
+    def targets(self) -> Tuple[int, int]:
+        """The candidate's (low_target, high_target) tuple."""
+        return self.low_target, self.high_target
+
+    @property
+    def win_rate(self) -> float:
+        """The fraction of games won, 0.0 before any are played."""
+        return self.wins / self.rounds if self.rounds else 0.0
+
+    def merge(self, result: SimulationResult):
+        """Add the games from a block the candidate played as player 0.
+
+        Args:
+            result: A SimulationResult from play_block.
+        """
+        self.rounds += result.rounds
+        self.wins += result.win_counts[0]
+        self.bust_count += result.bust_counts[0]
+
+    def __repr__(self) -> str:
+        return "CandidateResult(%d, %d, rounds=%d, win_rate=%.4f)" % (
+            self.low_target,
+            self.high_target,
+            self.rounds,
+            self.win_rate,
+        )
+
+
+class TargetOptimizer:
+    """Searches ActionSelector targets for the best win rate by halving.
+
+    Each candidate (low_target, high_target) pair plays games as player 0
+    against the same field of opponents.  Candidates are judged in rungs.
+    In the first rung every candidate plays min_rounds games, then only the
+    best 1 / eta of them by win rate go on to the next rung, where they each
+    play eta times as many more games.  This repeats until one candidate
+    remains, so clearly worse candidates stop early and most games are
+    spent telling the best few apart.
+
+    Games are played in blocks, like a Tournament, on a pool of processes.
+    Every candidate plays blocks with the same seeds in each rung, so they
+    face the same shuffled decks and the results only depend on the seed.
+
+    Attributes:
+        opponents: A list of (low_target, high_target) tuples, one for each
+            opponent's ActionSelector.
+        min_rounds: An integer equal to the number of games each candidate
+            plays in the first rung.
+        eta: An integer, the factor candidates are cut by in each rung.
+        block_size: An integer equal to the number of games in each block.
+        numpy_rng: A boolean set to True to play blocks using a NumpyRandom.
+    """
+
+    def __init__(
+        self,
+        opponents: list[Tuple[int, int]],
+        min_rounds: int = 1000,
+        eta: int = 3,
+        block_size: int = 10000,
+        numpy_rng: bool = False,
+    ):
+        """Initializes instance.
+
+        Args:
+            opponents: A list of (low_target, high_target) tuples, one for
+                each opponent's ActionSelector.
+            min_rounds: An integer equal to the number of games each
+                candidate plays in the first rung.
+            eta: An integer, the factor candidates are cut by in each rung.
+            block_size: An integer equal to the number of games in each
+                block.
+            numpy_rng: A boolean set to True to play blocks using a
+                NumpyRandom, which is faster but needs NumPy installed.
+
+        Raises:
+            ValueError: If min_rounds or block_size is less than 1 or eta is
+                less than 2.
+        """
+        if min_rounds < 1:
+            raise ValueError("min_rounds must be 1 or more")
+        if eta < 2:
+            raise ValueError("eta must be 2 or more")
+        if block_size < 1:
+            raise ValueError("block_size must be 1 or more")
+
+        self.opponents = opponents
+        self.min_rounds = min_rounds
+        self.eta = eta
+        self.block_size = block_size
+        self.numpy_rng = numpy_rng
+        self._tournament = Tournament(opponents, block_size, numpy_rng)
+
+    @staticmethod
+    def candidates(
+        low_targets: Iterable[int] = range(12, 19), max_high_target: int = 20
+    ) -> list[Tuple[int, int]]:
+        """Get every pair of targets with high_target above low_target.
+
+        The defaults cover the targets ActionSelector picks at random.
+
+        Args:
+            low_targets: The low_target values to try.
+            max_high_target: An integer, the largest high_target to try.
+
+        Returns:
+            A list of (low_target, high_target) tuples.
+        """
+        return [
+            (low_target, high_target)
+            for low_target in low_targets
+            for high_target in range(low_target + 1, max_high_target + 1)
+        ]
+
+    def run(
+        self,
+        seed: int,
+        workers: Union[int, None] = None,
+        candidates: Union[list[Tuple[int, int]], None] = None,
+    ) -> list[list[CandidateResult]]:
+        """Play rungs of games until one candidate remains.
+
+        Args:
+            seed: An integer master seed.
+            workers: An integer equal to the number of processes to use.
+                Default of None uses one process per core, 1 plays every
+                block in this process.
+            candidates: A list of (low_target, high_target) tuples to
+                search.  Default of None searches those from candidates().
+
+        Returns:
+            A list with copies of the candidates at the end of each rung,
+                best win rate first.  The first of the last rung is the best
+                candidate.
+
+        Raises:
+            ValueError: If there are no candidates.
+        """
+        if candidates is None:
+            candidates = self.candidates()
+        if not candidates:
+            raise ValueError("there must be at least 1 candidate")
+
+        survivors = [CandidateResult(*targets) for targets in candidates]
+        rungs = []
+        rung_rounds = self.min_rounds
+        first_block = 0
+        executor = None if workers == 1 else ProcessPoolExecutor(workers)
+        try:
+            while True:
+                first_block = self.play_rung(
+                    survivors, rung_rounds, seed, first_block, executor
+                )
+                survivors.sort(
+                    key=lambda candidate: (-candidate.win_rate,)
+                    + candidate.targets
+                )
+                rungs.append([copy(candidate) for candidate in survivors])
+                if len(survivors) == 1:
+                    return rungs
+                survivors = survivors[: max(len(survivors) // self.eta, 1)]
+                rung_rounds *= self.eta
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def play_rung(
+        self,
+        candidates: list[CandidateResult],
+        rounds: int,
+        seed: int,
+        first_block: int,
+        executor: Union[Executor, None] = None,
+    ) -> int:
+        """Play the same blocks of games with each candidate.
+
+        Args:
+            candidates: The CandidateResult instances to play and add the
+                results to.
+            rounds: An integer equal to the number of games each candidate
+                plays.
+            seed: An integer master seed.
+            first_block: An integer, the index of the first block, so each
+                rung plays different decks.
+            executor: An Executor to play the blocks on.  Default of None
+                plays them in this process.
+
+        Returns:
+            An integer, the index of the first block of the next rung.
+        """
+        block_rounds = self._tournament.blocks(rounds)
+        block_indexes = range(first_block, first_block + len(block_rounds))
+        args: Tuple[list, ...] = ([], [], [], [], [])
+        owners = []
+        for candidate in candidates:
+            targets = [candidate.targets] + self.opponents
+            for block, index in zip(block_rounds, block_indexes):
+                for arg, value in zip(
+                    args, (targets, block, seed, index, self.numpy_rng)
+                ):
+                    arg.append(value)
+                owners.append(candidate)
+
+        results = (
+            map(play_block, *args)
+            if executor is None
+            else executor.map(play_block, *args)
+        )
+        for candidate, result in zip(owners, results):
+            candidate.merge(result)
+        return block_indexes.stop
@@ -0,0 +1,167 @@
+"""Contains class for running large numbers of 21 Bust games across cores.
+
+Classes:
+
+    Tournament
+
+Functions:
+
+    play_block(targets, rounds, seed, index, numpy_rng) -> SimulationResult
+
+Typical usage examples:
+
+    tournament = Tournament([(12, 16), (15, 18), (17, 20)], numpy_rng=True)
+
+    result = tournament.run(1000000, seed=42, workers=4)
+
+    print(result.win_counts)
+"""
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple, Union
+
+from model.card_game.array_deck import ArrayDeck
+from model.card_game.rng import NumpyRandom, RandomSource
+from model.card_game.suit import Suit
+from model.card_game.value import Value
+from model.twenty_one_bust.action_selector import ActionSelector
+from model.twenty_one_bust.game import Game
+from model.twenty_one_bust.player import Player
+from model.twenty_one_bust.simulator import SimulationResult, Simulator
+
+
+def play_block(
+    targets: list[Tuple[int, int]],
+    rounds: int,
+    seed: int,
+    index: int,
+    numpy_rng: bool = False,
+) -> SimulationResult:
+    """Play a block of games of 21 Bust in a new Game.
+
+    Module level so it can be sent to worker processes.  The game deals from
+    an ArrayDeck.
+
+    Args:
+        targets: A list of (low_target, high_target) tuples, one for each
+            player's ActionSelector.  Player ids are their index in the list.
+        rounds: An integer equal to the number of games to play.
+        seed: An integer master seed.
+        index: An integer equal to the position of this block, combined with
+            seed to give this block its own random number stream.
+        numpy_rng: A boolean set to True to use a NumpyRandom rather than
+            a random.Random.
+
+    Returns:
+        A SimulationResult for the games played.
+    """
+    rng: RandomSource
+    if numpy_rng:
+        rng = NumpyRandom([seed, index])
+    else:
+        rng = random.Random("%d:%d" % (seed, index))
+
+    game = Game("Tournament Game", rng, ArrayDeck("Deck", Value, Suit))
+    for player_id, (low_target, high_target) in enumerate(targets):
+        game.players.append(
+            Player(
+                player_id,
+                "Player %d" % (player_id),
+                ActionSelector(low_target, high_target),
+            )
+        )
+
+    return Simulator(game).run(rounds)
+
+
+class Tournament:
+    """Plays games of 21 Bust between app controlled players on many cores.
+
+    The games are split into blocks of block_size games.  Each block is played
+    in a new Game with its own random number generator seed, made from the
+    master seed and the position of the block.  So the results only depend on
+    the master seed and not on how many workers play the blocks.
+
+    Attributes:
+        targets: A list of (low_target, high_target) tuples, one for each
+            player's ActionSelector.
+        block_size: An integer equal to the number of games in each block.
+        numpy_rng: A boolean set to True to play blocks using a NumpyRandom.
+    """
+
+    def __init__(
+        self,
+        targets: list[Tuple[int, int]],
+        block_size: int = 10000,
+        numpy_rng: bool = False,
+    ):
+        """Initializes instance.
+
+        Args:
+            targets: A list of (low_target, high_target) tuples, one for each
+                player's ActionSelector.
+            block_size: An integer equal to the number of games in each
+                block.
+            numpy_rng: A boolean set to True to play blocks using a
+                NumpyRandom, which is faster but needs NumPy installed.
+
+        Raises:
+            ValueError: If block_size is less than 1.
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be 1 or more")
+
+        self.targets = targets
+        self.block_size = block_size
+        self.numpy_rng = numpy_rng
+
+    def blocks(self, rounds: int) -> list[int]:
+        """Split games into blocks.
+
+        Args:
+            rounds: An integer equal to the total number of games to play.
+
+        Returns:
+            A list of integers with the number of games in each block.
+        """
+        return [
+            min(self.block_size, rounds - start)
+            for start in range(0, rounds, self.block_size)
+        ]
+
+    def run(
+        self, rounds: int, seed: int, workers: Union[int, None] = None
+    ) -> SimulationResult:
+        """Play games of 21 Bust and total up the results.
+
+        Args:
+            rounds: An integer equal to the total number of games to play.
+            seed: An integer master seed.
+            workers: An integer equal to the number of processes to use.
+                Default of None uses one process per core, 1 plays every
+                block in this process.
+
+        Returns:
+            A SimulationResult with the totals for all the games played.
+        """
+        block_rounds = self.blocks(rounds)
+        block_count = len(block_rounds)
+        args = (
+            [self.targets] * block_count,
+            block_rounds,
+            [seed] * block_count,
+            range(block_count),
+            [self.numpy_rng] * block_count,
+        )
+
+        result = SimulationResult(list(range(len(self.targets))))
+        if workers == 1:
+            for block_result in map(play_block, *args):
+                result.merge(block_result)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for block_result in executor.map(play_block, *args):
+                    result.merge(block_result)
+
+        return result
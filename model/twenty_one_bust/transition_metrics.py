@@ -0,0 +1,192 @@
+"""Contains classes and functions to time the state transitions of a game.
+
+Classes:
+
+    TransitionHook
+
+    TransitionMetrics
+
+Functions:
+
+    write_prometheus(metrics: TransitionMetrics, path: str, prefix: str)
+
+Constants:
+
+    TRANSITIONS
+
+    BUCKET_BOUNDS
+
+Typical usage examples:
+
+    metrics = TransitionMetrics()
+
+    game.set_hook(metrics)
+
+    write_prometheus(metrics, "/var/lib/node_exporter/21bust.prom")
+"""
+
+import os
+from typing import Protocol, Tuple
+
+from model.twenty_one_bust.game_state import GameState
+
+# names of the Game methods which change its state
+TRANSITIONS = (
+    "deal",
+    "next_player",
+    "start_turn",
+    "resolve_stick_action",
+    "resolve_twist_action",
+    "resolve",
+    "reset",
+)
+
+# upper bounds in nanoseconds of the histogram buckets, powers of 2 from
+# 256 nanoseconds to 2 ** 23, about 8.4 milliseconds, then everything slower
+_FIRST_BUCKET_BITS = 8
+_BUCKET_COUNT = 17
+BUCKET_BOUNDS = tuple(
+    2 ** (_FIRST_BUCKET_BITS + i) for i in range(_BUCKET_COUNT - 1)
+) + (float("inf"),)
+
+
+class TransitionHook(Protocol):
+    """Interface for a function called after each Game state transition."""
+
+    def __call__(
+        self,
+        transition: str,
+        duration: int,
+        before: GameState,
+        after: GameState,
+    ) -> None:
+        """Receive one transition.
+
+        Args:
+            transition: A string, the name of the Game method called.
+            duration: An integer equal to the nanoseconds the method took.
+            before: The GameState before the method was called.
+            after: The GameState after the method returned.
+        """
+        ...
+
+
+class TransitionMetrics:
+    """TransitionHook counting transitions and timing them in a histogram.
+
+    Each call only increments a few integers, durations are put into
+    buckets by their bit length rather than searching the bounds.
+
+    Attributes:
+        counts: A dictionary of the number of transitions, keyed by a tuple
+            of the transition name and the GameState before and after.
+        buckets: A dictionary of lists, keyed by transition name, with the
+            number of durations in each bucket of BUCKET_BOUNDS.  Not
+            cumulative.
+        sums: A dictionary of the total nanoseconds taken by each
+            transition, keyed by transition name.
+    """
+
+    def __init__(self):
+        """Initializes instance."""
+        self.counts: dict[Tuple[str, GameState, GameState], int] = {}
+        self.buckets: dict[str, list[int]] = {
+            transition: [0] * _BUCKET_COUNT for transition in TRANSITIONS
+        }
+        self.sums: dict[str, int] = dict.fromkeys(TRANSITIONS, 0)
+
+    def __call__(
+        self,
+        transition: str,
+        duration: int,
+        before: GameState,
+        after: GameState,
+    ):
+        """Record one transition.
+
+        Args:
+            transition: A string, the name of the Game method called.
+            duration: An integer equal to the nanoseconds the method took.
+            before: The GameState before the method was called.
+            after: The GameState after the method returned.
+        """
+        key = (transition, before, after)
+        counts = self.counts
+        counts[key] = counts.get(key, 0) + 1
+        self.sums[transition] += duration
+
+        # a duration of up to 2 ** bits nanoseconds goes in bucket bits - 8
+        index = (duration - 1).bit_length() - _FIRST_BUCKET_BITS
+        if index < 0:
+            index = 0
+        elif index >= _BUCKET_COUNT:
+            index = _BUCKET_COUNT - 1
+        self.buckets[transition][index] += 1
+
+    def merge(self, other: "TransitionMetrics"):
+        """Add the transitions recorded by another TransitionMetrics.
+
+        Args:
+            other: The TransitionMetrics to add to this one.
+        """
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+        for transition, buckets in other.buckets.items():
+            mine = self.buckets[transition]
+            for index, count in enumerate(buckets):
+                mine[index] += count
+            self.sums[transition] += other.sums[transition]
+
+
+def write_prometheus(
+    metrics: TransitionMetrics,
+    path: str,
+    prefix: str = "twenty_one_bust",
+):
+    """Write metrics to a file in the Prometheus text format.
+
+    The file is written next to path then renamed over it, so a collector
+    such as the node exporter's textfile collector never reads half a file.
+
+    Args:
+        metrics: The TransitionMetrics to write.
+        path: A string for the path of the file, usually ending in .prom.
+        prefix: A string at the start of each metric name.
+    """
+    lines = [
+        "# HELP %s_transitions_total Game state transitions." % (prefix),
+        "# TYPE %s_transitions_total counter" % (prefix),
+    ]
+    for (transition, before, after), count in sorted(
+        metrics.counts.items(), key=lambda item: str(item[0])
+    ):
+        lines.append(
+            '%s_transitions_total{transition="%s",from="%s",to="%s"} %d'
+            % (prefix, transition, before, after, count)
+        )
+
+    name = "%s_transition_duration_seconds" % (prefix)
+    lines.append("# HELP %s Time taken by game state transitions." % (name))
+    lines.append("# TYPE %s histogram" % (name))
+    for transition in TRANSITIONS:
+        buckets = metrics.buckets[transition]
+        total = 0
+        for bound, count in zip(BUCKET_BOUNDS, buckets):
+            total += count
+            le = "+Inf" if bound == float("inf") else repr(bound / 1e9)
+            lines.append(
+                '%s_bucket{transition="%s",le="%s"} %d'
+                % (name, transition, le, total)
+            )
+        lines.append(
+            '%s_sum{transition="%s"} %r'
+            % (name, transition, metrics.sums[transition] / 1e9)
+        )
+        lines.append(
+            '%s_count{transition="%s"} %d' % (name, transition, total)
+        )
+
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "w") as file:
+        file.write("\n".join(lines) + "\n")
+    os.replace(temporary_path, path)
@@ -1,9 +1,22 @@
 """Contains method for getting the values of a card in a game of 21 Bust.
 
+The values are looked up in tables built once when the module is imported,
+keyed by Value or indexed by integer card code.
+
 Methods:
 
+    card_rank
     card_value
     alt_card_value
+    card_value_array
+    ace_array
+
+Constants:
+
+    VALUE_CARD_VALUES
+    VALUE_IS_ACE
+    CODE_CARD_VALUES
+    CODE_IS_ACE
 
 Typical usage examples:
 
@@ -12,15 +25,50 @@ Typical usage examples:
     value = card_value(card)
 
     alt_value = alt_card_value(card)
+
+    value = card_value(card_code(Value.ACE, Suit.SPADES))
+
+    hand_values = card_value_array()[hand_codes]
 """
 
+from typing import Any, Union
+
+from model.card_game.card import SUIT_COUNT, Card, code_value
+from model.card_game.value import Value
+
+# game value of each card value, picture cards are worth 10
+VALUE_CARD_VALUES = {value: min(value.value, 10) for value in Value}
+
+# True for the only card value with an alternate game value
+VALUE_IS_ACE = {value: value is Value.ACE for value in Value}
 
-from typing import Union
+# game value of each integer card code
+CODE_CARD_VALUES = tuple(
+    VALUE_CARD_VALUES[code_value(code)]
+    for code in range(len(Value) * SUIT_COUNT)
+)
 
-from model.card_game.card import Card
+# True for each integer card code that is an ace
+CODE_IS_ACE = tuple(
+    VALUE_IS_ACE[code_value(code)] for code in range(len(Value) * SUIT_COUNT)
+)
+
+_arrays: dict[str, Any] = {}
+
+
+def card_rank(card: Union[Card, int]) -> int:
+    """The enumeration value of a Card or integer card code.
+
+    returns:
+        An integer from 1 for an Ace to 13 for a King.
+    """
+    if isinstance(card, int):
+        return card // SUIT_COUNT + 1
+    else:
+        return card.value.value
 
 
-def card_value(card: Card) -> int:
+def card_value(card: Union[Card, int]) -> int:
     """The value of a Card when calculating the total of a player's hand.
 
     Picture cards (values 11, 12 & 13) have a game value of 10.
@@ -29,13 +77,13 @@ def card_value(card: Card) -> int:
     returns:
         An integer equal to the value of the card in 21 Bust.
     """
-    if card.value.value > 10:
-        return 10
+    if isinstance(card, int):
+        return CODE_CARD_VALUES[card]
     else:
-        return card.value.value
+        return VALUE_CARD_VALUES[card.value]
 
 
-def alt_card_value(card: Card) -> Union[int, None]:
+def alt_card_value(card: Union[Card, int]) -> Union[int, None]:
     """The alternate value of a Card when calculating the total of a
     player's hand.
 
@@ -47,7 +95,45 @@ def alt_card_value(card: Card) -> Union[int, None]:
             21 Bust.  Returns None when card is not an Ace and has no
             alternate game value.
     """
-    if card.value.value == 1:
+    if isinstance(card, int):
+        is_ace = CODE_IS_ACE[card]
+    else:
+        is_ace = VALUE_IS_ACE[card.value]
+
+    if is_ace:
         return 11
     else:
         return None
+
+
+def card_value_array() -> Any:
+    """The game value of each integer card code as a NumPy array.
+
+    Index it with an array of card codes to get the values of whole hands or
+    decks at once.  NumPy is imported and the array built on first use.
+
+    returns:
+        A read only numpy.ndarray of 52 game values.
+    """
+    if "values" not in _arrays:
+        import numpy
+
+        values = numpy.array(CODE_CARD_VALUES, dtype=numpy.int16)
+        values.flags.writeable = False
+        _arrays["values"] = values
+    return _arrays["values"]
+
+
+def ace_array() -> Any:
+    """Which integer card codes are aces as a NumPy array.
+
+    returns:
+        A read only numpy.ndarray of 52 booleans, True for each ace.
+    """
+    if "aces" not in _arrays:
+        import numpy
+
+        aces = numpy.array(CODE_IS_ACE, dtype=bool)
+        aces.flags.writeable = False
+        _arrays["aces"] = aces
+    return _arrays["aces"]
@@ -0,0 +1,63 @@
+"""Report the results of each ActionSelector in recorded games of 21 Bust."""
+
+import argparse
+
+from model.twenty_one_bust.round_analytics import (
+    NO_TARGET,
+    ParquetRoundWriter,
+    RoundAggregator,
+    RoundColumns,
+    read_rounds,
+    save_npz,
+)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("database", help="SQLite database from --store")
+    parser.add_argument("--session", type=int, help="only report SESSION")
+    parser.add_argument(
+        "--npz",
+        metavar="PATH",
+        help="save every result to a NumPy file, which holds every result"
+        " in memory until it is saved",
+    )
+    parser.add_argument(
+        "--parquet", metavar="PATH", help="save every result to Parquet"
+    )
+    args = parser.parse_args()
+
+    aggregator = RoundAggregator()
+    chunks = []
+    writer = ParquetRoundWriter(args.parquet) if args.parquet else None
+    try:
+        for columns in read_rounds(args.database, args.session):
+            aggregator.add(columns)
+            if writer is not None:
+                writer.write(columns)
+            if args.npz:
+                chunks.append(columns)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    print("low  high  results  win rate  bust rate  mean stuck total")
+    for summary in aggregator.summaries():
+        if summary.low_target == NO_TARGET:
+            targets = "user     "
+        else:
+            targets = "%3d  %4d" % (summary.low_target, summary.high_target)
+        not_bust = summary.total_counts[:22]
+        mean_total = (not_bust * range(22)).sum() / max(not_bust.sum(), 1)
+        print(
+            "%s  %7d  %8.3f  %9.3f  %16.2f"
+            % (
+                targets,
+                summary.results,
+                summary.win_rate,
+                summary.bust_rate,
+                mean_total,
+            )
+        )
+
+    if args.npz:
+        save_npz(RoundColumns.concatenate(chunks), args.npz)
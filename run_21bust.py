@@ -1,6 +1,34 @@
 """Runner for text version of Twenty One Bust."""
+
+import argparse
+
 from controller.twenty_one_bust import console_controller as controller
+from controller.twenty_one_bust.pacer import Pacer
 
 if __name__ == "__main__":
-    game = controller.ConsoleController()
-    game.run()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--pace",
+        type=float,
+        default=1.0,
+        metavar="SCALE",
+        help="multiply every pause by SCALE, 0.5 to play twice as fast",
+    )
+    parser.add_argument(
+        "--fast", action="store_true", help="do not pause at all"
+    )
+    parser.add_argument(
+        "--store",
+        metavar="PATH",
+        help="record the result of each round in the SQLite database PATH",
+    )
+    args = parser.parse_args()
+
+    pacer = Pacer.fast() if args.fast else Pacer(args.pace)
+    if args.store:
+        from model.twenty_one_bust.session_store import SessionStore
+
+        with SessionStore(args.store, batch_rounds=1) as store:
+            controller.ConsoleController(pacer, store=store).run()
+    else:
+        controller.ConsoleController(pacer).run()
@@ -0,0 +1,67 @@
+"""Runner for a server hosting many tables of Twenty One Bust."""
+
+import argparse
+import asyncio
+
+from controller.twenty_one_bust import table_server
+from controller.twenty_one_bust.pacer import AsyncPacer
+from model.twenty_one_bust.session_store import SessionStore
+from model.twenty_one_bust.transition_metrics import TransitionMetrics
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tables", type=int, default=100)
+    parser.add_argument("--opponents", type=int, default=3)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2121)
+    parser.add_argument(
+        "--pace",
+        type=float,
+        default=0.0,
+        metavar="SCALE",
+        help="pause SCALE seconds before each app player's action",
+    )
+    parser.add_argument(
+        "--metrics",
+        metavar="PATH",
+        help="time game state transitions and write them to PATH for "
+        "Prometheus every 15 seconds",
+    )
+    parser.add_argument(
+        "--store",
+        metavar="PATH",
+        help="record the result of every round in the SQLite database PATH",
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="ROUNDS",
+        help="play ROUNDS at each table of app players and print timings",
+    )
+    args = parser.parse_args()
+    store = SessionStore(args.store, background=True) if args.store else None
+
+    try:
+        if args.benchmark:
+            results = asyncio.run(
+                table_server.benchmark(
+                    args.tables,
+                    args.benchmark,
+                    args.opponents + 1,
+                    store=store,
+                )
+            )
+            for key, value in results.items():
+                print("%s: %s" % (key, value))
+        else:
+            server = table_server.TableServer(
+                args.tables,
+                args.opponents,
+                pacer=AsyncPacer(args.pace),
+                metrics=TransitionMetrics() if args.metrics else None,
+                store=store,
+            )
+            asyncio.run(server.serve(args.host, args.port, args.metrics))
+    finally:
+        if store is not None:
+            store.close()
@@ -0,0 +1,65 @@
+import asyncio
+import time
+
+import pytest
+
+from controller.twenty_one_bust import pacer as pacer_module
+from controller.twenty_one_bust.pacer import AsyncPacer, Pacer
+
+
+# the seconds passed to time.sleep, which returns at once
+@pytest.fixture(scope="function")
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(pacer_module.time, "sleep", sleeps.append)
+    return sleeps
+
+
+class TestPacer:
+    # pauses are multiplied by scale
+    def test_scale(self, sleeps):
+        Pacer().pause(2)
+        Pacer(0.25).pause(2)
+        assert sleeps == [2, 0.5]
+
+    # a fast pacer never sleeps
+    def test_fast(self, sleeps):
+        pacer = Pacer.fast()
+        pacer.pause(3)
+        assert pacer.scale == 0.0
+        assert sleeps == []
+        assert isinstance(AsyncPacer.fast(), AsyncPacer)
+
+    # a negative scale is rejected
+    def test_negative(self):
+        with pytest.raises(ValueError):
+            Pacer(-1.0)
+
+
+class TestAsyncPacer:
+    # pauses of many tasks overlap rather than adding up
+    def test_overlap(self):
+        pacer = AsyncPacer(0.5)
+
+        async def pause_all():
+            start = time.perf_counter()
+            await asyncio.gather(*(pacer.pause_async(0.2) for i in range(20)))
+            return time.perf_counter() - start
+
+        assert 0.09 < asyncio.run(pause_all()) < 1.0
+
+    # a pause with a scale of 0.0 still lets other tasks run
+    def test_fast_yields(self):
+        pacer = AsyncPacer(0.0)
+        steps = []
+
+        async def step(name):
+            for i in range(2):
+                steps.append(name)
+                await pacer.pause_async(1)
+
+        async def play():
+            await asyncio.gather(step("a"), step("b"))
+
+        asyncio.run(play())
+        assert steps == ["a", "b", "a", "b"]
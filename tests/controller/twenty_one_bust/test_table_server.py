@@ -0,0 +1,202 @@
+import asyncio
+import random
+import socket
+
+import pytest
+
+from controller.twenty_one_bust.table_server import (
+    LatencyRecorder,
+    Table,
+    TableServer,
+    benchmark,
+)
+from model.card_game.shoe import Shoe
+from model.card_game.suit import Suit
+from model.card_game.value import Value
+from model.twenty_one_bust.action_selector import ActionSelector
+from model.twenty_one_bust.game import Game
+from model.twenty_one_bust.game_state import GameState
+from model.twenty_one_bust.player import Player
+
+
+# a table of 2 app controlled players dealing from a seeded shoe
+@pytest.fixture(scope="function")
+def table():
+    rng = random.Random(3)
+    game = Game("Test Table", rng, Shoe("Shoe", Value, Suit))
+    game.players.append(Player(0, "Bot1", ActionSelector(14, 18, rng)))
+    game.players.append(Player(1, "Bot2", ActionSelector(16, 20, rng)))
+    return Table(0, game, action_timeout=0.01)
+
+
+# read lines from a connection until one starts with prefix
+async def read_until(reader, prefix):
+    lines = []
+    while True:
+        line = await asyncio.wait_for(reader.readline(), 5)
+        lines.append(line.decode().strip())
+        if lines[-1].startswith(prefix):
+            return lines
+
+
+class TestLatencyRecorder:
+    # percentiles are exact while every sample is kept
+    def test_percentile(self):
+        latency = LatencyRecorder()
+        assert latency.percentile(99) == 0.0
+        for i in range(1, 101):
+            latency.record(i / 1000)
+        assert latency.percentile(50) == 0.05
+        assert latency.percentile(99) == 0.099
+        assert latency.percentile(100) == 0.1
+
+    # memory is bounded however many actions are recorded
+    def test_capacity(self):
+        latency = LatencyRecorder(capacity=100, rng=random.Random(1))
+        for i in range(10000):
+            latency.record(i)
+        assert latency.count == 10000
+        assert len(latency.samples) == 100
+        assert 3000 < latency.percentile(50) < 7000
+
+
+class TestTable:
+    # a user joins, plays a round over TCP, then quits and is removed
+    def test_join_act_leave(self):
+        async def play():
+            server = TableServer(1, 2, action_timeout=5.0, seed=1)
+            table = server.tables[0]
+            listener = await asyncio.start_server(
+                server.handle_connection, "127.0.0.1", 0
+            )
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+            writer.write(b"TWIST\nJOIN 0 Tester\n")
+            lines = await read_until(reader, "SEATED")
+            round_task = asyncio.create_task(table.run(1))
+            lines += await read_until(reader, "HAND")
+            writer.write(b"STICK\n")
+            lines += await read_until(reader, "WINNERS")
+            await round_task
+            writer.write(b"QUIT\n")
+            assert await reader.readline() == b""
+            await asyncio.sleep(0)
+            players_after_quit = list(table.game.players)
+            await table.play_round()
+
+            writer.close()
+            listener.close()
+            await listener.wait_closed()
+            return lines, players_after_quit, table
+
+        lines, players_after_quit, table = asyncio.run(play())
+        assert lines[:2] == ["ERROR unknown command", "SEATED 0 2"]
+        assert "DEAL" in lines
+        assert "TURN Tester" in lines
+        assert "STICK Tester" in lines
+        assert lines[-1].startswith("WINNERS")
+        assert any(line.startswith("RESULT Tester") for line in lines)
+        assert "Tester" in [player.name for player in players_after_quit]
+        assert "Tester" not in [player.name for player in table.game.players]
+        assert not table.senders
+
+    # a user who stops reading is dropped before their messages use up memory
+    def test_slow_client(self):
+        async def flood():
+            server = TableServer(1, 2, max_write_buffer=4096)
+            table = server.tables[0]
+            listener = await asyncio.start_server(
+                server.handle_connection, "127.0.0.1", 0
+            )
+            port = listener.sockets[0].getsockname()[1]
+            client = socket.socket()
+            client.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+            client.connect(("127.0.0.1", port))
+            client.sendall(b"JOIN 0 Slow\n")
+            for i in range(100):
+                await asyncio.sleep(0.01)
+                if table.senders:
+                    break
+            seated = bool(table.senders)
+
+            for i in range(1000):
+                table.broadcast("x" * 10000)
+                await asyncio.sleep(0)
+                if not table.senders:
+                    break
+            dropped = not table.senders and not table._joining
+            client.close()
+            listener.close()
+            await listener.wait_closed()
+            return seated, dropped
+
+        seated, dropped = asyncio.run(flood())
+        assert seated
+        assert dropped
+
+    # a user who does not act in time sticks
+    def test_action_timeout(self, table):
+        messages = []
+        player = table.seat_user("Tester", messages.append)
+
+        async def play():
+            await table.play_round()
+
+        asyncio.run(play())
+        assert "STICK Tester" in messages
+        assert any(message.startswith("HAND") for message in messages)
+        assert table.latency.count >= 1
+        assert table.rounds_played == 1
+        assert player.hand.card_count() == 0
+
+    # actions are only accepted in the player's turn
+    def test_not_your_turn(self, table):
+        messages = []
+        player = table.seat_user("Tester", messages.append)
+        table.request_action(player, True)
+        assert messages[-1] == "ERROR not your turn"
+
+    # users can not join a full table
+    def test_table_full(self, table):
+        assert table.max_players == 312 // Table.CARDS_PER_PLAYER
+        for i in range(table.max_players - 2):
+            table.seat_user("Tester %d" % (i), lambda message: None)
+        with pytest.raises(ValueError):
+            table.seat_user("One Too Many", lambda message: None)
+
+    # a shoe without enough cards for a round is shuffled before the deal
+    def test_shoe_reshuffled(self, table):
+        shoe = table.game.deck
+        shoe.shuffle()
+        shoe.cursor = len(shoe.buffer) - 2
+        asyncio.run(table.play_round())
+        assert shoe.shuffle_count == 2
+        assert table.rounds_played == 1
+
+    # a player twisting from an empty shoe sticks instead
+    def test_empty_shoe(self):
+        shoe = Shoe("Shoe", Value, Suit)
+        game = Game("Test Table", random.Random(3), shoe)
+        table = Table(0, game)
+        messages = []
+        player = table.seat_user("Tester", messages.append)
+        game.players.append(player)
+        game.deal()
+        game.next_player()
+        game.start_turn(player)
+        shoe.cursor = len(shoe.buffer)
+        table.resolve_action(player, True)
+        assert messages[-2:] == ["ERROR no cards left", "STICK Tester"]
+        assert game.state is GameState.GETTING_NEXT_PLAYER
+
+
+class TestBenchmark:
+    # every table plays its rounds and actions are timed
+    def test_benchmark(self):
+        results = asyncio.run(benchmark(5, 3, app_player_count=3, seed=2))
+        assert results["tables"] == 5
+        assert results["rounds"] == 15
+        assert results["actions"] >= 15 * 3
+        assert results["p99_latency"] >= results["p50_latency"] >= 0.0
+        assert results["rounds_per_second"] > 0
@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+from model.card_game.array_deck import ArrayDeck
+from model.card_game.card import Card
+from model.card_game.player import Player
+from model.card_game.suit import Suit
+from model.card_game.value import Value
+
+
+@pytest.fixture(scope="function")
+def array_deck():
+    return ArrayDeck("Test Array Deck", Value, Suit, random.Random(1))
+
+
+@pytest.fixture(scope="function")
+def players():
+    return [Player(0, "p1"), Player(1, "p2"), Player(2, "p3")]
+
+
+class TestArrayDeckClass:
+    # deck starts with every card code
+    def test_init(self, array_deck):
+        assert sorted(array_deck.buffer) == list(range(52))
+        assert array_deck.card_count() == 52
+
+    # draw moves the cursor on
+    def test_draw(self, array_deck):
+        first = array_deck.buffer[0]
+        assert array_deck.draw() == first
+        assert array_deck.cursor == 1
+        assert array_deck.card_count() == 51
+
+    # draw from an empty deck
+    def test_draw_empty(self, array_deck):
+        for i in range(52):
+            array_deck.draw()
+        with pytest.raises(IndexError):
+            array_deck.draw()
+
+    # deal card codes to players
+    def test_deal(self, array_deck, players):
+        array_deck.deal(5, players)
+        assert array_deck.card_count() == 52 - 15
+        for player in players:
+            assert len(player.hand.codes) == 5
+
+    # shuffle only the cards left in the deck
+    def test_shuffle_remaining(self, array_deck):
+        drawn = [array_deck.draw() for i in range(10)]
+        array_deck.shuffle()
+        assert list(array_deck.buffer[:10]) == drawn
+        assert sorted(array_deck.buffer) == list(range(52))
+
+    # returned cards can be drawn again
+    def test_return_cards(self, array_deck, players):
+        array_deck.deal(5, players)
+        returned = list(players[1].hand.codes)
+        array_deck.return_cards(players[1].hand)
+        assert players[1].hand.codes == []
+        assert array_deck.card_count() == 52 - 10
+        cursor = array_deck.cursor
+        remaining = array_deck.buffer[cursor:]
+        assert set(returned) <= set(remaining)
+
+    # all cards back after every hand is returned
+    def test_return_all_cards(self, array_deck, players):
+        array_deck.deal(5, players)
+        players[0].hand.cards.append(
+            Card.from_code(array_deck.draw(), face_up=True)
+        )
+        for player in players:
+            array_deck.return_cards(player.hand)
+        assert array_deck.cursor == 0
+        assert players[0].hand.cards == []
+        assert sorted(array_deck.buffer) == list(range(52))
+
+    # returning more cards than were drawn is rejected
+    def test_return_too_many(self, array_deck, players):
+        array_deck.shuffle()
+        array_deck.deal(2, players)
+        buffer = array_deck.snapshot()
+        hand = players[0].hand
+        hand.codes.extend([0] * (array_deck.cursor - len(hand.codes) + 1))
+        with pytest.raises(ValueError):
+            array_deck.return_cards(hand)
+        assert array_deck.snapshot() == buffer
+        assert len(hand.codes) == array_deck.cursor + 1
+
+    # restoring a snapshot puts back the order and cursor
+    def test_snapshot(self, array_deck, players):
+        array_deck.shuffle()
+        array_deck.deal(2, players)
+        snapshot = array_deck.snapshot()
+        drawn = [array_deck.draw() for i in range(5)]
+        array_deck.restore(snapshot)
+        assert array_deck.cursor == 2 * len(players)
+        assert [array_deck.draw() for i in range(5)] == drawn
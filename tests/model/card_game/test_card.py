@@ -1,6 +1,6 @@
 import pytest
 
-from model.card_game.card import Card
+from model.card_game.card import Card, card_code, code_suit, code_value
 from model.card_game.suit import Suit
 from model.card_game.value import Value
 
@@ -17,3 +17,28 @@ class TestCardClass:
 
     def test_description_faceup_ignore(self, seven_of_spades):
         assert seven_of_spades.description(True) == "Seven of Spades"
+
+    # cards have no instance dictionary
+    def test_slots(self, seven_of_spades):
+        assert not hasattr(seven_of_spades, "__dict__")
+
+
+class TestCardCode:
+    # codes cover 0 to 51 with no repeats
+    def test_card_code_range(self):
+        codes = [card_code(value, suit) for value in Value for suit in Suit]
+        assert sorted(codes) == list(range(52))
+
+    # codes convert back to value and suit
+    def test_code_value_and_suit(self):
+        code = card_code(Value.SEVEN, Suit.SPADES)
+        assert code == 27
+        assert code_value(code) is Value.SEVEN
+        assert code_suit(code) is Suit.SPADES
+
+    # convert between Card and code
+    def test_from_code(self):
+        card = Card.from_code(card_code(Value.KING, Suit.CLUBS))
+        assert card.value is Value.KING
+        assert card.suit is Suit.CLUBS
+        assert card.code == card_code(Value.KING, Suit.CLUBS)
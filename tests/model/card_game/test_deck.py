@@ -21,6 +21,11 @@ def players():
     return players
 
 
+@pytest.fixture(scope="class")
+def compact_deck():
+    return Deck("Test Compact Deck", Value, Suit, compact=True)
+
+
 @pytest.mark.usefixtures("deck", "players")
 class TestDeckClass:
     # deal cards to players
@@ -43,3 +48,49 @@ class TestDeckClass:
 
         # player should have 0 cards
         assert len(players[0].hand.cards) == 0
+
+
+@pytest.mark.usefixtures("compact_deck", "players")
+class TestCompactDeckClass:
+    # compact deck holds codes not cards
+    def test_init(self, compact_deck):
+        assert compact_deck.cards == []
+        assert sorted(compact_deck.codes) == list(range(52))
+
+    # deal card codes to players
+    def test_deal(self, compact_deck, players):
+        compact_deck.deal(5, players)
+
+        assert len(compact_deck.codes) == 32
+        for player in players:
+            assert len(player.hand.codes) == 5
+            assert player.hand.card_count() == 5
+
+    # return card codes from a player to deck
+    def test_return_cards(self, compact_deck, players):
+        compact_deck.return_cards(players[0].hand)
+
+        assert len(compact_deck.codes) == 37
+        assert players[0].hand.codes == []
+
+
+class TestDeckSnapshot:
+    # restoring a snapshot puts back the cards in the same order
+    def test_snapshot(self):
+        deck = Deck("Test Deck", Value, Suit)
+        deck.shuffle()
+        codes = [card.code for card in deck.cards]
+        snapshot = deck.snapshot()
+        deck.deal(5, [Player(0, "p1")])
+        deck.restore(snapshot)
+        assert [card.code for card in deck.cards] == codes
+
+    # a compact deck is restored as card codes
+    def test_compact_snapshot(self):
+        deck = Deck("Test Compact Deck", Value, Suit, compact=True)
+        deck.shuffle()
+        snapshot = deck.snapshot()
+        drawn = [deck.draw() for i in range(5)]
+        deck.restore(snapshot)
+        assert deck.cards == []
+        assert [deck.draw() for i in range(5)] == drawn
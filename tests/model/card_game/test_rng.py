@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from model.card_game.deck import Deck
+from model.card_game.rng import NumpyRandom
+from model.card_game.suit import Suit
+from model.card_game.value import Value
+
+
+def card_order(deck):
+    return [(card.value, card.suit) for card in deck.cards]
+
+
+class TestRandomSource:
+    # decks shuffled with generators seeded the same match
+    def test_seeded_shuffle(self):
+        deck_1 = Deck("Test Deck 1", Value, Suit, random.Random(3))
+        deck_2 = Deck("Test Deck 2", Value, Suit, random.Random(3))
+        deck_1.shuffle()
+        deck_2.shuffle()
+        assert card_order(deck_1) == card_order(deck_2)
+
+
+class TestNumpyRandom:
+    @pytest.fixture(autouse=True)
+    def numpy(self):
+        return pytest.importorskip("numpy")
+
+    # decks shuffled with generators seeded the same match
+    def test_seeded_shuffle(self):
+        deck_1 = Deck("Test Deck 1", Value, Suit, NumpyRandom(3))
+        deck_2 = Deck("Test Deck 2", Value, Suit, NumpyRandom(3))
+        deck_1.shuffle()
+        deck_2.shuffle()
+        assert card_order(deck_1) == card_order(deck_2)
+        assert len(deck_1.cards) == 52
+
+    # random integers include both ends of the range
+    def test_randint(self):
+        rng = NumpyRandom(3, "Philox")
+        results = {rng.randint(1, 3) for i in range(200)}
+        assert results == {1, 2, 3}
+
+    # choose an item from a sequence
+    def test_choice(self):
+        rng = NumpyRandom(3)
+        assert rng.choice(["a", "b", "c"]) in ["a", "b", "c"]
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from model.card_game.player import Player
+from model.card_game.shoe import Shoe
+from model.card_game.suit import Suit
+from model.card_game.value import Value
+
+
+@pytest.fixture(scope="function")
+def shoe():
+    return Shoe("Test Shoe", Value, Suit, 2, 0.5, random.Random(1))
+
+
+@pytest.fixture(scope="function")
+def players():
+    return [Player(0, "p1"), Player(1, "p2"), Player(2, "p3")]
+
+
+class TestShoeClass:
+    # shoe holds every card code of each deck
+    def test_init(self, shoe):
+        assert sorted(shoe.buffer) == sorted(list(range(52)) * 2)
+        assert shoe.card_count() == 104
+        assert shoe.cut == 52
+
+    # invalid deck count or penetration
+    def test_init_invalid(self):
+        with pytest.raises(ValueError):
+            Shoe("Test Shoe", Value, Suit, deck_count=0)
+        with pytest.raises(ValueError):
+            Shoe("Test Shoe", Value, Suit, penetration=1.5)
+
+    # first shuffle always shuffles
+    def test_first_shuffle(self, shoe):
+        assert shoe.needs_shuffle()
+        shoe.shuffle()
+        assert shoe.shuffle_count == 1
+        assert not shoe.needs_shuffle()
+
+    # returned cards are discarded, not dealt again before the cut card
+    def test_return_cards(self, shoe, players):
+        shoe.shuffle()
+        shoe.deal(5, players)
+        for player in players:
+            shoe.return_cards(player.hand)
+            assert player.hand.codes == []
+        assert shoe.cursor == 15
+        assert shoe.card_count() == 104 - 15
+
+    # shuffle does nothing until the cut card is reached
+    def test_lazy_shuffle(self, shoe, players):
+        shoe.shuffle()
+        order = list(shoe.buffer)
+        shoe.deal(10, players)
+        shoe.shuffle()
+        assert shoe.shuffle_count == 1
+        assert list(shoe.buffer) == order
+        assert shoe.cursor == 30
+
+        shoe.deal(10, players)
+        for player in players:
+            shoe.return_cards(player.hand)
+        shoe.shuffle()
+        assert shoe.shuffle_count == 2
+        assert shoe.cursor == 0
+        assert sorted(shoe.buffer) == sorted(list(range(52)) * 2)
+
+    # draw from an empty shoe
+    def test_draw_empty(self, shoe):
+        for i in range(104):
+            shoe.draw()
+        with pytest.raises(IndexError):
+            shoe.draw()
+
+    # restoring a snapshot puts back the cursor and shuffle count
+    def test_snapshot(self, shoe, players):
+        snapshot = shoe.snapshot()
+        shoe.shuffle()
+        shoe.deal(2, players)
+        shoe.restore(snapshot)
+        assert shoe.cursor == 0
+        assert shoe.shuffle_count == 0
+        assert shoe.needs_shuffle()
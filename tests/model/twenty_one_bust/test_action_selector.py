@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from model.twenty_one_bust.action_selector import ActionSelector
@@ -53,3 +55,18 @@ class TestActionSelector:
             game_stats.update(PlayerState.BUST)
 
         assert action_selector.should_stick(11, game_stats) is False
+
+    # high target reached but under the leading total
+    def test_should_stick_under_leading_total(self, action_selector):
+        game_stats = GameStats(4)
+        game_stats.update(PlayerState.STICK, 20)
+
+        assert action_selector.should_stick(19, game_stats) is False
+
+    # random targets come from the rng passed in
+    def test_seeded_targets(self):
+        first = ActionSelector(rng=random.Random(9))
+        second = ActionSelector(rng=random.Random(9))
+        assert first.low_target == second.low_target
+        assert first.high_target == second.high_target
+        assert 12 <= first.low_target < first.high_target <= 20
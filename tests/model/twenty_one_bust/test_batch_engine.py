@@ -0,0 +1,91 @@
+from array import array
+
+import pytest
+
+from model.card_game.array_deck import ArrayDeck
+from model.card_game.rng import NumpyRandom
+from model.card_game.suit import Suit
+from model.card_game.value import Value
+from model.twenty_one_bust.action_selector import ActionSelector
+from model.twenty_one_bust.game import Game
+from model.twenty_one_bust.player import Player
+from model.twenty_one_bust.player_state import PlayerState
+from model.twenty_one_bust.simulator import Simulator
+
+numpy = pytest.importorskip("numpy")
+
+from model.twenty_one_bust.batch_engine import BatchEngine  # noqa: E402
+
+TARGETS = [(12, 16), (14, 18), (16, 20), (13, 19)]
+
+
+# random number generator that leaves decks in the order given
+class FixedOrder:
+    def shuffle(self, x):
+        pass
+
+    def randint(self, a, b):
+        return a
+
+    def choice(self, seq):
+        return seq[0]
+
+
+@pytest.fixture(scope="function")
+def engine():
+    return BatchEngine(TARGETS, NumpyRandom(3))
+
+
+def play_game(deck_order):
+    deck = ArrayDeck("Test Array Deck", Value, Suit)
+    deck.buffer = array("B", deck_order)
+    game = Game("Batch Test Game", FixedOrder(), deck)
+    for player_id, (low_target, high_target) in enumerate(TARGETS):
+        game.players.append(
+            Player(
+                player_id,
+                str(player_id),
+                ActionSelector(low_target, high_target),
+            )
+        )
+    winners = Simulator(game).play_round()
+    return game, winners
+
+
+class TestBatchEngine:
+    # each table gets a full shuffled deck
+    def test_shuffled_decks(self, engine):
+        decks = engine.shuffled_decks(5)
+        assert decks.shape == (5, 52)
+        for deck in decks:
+            assert sorted(deck.tolist()) == list(range(52))
+
+    # every table plays to the same result as Game would
+    def test_play_decks_matches_game(self, engine):
+        decks = engine.shuffled_decks(300)
+        batch = engine.play_decks(decks)
+        for table in range(300):
+            game, winners = play_game(decks[table].tolist())
+            winner_ids = [player.id for player in winners]
+            assert numpy.flatnonzero(batch.winners[table]).tolist() == (
+                sorted(winner_ids)
+            )
+            for player in game.players:
+                assert batch.states[table, player.id] == player.state.value
+                assert batch.cards_drawn[table, player.id] == len(
+                    player.hand.codes
+                )
+                if player.state == PlayerState.STICK:
+                    assert batch.best_totals[table, player.id] == (
+                        player.best_total
+                    )
+
+    # run games in batches and total up the results
+    def test_run(self, engine):
+        result = engine.run(2500, batch_size=1000)
+        assert result.rounds == 2500
+        for player_id in range(len(TARGETS)):
+            stick_count = result.stick_counts[player_id]
+            bust_count = result.bust_counts[player_id]
+            assert stick_count + bust_count == 2500
+        assert result.game_stats.player_count == 2500 * len(TARGETS)
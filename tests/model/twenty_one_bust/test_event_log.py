@@ -0,0 +1,193 @@
+import random
+
+import pytest
+
+from model.card_game.array_deck import ArrayDeck
+from model.card_game.suit import Suit
+from model.card_game.value import Value
+from model.twenty_one_bust.action_selector import ActionSelector
+from model.twenty_one_bust.event_log import (
+    MAGIC,
+    EventLogWriter,
+    read_events,
+    replay,
+)
+from model.twenty_one_bust.game import Game
+from model.twenty_one_bust.game_event import (
+    NO_PLAYER,
+    EventType,
+    GameEvent,
+    ListSink,
+)
+from model.twenty_one_bust.player import Player
+from model.twenty_one_bust.simulator import Simulator
+
+
+# a seeded game of app controlled players
+@pytest.fixture(scope="function")
+def seeded_game():
+    rng = random.Random(11)
+    game = Game("Seeded Test Game", rng, ArrayDeck("Deck", Value, Suit))
+    game.players.append(Player(4, "Test Player 4", ActionSelector(12, 16)))
+    game.players.append(Player(9, "Test Player 9", ActionSelector(14, 18)))
+    game.players.append(Player(2, "Test Player 2", ActionSelector(16, 20)))
+    return game
+
+
+# play rounds of a game, recording the winner ids of each round
+def play(game, rounds):
+    simulator = Simulator(game)
+    results = []
+    for i in range(rounds):
+        winners = simulator.play_round()
+        results.append(
+            (
+                [player.id for player in winners],
+                game.game_stats.best_stuck_total,
+            )
+        )
+        game.reset(winners)
+    return results
+
+
+class TestEventLog:
+    # events written are read back in order
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "events.log")
+        events = [
+            GameEvent(EventType.DEAL, 0, 12, 51),
+            GameEvent(EventType.TWIST, 65534, 3, 25),
+            GameEvent(EventType.BUST, 65534, 25),
+            GameEvent(EventType.RESET, 0xFFFF),
+        ]
+        with EventLogWriter(path, buffer_size=8) as writer:
+            for event in events:
+                writer.write(event)
+        session = GameEvent(EventType.SESSION, NO_PLAYER)
+        assert list(read_events(path, chunk_size=7)) == [session] + events
+
+    # a second writer appends without another header
+    def test_append(self, tmp_path):
+        path = str(tmp_path / "events.log")
+        for i in range(2):
+            with EventLogWriter(path) as writer:
+                writer.write(GameEvent(EventType.STICK, i, 20))
+        with open(path, "rb") as file:
+            assert file.read().count(MAGIC) == 1
+        assert [
+            (event.type, event.player_id) for event in read_events(path)
+        ] == [
+            (EventType.SESSION, NO_PLAYER),
+            (EventType.STICK, 0),
+            (EventType.SESSION, NO_PLAYER),
+            (EventType.STICK, 1),
+        ]
+
+    # files that are not event logs are rejected
+    def test_bad_file(self, tmp_path):
+        path = tmp_path / "events.log"
+        path.write_bytes(b"not a log")
+        with pytest.raises(ValueError):
+            list(read_events(str(path)))
+
+        path.write_bytes(MAGIC + b"\x01\x00")
+        with pytest.raises(ValueError):
+            list(read_events(str(path)))
+
+        path.write_bytes(MAGIC + b"\x09\x00\x00\x00\x00")
+        with pytest.raises(ValueError):
+            list(read_events(str(path)))
+
+    # replaying a logged game gives the same results
+    def test_replay(self, seeded_game, tmp_path):
+        path = str(tmp_path / "events.log")
+        with EventLogWriter(path) as writer:
+            seeded_game.event_sink = writer
+            expected = play(seeded_game, 100)
+
+        results = [
+            (
+                [player.id for player in winners],
+                game.game_stats.best_stuck_total,
+            )
+            for game, winners in replay(read_events(path))
+        ]
+        assert results == expected
+
+    # sessions appended to one log are replayed as separate games
+    def test_replay_sessions(self, seeded_game, tmp_path):
+        path = str(tmp_path / "events.log")
+        with EventLogWriter(path) as writer:
+            seeded_game.event_sink = writer
+            expected = play(seeded_game, 30)
+
+        game = Game("Second Seeded Test Game", random.Random(12))
+        game.players.append(Player(4, "Test Player 4", ActionSelector(13, 17)))
+        game.players.append(Player(7, "Test Player 7", ActionSelector(15, 19)))
+        with EventLogWriter(path) as writer:
+            game.event_sink = writer
+            expected += play(game, 30)
+
+        games = []
+        results = []
+        for game, winners in replay(read_events(path)):
+            if game not in games:
+                games.append(game)
+            results.append(
+                (
+                    [player.id for player in winners],
+                    game.game_stats.best_stuck_total,
+                )
+            )
+        assert results == expected
+        assert len(games) == 2
+        assert sorted(player.id for player in games[1].players) == [4, 7]
+
+    # a writer shared by two games starts a session for each
+    def test_start_session(self, seeded_game, tmp_path):
+        path = str(tmp_path / "events.log")
+        game = Game("Second Seeded Test Game", random.Random(12))
+        game.players.append(Player(1, "Test Player 1", ActionSelector(13, 17)))
+        game.players.append(Player(4, "Test Player 4", ActionSelector(15, 19)))
+        with EventLogWriter(path) as writer:
+            seeded_game.event_sink = writer
+            expected = play(seeded_game, 10)
+            writer.start_session()
+            game.event_sink = writer
+            expected += play(game, 10)
+
+        results = [
+            [player.id for player in winners]
+            for game, winners in replay(read_events(path))
+        ]
+        assert results == [winner_ids for winner_ids, total in expected]
+
+    # replaying the same events twice gives the same results
+    def test_replay_deterministic(self, seeded_game):
+        sink = ListSink()
+        seeded_game.event_sink = sink
+        play(seeded_game, 20)
+        first = [
+            [player.id for player in winners]
+            for game, winners in replay(sink.events)
+        ]
+        second = [
+            [player.id for player in winners]
+            for game, winners in replay(sink.events)
+        ]
+        assert first == second
+        assert len(first) == 20
+
+    # events that do not match the replayed game are rejected
+    def test_replay_mismatch(self, seeded_game):
+        sink = ListSink()
+        seeded_game.event_sink = sink
+        play(seeded_game, 1)
+        events = list(sink.events)
+        resolve_index = [event.type for event in events].index(
+            EventType.RESOLVE
+        )
+        resolve = events[resolve_index]
+        events[resolve_index] = resolve._replace(value=resolve.value + 1)
+        with pytest.raises(ValueError):
+            list(replay(events))
@@ -1,6 +1,10 @@
+import random
+
 import pytest
 
+from model.card_game.array_deck import ArrayDeck
 from model.card_game.card import Card
+from model.card_game.shoe import Shoe
 from model.card_game.suit import Suit
 from model.card_game.value import Value
 from model.twenty_one_bust.game import Game
@@ -100,6 +104,8 @@ def finished_game(
 
     game.active_player_index = 3
     game.game_stats = GameStats(len(game.players))
+    for player in game.players:
+        game.game_stats.update(player.state, player.best_total, player)
     game.state = GameState.GETTING_NEXT_PLAYER
 
     return game
@@ -171,6 +177,8 @@ class TestGameClass:
         # check results
         assert game_state == GameState.GETTING_NEXT_PLAYER
         assert twist_and_stick_player.state == PlayerState.STICK
+        assert in_progress_game.game_stats.best_stuck_total == 5
+        assert in_progress_game.game_stats.leaders == [twist_and_stick_player]
 
     # player twists and goes bust
     def test_resolve_twist_action_bust(
@@ -209,6 +217,9 @@ class TestGameClass:
         game_state, winners = finished_game.resolve()
         assert game_state == GameState.RESETTING_GAME
         assert winners[0] == winner_player
+        for player in finished_game.players:
+            for card in player.hand.cards:
+                assert card.face_up
 
     # get new playing order for players based on winner
     def test_get_player_order(self, finished_game):
@@ -226,3 +237,64 @@ class TestGameClass:
         finished_game.state = GameState.RESETTING_GAME
         assert finished_game.reset(winners) == GameState.DEALING
         assert len(finished_game.deck.cards) == (3 + 3 + 2 + 2)
+
+    # reset moves the winner to the front of the player order
+    def test_reset_winner_first(self, finished_game, winner_player):
+        finished_game.state = GameState.RESETTING_GAME
+        finished_game.reset([winner_player])
+        assert finished_game.players[0] is winner_player
+        assert finished_game.players.index(winner_player) == 0
+
+    # reset game when every player went bust
+    def test_reset_no_winners(self, finished_game):
+        first_player = finished_game.players[0]
+        finished_game.state = GameState.RESETTING_GAME
+        assert finished_game.reset([]) == GameState.DEALING
+        assert finished_game.players[0] is first_player
+
+    # games with generators seeded the same play out the same
+    def test_seeded_rng(self):
+        orders = []
+        for i in range(2):
+            game = Game("Seeded Test Game", random.Random(5))
+            for player_id in range(4):
+                game.players.append(Player(player_id, str(player_id)))
+            game.randomize_first_player()
+            game.deal()
+            orders.append(
+                [
+                    (player.id, player.best_total, len(player.hand.cards))
+                    for player in game.players
+                ]
+            )
+        assert orders[0] == orders[1]
+
+    # play with integer card codes from an array deck
+    def test_array_deck(self):
+        deck = ArrayDeck("Test Array Deck", Value, Suit)
+        game = Game("Array Deck Test Game", random.Random(5), deck)
+        assert deck.rng is game.rng
+        for player_id in range(4):
+            game.players.append(Player(player_id, str(player_id)))
+        game.deal()
+        assert deck.card_count() == 52 - 8
+        game.next_player()
+        player = game.players[0]
+        game.start_turn(player)
+        game_state, card = game.resolve_twist_action(player)
+        assert isinstance(card, int)
+        assert len(player.hand.codes) == 3
+
+    # deal more players than one deck holds from a shoe
+    def test_shoe(self):
+        shoe = Shoe("Test Shoe", Value, Suit, deck_count=4)
+        game = Game("Shoe Test Game", random.Random(5), shoe)
+        for player_id in range(40):
+            game.players.append(Player(player_id, str(player_id)))
+        game.deal()
+        assert shoe.cursor == 80
+        game.state = GameState.RESETTING_GAME
+        game.reset([])
+        game.deal()
+        assert shoe.shuffle_count == 1
+        assert shoe.cursor == 160
@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from model.card_game.array_deck import ArrayDeck
+from model.card_game.suit import Suit
+from model.card_game.value import Value
+from model.twenty_one_bust.action_selector import ActionSelector
+from model.twenty_one_bust.game import Game
+from model.twenty_one_bust.game_event import (
+    NO_PLAYER,
+    EventType,
+    GameEvent,
+    ListSink,
+)
+from model.twenty_one_bust.player import Player
+from model.twenty_one_bust.simulator import Simulator
+
+
+# a seeded game of app controlled players sending events to a list
+@pytest.fixture(scope="function")
+def logged_game():
+    rng = random.Random(7)
+    game = Game("Logged Test Game", rng, ArrayDeck("Deck", Value, Suit))
+    game.players.append(Player(0, "Test Player 0", ActionSelector(12, 16)))
+    game.players.append(Player(1, "Test Player 1", ActionSelector(14, 18)))
+    game.players.append(Player(2, "Test Player 2", ActionSelector(16, 20)))
+    game.event_sink = ListSink()
+    return game
+
+
+class TestGameEvent:
+    # no events are sent without a sink
+    def test_no_sink(self):
+        game = Game("Test Game")
+        game.players.append(Player(0, "Test Player 0", ActionSelector()))
+        Simulator(game).run(5)
+        assert game.event_sink is None
+
+    # a round is dealt, played, resolved then reset
+    def test_round(self, logged_game):
+        simulator = Simulator(logged_game)
+        winners = simulator.play_round()
+        total = winners[0].best_total if winners else 0
+        logged_game.reset(winners)
+        events = logged_game.event_sink.events
+
+        assert [event.type for event in events[:3]] == [EventType.DEAL] * 3
+        assert [event.player_id for event in events[:3]] == [0, 1, 2]
+        assert events[-2] == GameEvent(EventType.RESOLVE, len(winners), total)
+        first_id = logged_game.players[0].id if winners else NO_PLAYER
+        assert events[-1] == GameEvent(EventType.RESET, first_id)
+
+    # every player sticks or goes bust once a round
+    def test_turns(self, logged_game):
+        Simulator(logged_game).run(50)
+        events = logged_game.event_sink.events
+        ends = [
+            event
+            for event in events
+            if event.type in (EventType.STICK, EventType.BUST)
+        ]
+        assert len(ends) == 50 * 3
+        for event in events:
+            if event.type is EventType.TWIST:
+                assert 0 <= event.value < 52
+        assert [event.type for event in events].count(EventType.RESET) == 50
+
+    # dealt codes match the cards in each hand
+    def test_deal(self, logged_game):
+        logged_game.deal()
+        for event, player in zip(
+            logged_game.event_sink.events, logged_game.players
+        ):
+            assert [event.value, event.extra] == player.hand.codes
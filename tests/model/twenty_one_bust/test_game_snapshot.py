@@ -0,0 +1,139 @@
+import random
+
+import pytest
+
+from model.card_game.array_deck import ArrayDeck
+from model.card_game.shoe import Shoe
+from model.card_game.suit import Suit
+from model.card_game.value import Value
+from model.twenty_one_bust.game import Game
+from model.twenty_one_bust.game_state import GameState
+from model.twenty_one_bust.player import Player
+
+
+# a seeded game with an array deck, dealt and ready for the first turn
+@pytest.fixture(scope="function")
+def dealt_game():
+    game = Game(
+        "Snapshot Test Game", random.Random(3), ArrayDeck("Deck", Value, Suit)
+    )
+    for i in range(4):
+        game.players.append(Player(i, "Test Player %d" % (i)))
+    game.deal()
+    return game
+
+
+# a seeded game with a deck of Card instances, dealt
+@pytest.fixture(scope="function")
+def card_game():
+    game = Game("Card Snapshot Test Game", random.Random(3))
+    for i in range(3):
+        game.players.append(Player(i, "Test Player %d" % (i)))
+    game.deal()
+    return game
+
+
+# play the rest of a round, twisting below 17, and describe the result
+def finish_round(game):
+    while True:
+        if game.state is GameState.GETTING_NEXT_PLAYER:
+            game.next_player()
+        if game.state is GameState.RESOLVING_GAME:
+            break
+        player = game.players[game.active_player_index]
+        if game.state is GameState.STARTING_PLAYER_TURN:
+            game.start_turn(player)
+        while player.best_total < 17:
+            if game.resolve_twist_action(player)[0] is not (
+                GameState.STARTING_PLAYER_TURN
+            ):
+                break
+            game.start_turn(player)
+        else:
+            game.resolve_stick_action(player)
+    state, winners = game.resolve()
+    return (
+        [player.id for player in winners],
+        [(player.best_total, player.state) for player in game.players],
+        game.deck.card_count(),
+    )
+
+
+class TestGameSnapshot:
+    # restoring a snapshot replays the same round
+    def test_restore(self, dealt_game):
+        snapshot = dealt_game.snapshot()
+        first = finish_round(dealt_game)
+        dealt_game.restore(snapshot)
+        assert dealt_game.state is GameState.GETTING_NEXT_PLAYER
+        assert finish_round(dealt_game) == first
+
+    # restoring part way through a turn
+    def test_restore_mid_turn(self, dealt_game):
+        dealt_game.next_player()
+        player = dealt_game.players[0]
+        dealt_game.start_turn(player)
+        snapshot = dealt_game.snapshot()
+        totals = player.totals
+        dealt_game.resolve_twist_action(player)
+        dealt_game.restore(snapshot)
+        assert player.totals == totals
+        assert dealt_game.state is GameState.WAITING_FOR_PLAYER
+        assert dealt_game.game_stats.unfinished_count == 4
+        first = finish_round(dealt_game)
+        dealt_game.restore(snapshot)
+        assert finish_round(dealt_game) == first
+
+    # win counts, game stats and player order are restored after a reset
+    def test_restore_after_reset(self, dealt_game):
+        finish_round(dealt_game)
+        snapshot = dealt_game.snapshot()
+        winners = dealt_game.get_winners()
+        order = list(dealt_game.players)
+        leaders = list(dealt_game.game_stats.leaders)
+        dealt_game.reset(winners)
+        dealt_game.restore(snapshot)
+        assert list(dealt_game.players) == order
+        assert dealt_game.state is GameState.RESETTING_GAME
+        assert dealt_game.game_stats.leaders == leaders
+        assert dealt_game.game_stats.unfinished_count == 0
+        for player in winners:
+            assert player.win_count == 1
+        dealt_game.reset(winners)
+        assert dealt_game.deck.card_count() == 52
+
+    # a deck of Card instances is restored as new cards
+    def test_card_deck(self, card_game):
+        snapshot = card_game.snapshot()
+        hands = [list(player.hand.cards) for player in card_game.players]
+        first = finish_round(card_game)
+        card_game.restore(snapshot)
+        for player, cards in zip(card_game.players, hands):
+            assert [card.code for card in player.hand.cards] == [
+                card.code for card in cards
+            ]
+            assert not player.hand.codes
+        assert finish_round(card_game) == first
+
+    # a shoe restored before its first deal is shuffled before dealing
+    def test_shoe_before_deal(self):
+        shoe = Shoe("Shoe", Value, Suit, deck_count=1)
+        game = Game("Shoe Snapshot Test Game", random.Random(1), shoe)
+        for i in range(2):
+            game.players.append(Player(i, "Test Player %d" % (i)))
+        snapshot = game.snapshot()
+        game.deal()
+        game.restore(snapshot)
+        assert shoe.shuffle_count == 0
+        game.deal()
+        assert shoe.shuffle_count == 1
+        hands = [player.hand.codes for player in game.players]
+        assert hands != [[0, 2], [1, 3]]
+
+    # snapshots can not be changed
+    def test_immutable(self, dealt_game):
+        snapshot = dealt_game.snapshot()
+        with pytest.raises(AttributeError):
+            snapshot.state = GameState.DEALING
+        assert isinstance(snapshot.deck[0], bytes)
+        assert isinstance(snapshot.players[0].hand, bytes)
@@ -21,3 +21,30 @@ class TestGameStats:
         game_stats.update(PlayerState.BUST)
         assert game_stats.unfinished_count == 3
         assert game_stats.bust_count == 1
+
+    # best stuck total only rises when a player sticks with a higher total
+    def test_update_best_stuck_total(self, game_stats):
+        game_stats.update(PlayerState.STICK, 18)
+        game_stats.update(PlayerState.STICK, 16)
+        game_stats.update(PlayerState.BUST, 25)
+        assert game_stats.best_stuck_total == 18
+
+    # leaders are the players sticking with the best stuck total
+    def test_update_leaders(self, game_stats):
+        first, second, third = object(), object(), object()
+        game_stats.update(PlayerState.STICK, 17, first)
+        game_stats.update(PlayerState.STICK, 19, second)
+        game_stats.update(PlayerState.STICK, 19, third)
+        assert game_stats.leaders == [second, third]
+
+    # add the counts from another game's stats
+    def test_merge(self, game_stats):
+        other = GameStats(4)
+        other.update(PlayerState.STICK)
+        other.update(PlayerState.BUST)
+        game_stats.update(PlayerState.BUST)
+        game_stats.merge(other)
+        assert game_stats.player_count == 8
+        assert game_stats.unfinished_count == 5
+        assert game_stats.sticking_count == 1
+        assert game_stats.bust_count == 2
@@ -0,0 +1,62 @@
+from fractions import Fraction
+
+import pytest
+
+from model.card_game.card import Card, card_code
+from model.card_game.suit import Suit
+from model.card_game.value import Value
+from model.twenty_one_bust.odds import (
+    BUST,
+    bust_probability,
+    deck_counts,
+    final_total_distribution,
+)
+
+
+@pytest.fixture(scope="function")
+def full_counts():
+    return (4, 4, 4, 4, 4, 4, 4, 4, 4, 16)
+
+
+class TestOdds:
+    # count cards and card codes by game value
+    def test_deck_counts(self):
+        cards = [
+            Card(Value.ACE, Suit.CLUBS),
+            Card(Value.KING, Suit.CLUBS),
+            card_code(Value.TEN, Suit.HEARTS),
+            card_code(Value.FIVE, Suit.HEARTS),
+        ]
+        assert deck_counts(cards) == (1, 0, 0, 0, 1, 0, 0, 0, 0, 2)
+
+    # already at threshold so stick with current total
+    def test_distribution_at_threshold(self, full_counts):
+        distribution = final_total_distribution(18, False, full_counts, 17)
+        assert distribution == {18: 1}
+
+    # soft hand counts an ace as 11 when reaching threshold
+    def test_distribution_soft(self, full_counts):
+        distribution = final_total_distribution(7, True, full_counts, 17)
+        assert distribution == {17: 1}
+
+    # one card left to draw
+    def test_distribution_one_card(self):
+        counts = (0, 0, 0, 0, 1, 0, 0, 0, 0, 1)
+        distribution = final_total_distribution(15, False, counts, 17)
+        assert distribution == {20: Fraction(1, 2), BUST: Fraction(1, 2)}
+
+    # stick when the deck runs out
+    def test_distribution_empty_deck(self):
+        distribution = final_total_distribution(10, False, (0,) * 10, 17)
+        assert distribution == {10: 1}
+
+    # probabilities add up to exactly 1
+    def test_distribution_total(self, full_counts):
+        distribution = final_total_distribution(12, False, full_counts, 17)
+        assert sum(distribution.values()) == 1
+        assert set(distribution) <= {17, 18, 19, 20, 21, BUST}
+
+    # chance of going bust from 16 with a full deck
+    def test_bust_probability(self, full_counts):
+        # bust on 6 or more, 32 of the 52 cards
+        assert bust_probability(16, False, full_counts, 17) == Fraction(8, 13)
@@ -1,6 +1,6 @@
 import pytest
 
-from model.card_game.card import Card
+from model.card_game.card import Card, card_code
 from model.card_game.suit import Suit
 from model.card_game.value import Value
 from model.twenty_one_bust.player import Player
@@ -46,6 +46,42 @@ class TestPlayerClass:
         assert player.totals == {8}
         assert player.best_total == 8
 
+    # add a card code to player's hand
+    def test_add_card_code(self, player):
+        player.add_card(card_code(Value.ACE, Suit.HEARTS))
+        player.add_card(card_code(Value.KING, Suit.HEARTS))
+        assert player.hand.cards == []
+        assert len(player.hand.codes) == 2
+        assert player.totals == {11, 21}
+        assert player.best_total == 21
+
+    # ace counts as 11 while it does not take the hand over 21
+    def test_add_card_soft(self, player, ace_of_clubs, eight_of_clubs):
+        player.add_card(ace_of_clubs)
+        player.add_card(eight_of_clubs)
+        assert player.hard_total == 9
+        assert player.soft is True
+        assert player.best_total == 19
+        player.add_card(eight_of_clubs)
+        assert player.soft is False
+        assert player.best_total == 17
+
+    # totals view matches every total the hand could add up to
+    def test_totals_two_aces(self, player, ace_of_clubs):
+        player.add_card(ace_of_clubs)
+        player.add_card(ace_of_clubs)
+        assert player.totals == {2, 12, 22}
+        assert player.best_total == 12
+
+    # reset clears the hand totals
+    def test_reset(self, player, ace_of_clubs):
+        player.add_card(ace_of_clubs)
+        player.reset()
+        assert player.hard_total == 0
+        assert player.ace_count == 0
+        assert player.totals == {0}
+        assert player.best_total == 0
+
     # add non-ace card value to empty set of totals
     def test_get_totals_empty_add_card(self, player, eight_of_clubs):
         assert player.get_totals({0}, eight_of_clubs) == {8}
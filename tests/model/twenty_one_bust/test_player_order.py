@@ -0,0 +1,70 @@
+import pytest
+
+from model.twenty_one_bust.player import Player
+from model.twenty_one_bust.player_order import PlayerOrder
+
+
+# four players, two sharing an id
+@pytest.fixture(scope="function")
+def players():
+    return [
+        Player(0, "Test Player 0"),
+        Player(1, "Test Player 1"),
+        Player(2, "Test Player 2"),
+        Player(2, "Test Player 3"),
+    ]
+
+
+@pytest.fixture(scope="function")
+def player_order(players):
+    return PlayerOrder(players)
+
+
+class TestPlayerOrder:
+    # players are read in the order added
+    def test_order(self, player_order, players):
+        assert len(player_order) == 4
+        assert list(player_order) == players
+        assert player_order[-1] is players[3]
+
+    # rotating moves a player to the front keeping relative positions
+    def test_rotate(self, player_order, players):
+        player_order.rotate(2)
+        assert list(player_order) == players[2:] + players[:2]
+        assert player_order[0] is players[2]
+        assert player_order[3] is players[1]
+        player_order.rotate(3)
+        assert player_order[0] is players[1]
+
+    # index finds players sharing an id
+    def test_index(self, player_order, players):
+        player_order.rotate(1)
+        assert player_order.index(players[2]) == 1
+        assert player_order.index(players[3]) == 2
+        assert player_order.index(players[0]) == 3
+
+    # index of a player not in the order
+    def test_index_missing(self, player_order):
+        with pytest.raises(ValueError):
+            player_order.index(Player(5, "Test Player 5"))
+
+    # index out of range
+    def test_getitem_out_of_range(self, player_order):
+        with pytest.raises(IndexError):
+            player_order[4]
+        with pytest.raises(IndexError):
+            player_order[-5]
+
+    # adding and removing players after rotating keeps turn order
+    def test_append_remove(self, player_order, players):
+        player_order.rotate(2)
+        new_player = Player(4, "Test Player 4")
+        player_order.append(new_player)
+        player_order.remove(players[3])
+        assert list(player_order) == [
+            players[2],
+            players[0],
+            players[1],
+            new_player,
+        ]
+        assert player_order.index(new_player) == 3
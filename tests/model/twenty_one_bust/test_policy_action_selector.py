@@ -0,0 +1,42 @@
+import pytest
+
+from model.twenty_one_bust.game_stats import GameStats
+from model.twenty_one_bust.player_state import PlayerState
+from model.twenty_one_bust.policy_action_selector import PolicyActionSelector
+
+
+@pytest.fixture(scope="class")
+def action_selector():
+    return PolicyActionSelector()
+
+
+class TestPolicyActionSelector:
+    # all other players bust
+    def test_should_stick_all_bust(self, action_selector):
+        game_stats = GameStats(4)
+        for i in range(3):
+            game_stats.update(PlayerState.BUST)
+
+        assert action_selector.should_stick(4, game_stats) is True
+
+    # total under the best stuck total
+    def test_should_stick_under_stuck_total(self, action_selector):
+        game_stats = GameStats(4)
+        game_stats.update(PlayerState.STICK, 20)
+
+        assert action_selector.should_stick(18, game_stats) is False
+
+    # total of 21
+    def test_should_stick_21(self, action_selector):
+        game_stats = GameStats(4)
+
+        assert action_selector.should_stick(21, game_stats, True) is True
+
+    # more players than the table covers
+    def test_should_stick_large_game(self, action_selector):
+        game_stats = GameStats(12)
+        for i in range(11):
+            game_stats.update(PlayerState.BUST)
+
+        assert action_selector.should_stick(4, game_stats) is True
+        assert action_selector.should_stick(11, GameStats(12)) is False
@@ -0,0 +1,58 @@
+import pytest
+
+from model.twenty_one_bust.policy_table import PolicyTable, load_default
+
+
+@pytest.fixture(scope="module")
+def policy_table():
+    return PolicyTable.generate(max_players=4)
+
+
+class TestPolicyTable:
+    # table has an entry for every state
+    def test_generate_shape(self, policy_table):
+        decisions = policy_table.decisions
+        assert len(decisions) == 22
+        assert len(decisions[0]) == 2
+        assert len(decisions[0][0]) == 5
+        assert len(decisions[0][0][0]) == 4
+        assert len(decisions[0][0][0][0]) == 22
+
+    # always stick on 21
+    def test_stick_on_21(self, policy_table):
+        for soft in range(2):
+            for unfinished in range(1, 5):
+                for stuck_total in range(22):
+                    assert policy_table.decisions[21][soft][unfinished][0][
+                        stuck_total
+                    ]
+
+    # last to play sticks once they beat the best stuck total
+    def test_last_player_beats_stuck_total(self, policy_table):
+        stuck_by_total = policy_table.decisions[19][0][1][0]
+        assert stuck_by_total[18] is True
+        assert stuck_by_total[20] is False
+
+    # twist on a total that cannot go bust
+    def test_twist_low_total(self, policy_table):
+        assert policy_table.decisions[11][0][4][0][0] is False
+
+    # save then load gives the same decisions
+    def test_save_load(self, policy_table, tmp_path):
+        path = str(tmp_path / "policy.bin")
+        policy_table.save(path)
+        loaded = PolicyTable.load(path)
+        assert loaded.max_players == 4
+        assert loaded.decisions == policy_table.decisions
+
+    # loading a file that is not a policy table
+    def test_load_bad_file(self, tmp_path):
+        path = tmp_path / "policy.bin"
+        path.write_bytes(b"not a policy table")
+        with pytest.raises(ValueError):
+            PolicyTable.load(str(path))
+
+    # the default table is loaded once
+    def test_load_default(self):
+        assert load_default() is load_default()
+        assert load_default().max_players == 8
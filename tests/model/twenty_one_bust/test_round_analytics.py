@@ -0,0 +1,199 @@
+import pytest
+
+from model.card_game.rng import NumpyRandom
+from model.twenty_one_bust.action_selector import ActionSelector
+from model.twenty_one_bust.game import Game
+from model.twenty_one_bust.player import Player
+from model.twenty_one_bust.player_state import PlayerState
+from model.twenty_one_bust.session_store import SessionStore
+from model.twenty_one_bust.simulator import Simulator
+
+numpy = pytest.importorskip("numpy")
+
+from model.twenty_one_bust.batch_engine import BatchEngine  # noqa: E402
+from model.twenty_one_bust.round_analytics import (  # noqa: E402
+    NO_TARGET,
+    TOTAL_COUNT,
+    ParquetRoundWriter,
+    RoundAggregator,
+    RoundColumns,
+    load_npz,
+    read_rounds,
+    save_npz,
+    save_parquet,
+)
+
+TARGETS = [(12, 16), (14, 18), (16, 20)]
+
+
+# a batch of games played by a seeded BatchEngine
+@pytest.fixture(scope="function")
+def batch():
+    return BatchEngine(TARGETS, NumpyRandom(5)).play(2000)
+
+
+# a database of rounds played by app controlled players and a user
+@pytest.fixture(scope="function")
+def recorded_game(tmp_path):
+    path = str(tmp_path / "sessions.db")
+    game = Game("Recorded Test Game")
+    for player_id, (low_target, high_target) in enumerate(TARGETS):
+        game.players.append(
+            Player(
+                player_id,
+                "Test Player %d" % (player_id),
+                ActionSelector(low_target, high_target),
+            )
+        )
+    with SessionStore(path, batch_rounds=25) as store:
+        session_id = store.start_session(game.name)
+        simulator = Simulator(game)
+        for i in range(100):
+            winners = simulator.play_round()
+            store.record_round(session_id, game.players, winners)
+            game.reset(winners)
+    return path, game
+
+
+class TestRoundAnalytics:
+    # a batch gives a result for each player at each table
+    def test_from_batch(self, batch):
+        columns = RoundColumns.from_batch(batch, TARGETS)
+        assert len(columns) == 2000 * 3
+        assert list(columns.player_id[:4]) == [0, 1, 2, 0]
+        assert list(columns.round[:4]) == [1, 1, 1, 2]
+        assert list(columns.low_target[:3]) == [12, 14, 16]
+        assert columns.winner.sum() == batch.winners.sum()
+
+    # counts by configuration match the batch
+    def test_aggregate_batch(self, batch):
+        aggregator = RoundAggregator()
+        aggregator.add(RoundColumns.from_batch(batch, TARGETS))
+        summaries = aggregator.summaries()
+        assert [
+            (summary.low_target, summary.high_target) for summary in summaries
+        ] == TARGETS
+
+        wins = batch.winners.sum(axis=0)
+        busts = (batch.states == PlayerState.BUST.value).sum(axis=0)
+        for player, summary in enumerate(summaries):
+            assert summary.results == 2000
+            assert summary.wins == wins[player]
+            assert summary.busts == busts[player]
+            assert summary.win_rate == wins[player] / 2000
+            assert summary.bust_rate == busts[player] / 2000
+            assert len(summary.total_counts) == TOTAL_COUNT
+            assert summary.total_counts.sum() == 2000
+            assert summary.total_counts[22:].sum() == busts[player]
+
+    # adding chunks gives the same counts as adding them all at once
+    def test_aggregate_chunks(self, batch):
+        columns = RoundColumns.from_batch(batch, TARGETS)
+        whole = RoundAggregator()
+        whole.add(columns)
+        chunked = RoundAggregator()
+        for start in range(0, len(columns), 1000):
+            end = start + 1000
+            chunked.add(
+                RoundColumns(
+                    **{
+                        name: column[start:end]
+                        for name, column in columns.columns().items()
+                    }
+                )
+            )
+        assert (chunked.total_counts == whole.total_counts).all()
+        assert (chunked.wins == whole.wins).all()
+
+    # rounds recorded by a SessionStore are read in chunks
+    def test_read_rounds(self, recorded_game):
+        path, game = recorded_game
+        chunks = list(read_rounds(path, chunk_rows=70))
+        assert [len(chunk) for chunk in chunks[:2]] == [70, 70]
+        columns = RoundColumns.concatenate(chunks)
+        assert len(columns) == 100 * 3
+        assert list(columns.round[:4]) == [1, 1, 1, 2]
+
+        aggregator = RoundAggregator()
+        for chunk in read_rounds(path, session_id=1):
+            aggregator.add(chunk)
+        players = sorted(game.players, key=lambda player: player.id)
+        for player, summary in zip(players, aggregator.summaries()):
+            assert (summary.low_target, summary.high_target) == TARGETS[
+                player.id
+            ]
+            assert summary.wins == player.win_count
+
+    # players without an ActionSelector have no targets
+    def test_no_target(self):
+        columns = RoundColumns(
+            session_id=[1],
+            round=[1],
+            player_id=[0],
+            best_total=[20],
+            state=[PlayerState.STICK.value],
+            cards_drawn=[2],
+            winner=[True],
+            low_target=[NO_TARGET],
+            high_target=[NO_TARGET],
+        )
+        aggregator = RoundAggregator()
+        aggregator.add(columns)
+        summary = aggregator.summaries()[0]
+        assert (summary.low_target, summary.high_target) == (-1, -1)
+        assert summary.win_rate == 1.0
+
+    # columns of different lengths are rejected
+    def test_bad_columns(self, batch):
+        columns = RoundColumns.from_batch(batch, TARGETS).columns()
+        columns["winner"] = columns["winner"][:-1]
+        with pytest.raises(ValueError):
+            RoundColumns(**columns)
+        del columns["winner"]
+        with pytest.raises(ValueError):
+            RoundColumns(**columns)
+
+    # columns saved to a .npz file are loaded unchanged
+    def test_npz(self, batch, tmp_path):
+        columns = RoundColumns.from_batch(batch, TARGETS)
+        path = str(tmp_path / "rounds.npz")
+        save_npz(columns, path)
+        loaded = load_npz(path)
+        for name, column in columns.columns().items():
+            assert column.dtype == getattr(loaded, name).dtype
+            assert (column == getattr(loaded, name)).all()
+
+    # columns saved to a Parquet file are read back unchanged
+    def test_parquet(self, batch, tmp_path):
+        parquet = pytest.importorskip("pyarrow.parquet")
+        columns = RoundColumns.from_batch(batch, TARGETS)
+        path = str(tmp_path / "rounds.parquet")
+        save_parquet(columns, path)
+        table = parquet.read_table(path)
+        assert table.num_rows == len(columns)
+        assert table.column("best_total").to_pylist() == list(
+            columns.best_total
+        )
+
+    # chunks written one at a time are read back as one table
+    def test_parquet_chunks(self, recorded_game, tmp_path):
+        parquet = pytest.importorskip("pyarrow.parquet")
+        path, game = recorded_game
+        parquet_path = str(tmp_path / "chunks.parquet")
+        with ParquetRoundWriter(parquet_path) as writer:
+            for chunk in read_rounds(path, chunk_rows=70):
+                writer.write(chunk)
+        table = parquet.read_table(parquet_path)
+        assert table.num_rows == 100 * 3
+        assert table.column("round").to_pylist()[:4] == [1, 1, 1, 2]
+
+    # databases are read from paths with characters special in a URI
+    def test_read_rounds_path(self, tmp_path):
+        path = str(tmp_path / "odd?name#100%.db")
+        with SessionStore(path) as store:
+            session_id = store.start_session("Odd Path")
+            player = Player(0, "Player 1")
+            store.record_round(session_id, [player], [player])
+        columns = RoundColumns.concatenate(read_rounds(path))
+        assert len(columns) == 1
+        assert list(columns.winner) == [True]
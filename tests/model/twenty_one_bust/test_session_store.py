@@ -0,0 +1,132 @@
+import sqlite3
+import threading
+
+import pytest
+
+from model.twenty_one_bust.action_selector import ActionSelector
+from model.twenty_one_bust.game import Game
+from model.twenty_one_bust.player import Player
+from model.twenty_one_bust.session_store import SessionStore
+from model.twenty_one_bust.simulator import Simulator
+
+
+# a game with only app controlled players
+@pytest.fixture(scope="function")
+def app_game():
+    game = Game("Stored Test Game")
+    game.players.append(Player(0, "Test Player 0", ActionSelector(12, 16)))
+    game.players.append(Player(1, "Test Player 1", ActionSelector(14, 18)))
+    game.players.append(Player(2, "Test Player 2", ActionSelector(16, 20)))
+    return game
+
+
+# a store in a temporary database file
+@pytest.fixture(scope="function")
+def store(tmp_path):
+    store = SessionStore(str(tmp_path / "sessions.db"), batch_rounds=10)
+    yield store
+    store.close()
+
+
+# play rounds of a game, recording each in store
+def play(game, store, session_id, rounds):
+    simulator = Simulator(game)
+    for i in range(rounds):
+        winners = simulator.play_round()
+        store.record_round(session_id, game.players, winners)
+        game.reset(winners)
+
+
+class TestSessionStore:
+    # the database uses write ahead logging
+    def test_wal(self, store):
+        mode = store.connection.execute("PRAGMA journal_mode").fetchone()
+        assert mode[0] == "wal"
+
+    # rounds are written in batches
+    def test_batches(self, store, app_game):
+        session_id = store.start_session(app_game.name)
+        reader = sqlite3.connect(store.path)
+        play(app_game, store, session_id, 9)
+        assert reader.execute("SELECT COUNT(*) FROM rounds").fetchone() == (0,)
+        play(app_game, store, session_id, 1)
+        assert reader.execute("SELECT COUNT(*) FROM rounds").fetchone() == (
+            10,
+        )
+        assert reader.execute("SELECT COUNT(*) FROM results").fetchone() == (
+            30,
+        )
+        reader.close()
+
+    # win counts match the players' win counts
+    def test_win_counts(self, store, app_game):
+        session_id = store.start_session(app_game.name)
+        play(app_game, store, session_id, 25)
+        assert store.round_count(session_id) == 25
+        assert store.win_counts(session_id) == {
+            player.name: player.win_count for player in app_game.players
+        }
+
+    # wins are added up over every session, and kept after closing
+    def test_sessions(self, store, app_game):
+        first = store.start_session(app_game.name)
+        play(app_game, store, first, 5)
+        second = store.start_session(app_game.name)
+        play(app_game, store, second, 7)
+        assert second != first
+        store.close()
+
+        with SessionStore(store.path) as reopened:
+            assert reopened.round_count() == 12
+            assert reopened.round_count(second) == 7
+            assert reopened.win_counts() == {
+                player.name: player.win_count for player in app_game.players
+            }
+
+    # players who join part way through a session are recorded
+    def test_new_player(self, store, app_game):
+        session_id = store.start_session(app_game.name)
+        play(app_game, store, session_id, 3)
+        app_game.players.append(
+            Player(3, "Test Player 3", ActionSelector(15, 19))
+        )
+        play(app_game, store, session_id, 3)
+        assert "Test Player 3" in store.win_counts(session_id)
+
+    # a background store writes batches in its writer thread
+    def test_background(self, tmp_path, app_game):
+        store = SessionStore(
+            str(tmp_path / "sessions.db"), batch_rounds=10, background=True
+        )
+        threads = []
+        write = store._write
+
+        def record_thread(batch):
+            threads.append(threading.get_ident())
+            write(batch)
+
+        store._write = record_thread
+        session_id = store.start_session(app_game.name)
+        play(app_game, store, session_id, 25)
+        assert store.round_count(session_id) == 25
+        assert store.win_counts(session_id) == {
+            player.name: player.win_count for player in app_game.players
+        }
+        play(app_game, store, session_id, 5)
+        store.close()
+        assert len(threads) == 4
+        assert threading.get_ident() not in threads
+
+        with SessionStore(store.path) as reopened:
+            assert reopened.round_count() == 30
+
+    # a batch the writer thread fails to write is raised on the next flush
+    def test_background_error(self, tmp_path, app_game):
+        store = SessionStore(
+            str(tmp_path / "sessions.db"), batch_rounds=10, background=True
+        )
+        session_id = store.start_session(app_game.name)
+        play(app_game, store, session_id, 1)
+        store._rounds.append(store._rounds[0])
+        with pytest.raises(sqlite3.IntegrityError):
+            store.close()
@@ -0,0 +1,46 @@
+import pytest
+
+from model.twenty_one_bust.action_selector import ActionSelector
+from model.twenty_one_bust.game import Game
+from model.twenty_one_bust.game_state import GameState
+from model.twenty_one_bust.player import Player
+from model.twenty_one_bust.simulator import Simulator
+
+
+# a game with only app controlled players
+@pytest.fixture(scope="function")
+def app_game():
+    game = Game("Simulated Test Game")
+    game.players.append(Player(0, "Test Player 0", ActionSelector(12, 16)))
+    game.players.append(Player(1, "Test Player 1", ActionSelector(14, 18)))
+    game.players.append(Player(2, "Test Player 2", ActionSelector(16, 20)))
+    return game
+
+
+class TestSimulator:
+    # user controlled players can not be simulated
+    def test_user_controlled_player(self, app_game):
+        app_game.players.append(Player(3, "Test Player 3"))
+        with pytest.raises(TypeError):
+            Simulator(app_game)
+
+    # play a single round
+    def test_play_round(self, app_game):
+        winners = Simulator(app_game).play_round()
+        assert app_game.state == GameState.RESETTING_GAME
+        for player in winners:
+            assert player.win_count == 1
+
+    # play many rounds and count the results
+    def test_run(self, app_game):
+        result = Simulator(app_game).run(200)
+        assert result.rounds == 200
+        assert app_game.state == GameState.DEALING
+        assert len(app_game.deck.cards) == 52
+        for player in app_game.players:
+            assert result.win_counts[player.id] == player.win_count
+            stick_count = result.stick_counts[player.id]
+            bust_count = result.bust_counts[player.id]
+            assert stick_count + bust_count == 200
+        total_wins = sum(result.win_counts.values())
+        assert total_wins + result.no_winner_count >= 200
@@ -0,0 +1,71 @@
+import pytest
+
+from model.twenty_one_bust.target_optimizer import (
+    CandidateResult,
+    TargetOptimizer,
+)
+
+CANDIDATES = [(12, 16), (13, 17), (14, 18), (15, 19), (16, 20), (17, 20)]
+
+
+@pytest.fixture(scope="function")
+def optimizer():
+    return TargetOptimizer([(14, 18), (16, 20)], min_rounds=40, block_size=50)
+
+
+class TestTargetOptimizer:
+    # every pair of targets ActionSelector picks at random is a candidate
+    def test_candidates(self):
+        candidates = TargetOptimizer.candidates()
+        assert len(candidates) == 35
+        assert candidates[0] == (12, 13)
+        assert candidates[-1] == (18, 20)
+        for low_target, high_target in candidates:
+            assert 12 <= low_target < high_target <= 20
+
+    # candidates are cut by eta each rung and survivors play more games
+    def test_run(self, optimizer):
+        rungs = optimizer.run(7, workers=1, candidates=CANDIDATES)
+        assert [len(rung) for rung in rungs] == [6, 2, 1]
+        assert [rung[0].rounds for rung in rungs] == [40, 160, 520]
+        for rung in rungs:
+            win_rates = [candidate.win_rate for candidate in rung]
+            assert win_rates == sorted(win_rates, reverse=True)
+        assert rungs[-1][0].targets in [
+            candidate.targets for candidate in rungs[1]
+        ]
+
+    # earlier rungs keep the results as they were at the end of the rung
+    def test_rungs_are_copies(self, optimizer):
+        rungs = optimizer.run(7, workers=1, candidates=CANDIDATES)
+        assert rungs[0][0] is not rungs[1][0]
+        for candidate in rungs[0]:
+            assert candidate.rounds == 40
+
+    # same seed gives the same results for any number of workers
+    def test_reproducible(self, optimizer):
+        single = optimizer.run(3, workers=1, candidates=CANDIDATES[:3])
+        multiple = optimizer.run(3, workers=2, candidates=CANDIDATES[:3])
+        assert [
+            (candidate.targets, candidate.wins) for candidate in single[0]
+        ] == [(candidate.targets, candidate.wins) for candidate in multiple[0]]
+
+    # invalid settings are rejected
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            TargetOptimizer([(14, 18)], eta=1)
+        with pytest.raises(ValueError):
+            TargetOptimizer([(14, 18)], min_rounds=0)
+        with pytest.raises(ValueError):
+            TargetOptimizer([(14, 18)], block_size=0)
+        with pytest.raises(ValueError):
+            TargetOptimizer([(14, 18)]).run(1, workers=1, candidates=[])
+
+    # win rate of a candidate before and after playing
+    def test_candidate_result(self):
+        candidate = CandidateResult(14, 18)
+        assert candidate.win_rate == 0.0
+        candidate.rounds = 4
+        candidate.wins = 1
+        assert candidate.win_rate == 0.25
+        assert candidate.targets == (14, 18)
@@ -0,0 +1,41 @@
+import pytest
+
+from model.twenty_one_bust.tournament import Tournament
+
+
+@pytest.fixture(scope="function")
+def tournament():
+    return Tournament([(12, 16), (14, 18), (16, 20)], block_size=50)
+
+
+class TestTournament:
+    # split games into equal blocks with a smaller final block
+    def test_blocks(self, tournament):
+        assert tournament.blocks(120) == [50, 50, 20]
+
+    # play all the games and total up the results
+    def test_run(self, tournament):
+        result = tournament.run(120, 7, workers=1)
+        assert result.rounds == 120
+        assert result.game_stats.player_count == 120 * 3
+        for player_id in range(3):
+            stick_count = result.stick_counts[player_id]
+            bust_count = result.bust_counts[player_id]
+            assert stick_count + bust_count == 120
+
+    # same master seed gives the same results for any number of workers
+    def test_run_workers_reproducible(self, tournament):
+        single = tournament.run(120, 7, workers=1)
+        multiple = tournament.run(120, 7, workers=2)
+        assert single.win_counts == multiple.win_counts
+        assert single.bust_counts == multiple.bust_counts
+        assert single.no_winner_count == multiple.no_winner_count
+
+    # blocks can be played with a NumPy generator
+    def test_run_numpy_rng(self):
+        pytest.importorskip("numpy")
+        tournament = Tournament([(12, 16), (16, 20)], 50, numpy_rng=True)
+        first = tournament.run(120, 7, workers=1)
+        second = tournament.run(120, 7, workers=1)
+        assert first.rounds == 120
+        assert first.win_counts == second.win_counts
@@ -0,0 +1,113 @@
+import copy
+import pickle
+
+import pytest
+
+from model.twenty_one_bust.action_selector import ActionSelector
+from model.twenty_one_bust.game import Game
+from model.twenty_one_bust.game_state import GameState
+from model.twenty_one_bust.player import Player
+from model.twenty_one_bust.simulator import Simulator
+from model.twenty_one_bust.transition_metrics import (
+    BUCKET_BOUNDS,
+    TRANSITIONS,
+    TransitionMetrics,
+    write_prometheus,
+)
+
+
+# a game of app controlled players timed by a TransitionMetrics
+@pytest.fixture(scope="function")
+def timed_game():
+    game = Game("Timed Test Game")
+    game.players.append(Player(0, "Test Player 0", ActionSelector(12, 16)))
+    game.players.append(Player(1, "Test Player 1", ActionSelector(14, 18)))
+    game.set_hook(TransitionMetrics())
+    return game
+
+
+class TestTransitionMetrics:
+    # durations go in the bucket with the smallest bound they fit under
+    def test_buckets(self):
+        metrics = TransitionMetrics()
+        for duration in (1, 256, 257, 10**9):
+            metrics("deal", duration, GameState.DEALING, GameState.DEALING)
+        buckets = metrics.buckets["deal"]
+        assert buckets[0] == 2
+        assert buckets[1] == 1
+        assert buckets[-1] == 1
+        assert BUCKET_BOUNDS[1] == 512
+        assert metrics.sums["deal"] == 1 + 256 + 257 + 10**9
+
+    # every transition of a round is counted
+    def test_hook(self, timed_game):
+        Simulator(timed_game).run(10)
+        metrics = timed_game.hook
+        assert (
+            metrics.counts[
+                ("deal", GameState.DEALING, GameState.GETTING_NEXT_PLAYER)
+            ]
+            == 10
+        )
+        assert (
+            metrics.counts[
+                ("reset", GameState.RESETTING_GAME, GameState.DEALING)
+            ]
+            == 10
+        )
+        assert sum(metrics.buckets["next_player"]) == 10 * 3
+        assert sum(metrics.buckets["start_turn"]) >= 10 * 2
+
+    # removing the hook restores the plain methods
+    def test_remove_hook(self, timed_game):
+        timed_game.set_hook(None)
+        for name in TRANSITIONS:
+            assert name not in vars(timed_game)
+        Simulator(timed_game).run(1)
+
+    # a copy of a timed game times its own transitions
+    def test_deepcopy(self, timed_game):
+        Simulator(timed_game).run(2)
+        game_copy = copy.deepcopy(timed_game)
+        Simulator(game_copy).run(3)
+        assert sum(timed_game.hook.buckets["deal"]) == 2
+        assert sum(game_copy.hook.buckets["deal"]) == 5
+        assert game_copy.hook is not timed_game.hook
+
+    # a timed game can be pickled, for a process pool
+    def test_pickle(self, timed_game):
+        Simulator(timed_game).run(2)
+        game_copy = pickle.loads(pickle.dumps(timed_game))
+        Simulator(game_copy).run(1)
+        assert sum(timed_game.hook.buckets["deal"]) == 2
+        assert sum(game_copy.hook.buckets["deal"]) == 3
+
+    # merged metrics hold the transitions of both
+    def test_merge(self, timed_game):
+        Simulator(timed_game).run(5)
+        metrics = TransitionMetrics()
+        metrics.merge(timed_game.hook)
+        metrics.merge(timed_game.hook)
+        assert sum(metrics.buckets["deal"]) == 10
+        assert metrics.sums["deal"] == timed_game.hook.sums["deal"] * 2
+
+    # metrics are written in the Prometheus text format
+    def test_write_prometheus(self, timed_game, tmp_path):
+        Simulator(timed_game).run(3)
+        path = str(tmp_path / "game.prom")
+        write_prometheus(timed_game.hook, path)
+        with open(path) as file:
+            lines = file.read().splitlines()
+        assert (
+            'twenty_one_bust_transitions_total{transition="deal",'
+            'from="DEALING",to="GETTING_NEXT_PLAYER"} 3'
+        ) in lines
+        assert (
+            "twenty_one_bust_transition_duration_seconds_bucket"
+            '{transition="deal",le="+Inf"} 3'
+        ) in lines
+        assert (
+            "twenty_one_bust_transition_duration_seconds_count"
+            '{transition="reset"} 3'
+        ) in lines
+        assert not (tmp_path / "game.prom.tmp").exists()
@@ -0,0 +1,51 @@
+import pytest
+
+from model.card_game.card import Card, card_code
+from model.card_game.suit import Suit
+from model.card_game.value import Value
+from model.twenty_one_bust.value import (
+    CODE_CARD_VALUES,
+    CODE_IS_ACE,
+    alt_card_value,
+    card_value,
+    card_value_array,
+)
+
+
+class TestValue:
+    # picture cards are worth 10
+    def test_card_value_picture(self):
+        assert card_value(Card(Value.QUEEN, Suit.HEARTS)) == 10
+        assert card_value(card_code(Value.QUEEN, Suit.HEARTS)) == 10
+
+    # other cards are worth their face value
+    def test_card_value_number(self):
+        assert card_value(Card(Value.SEVEN, Suit.HEARTS)) == 7
+        assert card_value(card_code(Value.SEVEN, Suit.HEARTS)) == 7
+
+    # only aces have an alternate value
+    def test_alt_card_value(self):
+        assert alt_card_value(Card(Value.ACE, Suit.CLUBS)) == 11
+        assert alt_card_value(card_code(Value.ACE, Suit.CLUBS)) == 11
+        assert alt_card_value(Card(Value.TWO, Suit.CLUBS)) is None
+
+    # code tables match the values of every card
+    def test_code_tables(self):
+        for value in Value:
+            for suit in Suit:
+                code = card_code(value, suit)
+                card = Card(value, suit)
+                assert CODE_CARD_VALUES[code] == card_value(card)
+                assert CODE_IS_ACE[code] == (alt_card_value(card) == 11)
+
+    # values of a whole hand gathered at once
+    def test_card_value_array(self):
+        numpy = pytest.importorskip("numpy")
+        hand = numpy.array(
+            [
+                card_code(Value.ACE, Suit.CLUBS),
+                card_code(Value.KING, Suit.SPADES),
+                card_code(Value.FIVE, Suit.HEARTS),
+            ]
+        )
+        assert card_value_array()[hand].tolist() == [1, 10, 5]
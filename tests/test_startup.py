@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# most microseconds importing run_21bust may take, inflect alone takes over 1s
+STARTUP_BUDGET = 250000
+
+# slow packages which should only be imported when first needed
+LAZY_MODULES = ["inflect", "numpy", "asyncio"]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def import_times():
+    # cumulative import time in microseconds of each module imported
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import run_21bust"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+class TestStartup:
+    # cold start of run_21bust is within budget
+    def test_startup_budget(self, import_times):
+        assert import_times["run_21bust"] < STARTUP_BUDGET
+
+    # slow packages are not imported at startup
+    @pytest.mark.parametrize("module", LAZY_MODULES)
+    def test_lazy_imports(self, import_times, module):
+        assert module not in import_times
@@ -0,0 +1,105 @@
+import io
+
+import pytest
+
+from view.text_view.screen import Screen
+from view.text_view.terminal import ClearMode, Terminal
+
+
+# a screen drawing to a captured ANSI terminal 24 lines high
+@pytest.fixture(scope="function")
+def screen():
+    return Screen(io.StringIO(), ClearMode.ANSI, rows=24)
+
+
+# draw a frame, returning only what was written for it
+def draw(screen, text):
+    stream = screen.stream
+    start = len(stream.getvalue())
+    screen.clear()
+    screen.write(text)
+    screen.flush()
+    return stream.getvalue()[start:]
+
+
+# the output drawing text at the start of row
+def line(row, text):
+    return Screen.MOVE % (row, 1) + text + Screen.ERASE_LINE
+
+
+class TestScreen:
+    # the first frame clears the screen and draws every line
+    def test_first_frame(self, screen):
+        assert draw(screen, "one\ntwo") == (
+            Terminal.CLEAR + line(1, "one") + line(2, "two") + "\x1b[2;4H"
+        )
+        assert screen.shown == ["one", "two"]
+
+    # an unchanged frame writes nothing
+    def test_unchanged(self, screen):
+        draw(screen, "one\ntwo")
+        assert draw(screen, "one\ntwo") == ""
+
+    # only the lines that changed are redrawn
+    def test_changed_lines(self, screen):
+        draw(screen, "one\ntwo\nthree")
+        assert draw(screen, "one\n2\nthree") == line(2, "2") + "\x1b[3;6H"
+
+    # lines below a shorter frame are erased
+    def test_shrink(self, screen):
+        draw(screen, "one\ntwo\nthree")
+        assert draw(screen, "one") == (
+            Screen.MOVE % (2, 1) + Screen.ERASE_BELOW + "\x1b[1;4H"
+        )
+
+    # the header is drawn above every frame
+    def test_header(self):
+        score = [1]
+        screen = Screen(
+            io.StringIO(),
+            ClearMode.ANSI,
+            header=lambda: ["Score: %d" % (score[0])],
+            rows=24,
+        )
+        draw(screen, "text")
+        score[0] = 2
+        assert draw(screen, "text") == line(1, "Score: 2") + "\x1b[2;5H"
+
+    # only the last lines of a frame taller than the terminal are drawn
+    def test_clip(self):
+        screen = Screen(io.StringIO(), ClearMode.ANSI, rows=4)
+        output = draw(screen, "\n".join(str(i) for i in range(10)))
+        assert screen.shown == ["7", "8", "9"]
+        assert output == (
+            Terminal.CLEAR
+            + line(1, "7")
+            + line(2, "8")
+            + line(3, "9")
+            + "\x1b[3;2H"
+        )
+
+    # a change of terminal height redraws the whole frame
+    def test_resize(self, screen):
+        draw(screen, "one\ntwo")
+        screen.rows = 30
+        assert draw(screen, "one\ntwo").startswith(
+            Terminal.CLEAR + line(1, "one")
+        )
+
+    # the answer to a prompt stays on screen without being redrawn
+    def test_input(self, screen, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda: "Jo")
+        draw(screen, "Welcome.\n")
+        assert screen.input("Name: ") == "Jo"
+        assert screen.shown == ["Welcome.", "Name: Jo"]
+        assert screen.lines == ["Welcome.", "Name: Jo", ""]
+
+    # without ANSI support text is written like a Terminal
+    def test_not_ansi(self):
+        stream = io.StringIO()
+        screen = Screen(stream, ClearMode.NONE, rows=24)
+        screen.print("one")
+        screen.clear()
+        screen.print("two")
+        screen.flush()
+        assert stream.getvalue() == "one\ntwo\n"
@@ -0,0 +1,110 @@
+import io
+import sys
+
+import pytest
+
+from view.text_view import terminal as terminal_module
+from view.text_view.terminal import ClearMode, Terminal, default_terminal
+
+
+# a text stream counting the calls to write
+class CountingStream(io.StringIO):
+    def __init__(self, tty=False):
+        io.StringIO.__init__(self)
+        self.tty = tty
+        self.write_count = 0
+
+    def write(self, text):
+        self.write_count += 1
+        return io.StringIO.write(self, text)
+
+    def isatty(self):
+        return self.tty
+
+
+# a terminal writing to a captured stream, clearing with cls
+@pytest.fixture(scope="function")
+def windows_terminal(monkeypatch):
+    commands = []
+    monkeypatch.setattr(terminal_module.os, "system", commands.append)
+    return Terminal(CountingStream(), ClearMode.WINDOWS), commands
+
+
+class TestTerminal:
+    # buffered text is written in a single call when flushed
+    def test_flush(self):
+        stream = CountingStream()
+        terminal = Terminal(stream, ClearMode.NONE)
+        terminal.print("Hand:", 21)
+        terminal.print("Stick", end="")
+        terminal.write("")
+        assert stream.getvalue() == ""
+        terminal.flush()
+        assert stream.getvalue() == "Hand: 21\nStick"
+        assert stream.write_count == 1
+
+    # clearing with ANSI drops buffered text and writes the escape sequence
+    def test_clear_ansi(self):
+        stream = CountingStream()
+        terminal = Terminal(stream, ClearMode.ANSI)
+        terminal.print("dropped")
+        terminal.clear()
+        terminal.print("shown")
+        terminal.flush()
+        assert stream.getvalue() == Terminal.CLEAR + "shown\n"
+
+    # clearing twice without writing only clears once
+    def test_clear_clean(self):
+        stream = CountingStream()
+        terminal = Terminal(stream, ClearMode.ANSI)
+        terminal.clear()
+        terminal.clear()
+        terminal.flush()
+        assert stream.getvalue() == Terminal.CLEAR
+        assert terminal.clean
+
+    # clearing on Windows flushes the buffer then runs cls
+    def test_clear_windows(self, windows_terminal):
+        terminal, commands = windows_terminal
+        terminal.print("before")
+        terminal.clear()
+        terminal.clear()
+        assert terminal.stream.getvalue() == "before\n"
+        assert commands == ["cls"]
+
+    # clearing output that is not a terminal does nothing
+    def test_clear_none(self):
+        stream = CountingStream()
+        terminal = Terminal(stream, ClearMode.NONE)
+        terminal.print("kept")
+        terminal.clear()
+        terminal.flush()
+        assert stream.getvalue() == "kept\n"
+
+    # the clear mode is picked from the stream and operating system
+    def test_detect_clear_mode(self, monkeypatch):
+        assert Terminal(CountingStream()).clear_mode is ClearMode.NONE
+        monkeypatch.setattr(terminal_module.os, "name", "posix")
+        assert Terminal(CountingStream(True)).clear_mode is ClearMode.ANSI
+        monkeypatch.setattr(terminal_module.os, "name", "nt")
+        assert Terminal(CountingStream(True)).clear_mode is ClearMode.WINDOWS
+
+    # the prompt is flushed before reading input
+    def test_input(self, monkeypatch):
+        stream = CountingStream()
+        terminal = Terminal(stream, ClearMode.NONE)
+        monkeypatch.setattr("builtins.input", lambda: stream.getvalue())
+        assert terminal.input("Name: ") == "Name: "
+
+    # every caller shares one terminal on sys.stdout
+    def test_default_terminal(self, monkeypatch):
+        stream = CountingStream()
+        monkeypatch.setattr(sys, "stdout", stream)
+        default_terminal.cache_clear()
+        try:
+            terminal = default_terminal()
+            assert default_terminal() is terminal
+            assert terminal.stream is stream
+            assert terminal.clear_mode is ClearMode.NONE
+        finally:
+            default_terminal.cache_clear()
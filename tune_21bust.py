@@ -0,0 +1,74 @@
+"""Search for the ActionSelector targets with the best win rate."""
+
+import argparse
+from typing import Tuple
+
+from model.twenty_one_bust.target_optimizer import TargetOptimizer
+
+
+def parse_targets(text: str) -> Tuple[int, int]:
+    """Parse a "low,high" pair of targets.
+
+    Args:
+        text: A string such as "14,18".
+
+    Returns:
+        A (low_target, high_target) tuple.
+    """
+    low_target, high_target = text.split(",")
+    return int(low_target), int(high_target)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--opponents",
+        nargs="+",
+        type=parse_targets,
+        default=[(14, 18), (16, 20), (12, 16)],
+        metavar="LOW,HIGH",
+        help="targets of each opponent",
+    )
+    parser.add_argument(
+        "--min-rounds",
+        type=int,
+        default=1000,
+        help="games each candidate plays in the first rung",
+    )
+    parser.add_argument(
+        "--eta", type=int, default=3, help="factor candidates are cut by"
+    )
+    parser.add_argument(
+        "--block-size", type=int, default=10000, help="games in each block"
+    )
+    parser.add_argument(
+        "--workers", type=int, help="processes to use, default one per core"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="master seed")
+    parser.add_argument(
+        "--top", type=int, default=5, help="candidates to show per rung"
+    )
+    args = parser.parse_args()
+
+    optimizer = TargetOptimizer(
+        args.opponents, args.min_rounds, args.eta, args.block_size
+    )
+    rungs = optimizer.run(args.seed, args.workers)
+    for number, rung in enumerate(rungs, 1):
+        print(
+            "rung %d: %d candidates, %d games each"
+            % (number, len(rung), rung[0].rounds)
+        )
+        print("low  high  win rate  bust rate")
+        for candidate in rung[: args.top]:
+            print(
+                "%3d  %4d  %8.3f  %9.3f"
+                % (
+                    candidate.low_target,
+                    candidate.high_target,
+                    candidate.win_rate,
+                    candidate.bust_count / candidate.rounds,
+                )
+            )
+    best = rungs[-1][0]
+    print("best: low_target %d, high_target %d" % best.targets)
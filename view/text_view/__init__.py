@@ -1,5 +1,7 @@
 """Display to and input from user via console.
 
 Modules:
+    screen
+    terminal
     text_view
 """
@@ -0,0 +1,203 @@
+"""Contains class for a virtual screen only redrawing the lines that change.
+
+Classes:
+
+    Screen
+
+Typical usage examples:
+
+    screen = Screen(header=lambda: ["Score: %d" % (score)])
+
+    screen.clear()
+
+    screen.print("Welcome.")
+
+    screen.flush()
+"""
+
+import os
+import shutil
+from typing import Callable, TextIO, Union
+
+from view.text_view.terminal import ClearMode, Terminal
+
+
+class Screen(Terminal):
+    """A Terminal drawing whole frames on a virtual screen.
+
+    Text written and cleared is held in memory as the lines of the next
+    frame.  When flushed, the frame is compared with the lines already on
+    the screen and only the lines that differ are redrawn, using ANSI escape
+    sequences to move the cursor, all in a single write.  Clearing the
+    screen only starts a new frame, so lines that appear in both frames are
+    never redrawn and the screen does not flicker.
+
+    Lines are placed at absolute rows, so only the last lines of a frame
+    taller than the terminal are drawn, one row short of its height so the
+    newline echoed after input never scrolls the screen.  If the height of
+    the terminal changes, the whole frame is redrawn.
+
+    When stream is not an ANSI terminal, a Screen writes and clears like a
+    Terminal.
+
+    Attributes:
+        header: A function returning lines to draw above every frame, such
+            as a summary of the game state, or None.
+        rows: An integer equal to the height of the terminal in lines, or
+            None to ask the terminal each flush.
+        lines: A list of strings, the lines of the frame being built.  The
+            last line is where the next text is written.
+        shown: A list of strings, the lines of the frame on the screen.
+    """
+
+    # move the cursor to a row and column, both counted from 1
+    MOVE = "\x1b[%d;%dH"
+
+    # erase from the cursor to the end of the line or the screen
+    ERASE_LINE = "\x1b[K"
+    ERASE_BELOW = "\x1b[J"
+
+    def __init__(
+        self,
+        stream: Union[TextIO, None] = None,
+        clear_mode: Union[ClearMode, None] = None,
+        header: Union[Callable[[], list[str]], None] = None,
+        rows: Union[int, None] = None,
+    ):
+        """Initializes instance.
+
+        Args:
+            stream: A text stream to write to.  Default of None uses
+                sys.stdout.
+            clear_mode: A ClearMode to override how the screen is cleared.
+                Default of None picks one for stream.
+            header: A function returning lines to draw above every frame.
+                Default of None draws no header.
+            rows: An integer equal to the height of the terminal in lines.
+                Default of None asks the terminal each flush.
+        """
+        Terminal.__init__(self, stream, clear_mode)
+        self.header = header
+        self.rows = rows
+        self.lines: list[str] = [""]
+        self.shown: list[str] = []
+        self._screen_cleared = False
+        self._shown_rows = 0
+
+    def write(self, text: str):
+        """Add text to the frame being built.
+
+        Args:
+            text: A string to write, which may hold newlines.
+        """
+        if self.clear_mode is not ClearMode.ANSI:
+            Terminal.write(self, text)
+        elif text:
+            first, *rest = text.split("\n")
+            self.lines[-1] += first
+            self.lines.extend(rest)
+            self.clean = False
+
+    def clear(self):
+        """Start a new, empty frame.
+
+        Nothing is written until the next flush.
+        """
+        if self.clear_mode is not ClearMode.ANSI:
+            Terminal.clear(self)
+        elif not self.clean:
+            self.lines = [""]
+            self.clean = True
+
+    def frame(self) -> list[str]:
+        """Get every line of the frame, header first.
+
+        Returns:
+            A list of strings, one for each line of the screen.
+        """
+        if self.header is None:
+            return list(self.lines)
+        return self.header() + self.lines
+
+    def terminal_rows(self) -> int:
+        """Get the height of the terminal.
+
+        Returns:
+            An integer equal to rows if set, otherwise the number of lines
+                the terminal of stream shows, or of the console if stream
+                has none.
+        """
+        if self.rows is not None:
+            return self.rows
+        try:
+            return os.get_terminal_size(self.stream.fileno()).lines
+        except (AttributeError, OSError, ValueError):
+            return shutil.get_terminal_size().lines
+
+    def render(self, frame: list[str]) -> str:
+        """Get the text that changes the screen from shown to frame.
+
+        Args:
+            frame: A list of strings, the lines to show.
+
+        Returns:
+            A string of changed lines and ANSI escape sequences, ending with
+                the cursor after the last character of the frame.
+        """
+        shown = self.shown
+        output = []
+        if not self._screen_cleared:
+            output.append(self.CLEAR)
+            self._screen_cleared = True
+
+        for row, line in enumerate(frame):
+            if row >= len(shown) or shown[row] != line:
+                output.append(self.MOVE % (row + 1, 1))
+                output.append(line)
+                output.append(self.ERASE_LINE)
+        if len(frame) < len(shown):
+            output.append(self.MOVE % (len(frame) + 1, 1))
+            output.append(self.ERASE_BELOW)
+
+        output.append(self.MOVE % (len(frame), len(frame[-1]) + 1))
+        return "".join(output)
+
+    def flush(self):
+        """Draw the lines of the frame that have changed in a single write."""
+        if self.clear_mode is not ClearMode.ANSI:
+            Terminal.flush(self)
+            return
+
+        rows = self.terminal_rows()
+        if rows != self._shown_rows:
+            self._screen_cleared = False
+            self.shown = []
+            self._shown_rows = rows
+
+        frame = self.frame()
+        start = len(frame) - max(rows - 1, 1)
+        if start > 0:
+            frame = frame[start:]
+        if frame != self.shown:
+            self.stream.write(self.render(frame))
+            self.shown = frame
+        self.stream.flush()
+
+    def input(self, prompt: str = "") -> str:
+        """Draw the frame with prompt then read a line from the user.
+
+        The terminal echoes what the user types and moves to the next line,
+        so both are added to the frame and to the lines shown.
+
+        Args:
+            prompt: A string written before reading.
+
+        Returns:
+            The line read, without the trailing newline.
+        """
+        answer = Terminal.input(self, prompt)
+        if self.clear_mode is ClearMode.ANSI:
+            self.lines[-1] += answer
+            self.lines.append("")
+            self.shown[-1] += answer
+        return answer
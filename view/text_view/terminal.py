@@ -0,0 +1,167 @@
+"""Contains classes for writing to and clearing the console in process.
+
+Text is held in a buffer and written with one call when flushed, before
+waiting for input or pausing.  The screen is cleared by writing ANSI escape
+sequences rather than running a clear command in a shell.
+
+Classes:
+
+    ClearMode
+
+    Terminal
+
+Functions:
+
+    default_terminal() -> Terminal
+
+Typical usage examples:
+
+    terminal = Terminal()
+
+    terminal.clear()
+
+    terminal.print("Welcome.")
+
+    terminal.flush()
+
+    name = terminal.input("Enter your name: ")
+"""
+
+import os
+import sys
+from enum import Enum
+from functools import lru_cache
+from typing import TextIO, Union
+
+
+class ClearMode(Enum):
+    """How a Terminal clears the screen.
+
+    ANSI writes escape sequences, WINDOWS runs the cls command for consoles
+    that do not understand them and NONE does not clear, for output that is
+    not going to a terminal such as a pipe or log file.
+    """
+
+    ANSI = 1
+    WINDOWS = 2
+    NONE = 3
+
+
+class Terminal:
+    """Buffered output to the console.
+
+    Attributes:
+        stream: The text stream written to.
+        clear_mode: A ClearMode for how the screen is cleared.
+        clean: A boolean set to True when nothing has been written since the
+            screen was last cleared, so clearing it again can be skipped.
+    """
+
+    # move the cursor to the top left then erase the screen and scrollback
+    CLEAR = "\x1b[H\x1b[2J\x1b[3J"
+
+    def __init__(
+        self,
+        stream: Union[TextIO, None] = None,
+        clear_mode: Union[ClearMode, None] = None,
+    ):
+        """Initializes instance.
+
+        Args:
+            stream: A text stream to write to.  Default of None uses
+                sys.stdout.
+            clear_mode: A ClearMode to override how the screen is cleared.
+                Default of None picks NONE when stream is not a terminal,
+                WINDOWS on Windows and ANSI otherwise.
+        """
+        self.stream = stream if stream is not None else sys.stdout
+        if clear_mode is None:
+            clear_mode = self.detect_clear_mode(self.stream)
+        self.clear_mode = clear_mode
+        self.clean = False
+        self._buffer: list[str] = []
+
+    @staticmethod
+    def detect_clear_mode(stream: TextIO) -> ClearMode:
+        """Find how a stream's screen can be cleared.
+
+        Args:
+            stream: The text stream to check.
+
+        Returns:
+            A ClearMode for the stream.
+        """
+        isatty = getattr(stream, "isatty", None)
+        if isatty is None or not isatty():
+            return ClearMode.NONE
+        if os.name == "nt":
+            return ClearMode.WINDOWS
+        return ClearMode.ANSI
+
+    def write(self, text: str):
+        """Add text to the buffer.
+
+        Args:
+            text: A string to write.
+        """
+        if text:
+            self._buffer.append(text)
+            self.clean = False
+
+    def print(self, *values: object, sep: str = " ", end: str = "\n"):
+        """Add values to the buffer like the built in print.
+
+        Args:
+            values: The objects to write, converted with str.
+            sep: A string written between values.
+            end: A string written after the last value.
+        """
+        self.write(sep.join(str(value) for value in values) + end)
+
+    def flush(self):
+        """Write everything in the buffer to stream in a single call."""
+        if self._buffer:
+            self.stream.write("".join(self._buffer))
+            self._buffer.clear()
+        self.stream.flush()
+
+    def clear(self):
+        """Clear the screen.
+
+        Does nothing if nothing has been written since the last clear.  Text
+        still in the buffer is dropped when clearing with ANSI, as it would
+        be erased as soon as it was shown.
+        """
+        if self.clean:
+            return
+
+        if self.clear_mode is ClearMode.ANSI:
+            self._buffer.clear()
+            self._buffer.append(self.CLEAR)
+        elif self.clear_mode is ClearMode.WINDOWS:
+            self.flush()
+            os.system("cls")
+        self.clean = True
+
+    def input(self, prompt: str = "") -> str:
+        """Flush the buffer then read a line from the user.
+
+        Args:
+            prompt: A string written before reading.
+
+        Returns:
+            The line read, without the trailing newline.
+        """
+        self.write(prompt)
+        self.flush()
+        return input()
+
+
+@lru_cache(maxsize=None)
+def default_terminal() -> Terminal:
+    """Get the Terminal for sys.stdout, shared by every caller.
+
+    Returns:
+        A Terminal created on first use.
+    """
+    return Terminal()
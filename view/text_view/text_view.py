@@ -1,10 +1,11 @@
 """Functions to enable the use of the console as a text based view in MVC.
 
-Use these to supplement print, read and sleep.
+Use these to supplement print, read and sleep.  The screen is cleared with
+a Terminal rather than a clear command run in a shell.
 
 Functions:
 
-    get_option(prompt, options) -> string
+    get_option(prompt, options, terminal) -> string
 
     clear_screen()
 
@@ -15,10 +16,14 @@ Typical usage examples:
     clear_screen()
 """
 
-import os
+from typing import Union
 
+from view.text_view.terminal import Terminal, default_terminal
 
-def get_option(prompt: str, options: list[str]) -> str:
+
+def get_option(
+    prompt: str, options: list[str], terminal: Union[Terminal, None] = None
+) -> str:
     """Get user to select an option.
 
     Prompts user to enter an option into console until a valid one is entered.
@@ -26,22 +31,26 @@ def get_option(prompt: str, options: list[str]) -> str:
     Args:
         prompt: A string describing to user what their options are.
         options: A list of string containing the valid options.
+        terminal: A Terminal to flush before reading.  Default of None
+            uses default_terminal().
 
     Returns:
         A string containing the option chosen.
     """
+    if terminal is None:
+        terminal = default_terminal()
+
     result = ""
     valid_input = False
     while not valid_input:
-        result = input(prompt)
+        result = terminal.input(prompt)
         if result in options:
             valid_input = True
     return result
 
 
 def clear_screen():
-    """Clear screen depending on operating system."""
-    if os.name == "nt":
-        os.system("cls")
-    else:
-        os.system("clear")
+    """Clear screen of default_terminal() at once."""
+    terminal = default_terminal()
+    terminal.clear()
+    terminal.flush()